@@ -1,16 +1,63 @@
-import pandas as pd
-import pygame
+import time
+
+IMPORT_START = time.perf_counter()  # 시작 시간 보고의 기준 시각
+
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 from typing import Dict
 from pathlib import Path
+import argparse
+import atexit
+import contextlib
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
 import os
+import queue
+import re
+import shutil
 import logging
+import logging.handlers
+import mmap
+import struct
 import subprocess
 import tempfile
-import time
-from PIL import Image, ImageTk
+import threading
+import unicodedata
+import wave
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import importlib.util
+
+
+class LazyModule:
+    # 처음 속성에 접근할 때 모듈을 불러오는 대리 객체 (시작 화면이 뜨기 전에 pygame/PIL/numpy를 읽지 않도록)
+    # 실제 import는 파이썬 import 잠금을 거치므로 여러 스레드가 동시에 접근해도 한 번만 불러옴
+
+    def __init__(self, name: str):
+        self.__dict__['_module_name'] = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._module_name)
+        self.__dict__.update(vars(module))  # 이후 접근은 대리 객체에서 바로 찾음
+        return getattr(module, attr)
+
+
+def lazy_import(name: str):
+    # 설치되지 않은 모듈은 None
+    return LazyModule(name) if importlib.util.find_spec(name) is not None else None
+
+
+pygame = lazy_import("pygame")
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFont = lazy_import("PIL.ImageFont")
+ImageTk = lazy_import("PIL.ImageTk")
+np = lazy_import("numpy")  # numpy가 없으면 ffmpeg 배속 변환만 사용
 
 
 # 화면 설정
@@ -41,6 +88,12 @@ FONT_END_BUTTON = ("NanumBarunGothic", 20, "bold")
 FONT_START_LABEL = ("NanumBarunGothic", 35, "bold")
 FONT_END_LABEL = ("NanumBarunGothic", 35, "bold")
 
+# 자막 줄바꿈 폭 (표시 폭 기준, 한글/한자는 2칸)
+SUBTITLE_WRAP_WIDTHS = {
+    '한국어': 40,  # 한글 약 23자
+    '영어': 110,
+}
+
 # 레이아웃 설정
 LAYOUT_SETTINGS = {
     'INITIAL_SCREEN': {
@@ -59,30 +112,909 @@ GENERAL_SETTINGS = {
     'FINAL_MESSAGE_DISPLAY_TIME': 13000,
     'COUNTDOWN_INTERVAL': 1000,
     'COUNTDOWN_START': 3,
+    'AUDIO_POLL_INTERVAL': 10,  # 음성 재생 종료 확인 주기
+    'SUBTITLE_AUDIO_GAP': 200,  # 자막과 음성 사이의 약간의 지연
+    'SETTINGS_SAVE_DELAY': 500,  # 마지막 설정 변경 후 이 시간(ms) 동안 변경이 없으면 파일에 기록
 }
 
 # 파일 경로 설정
-AUDIO_KO = "sound_ko/ko{}.wav"
-AUDIO_EN = "sound_en/en{}.wav"
-AUDIO_CH = "sound_ch/ch{}.wav"
+# 문장 음성 경로 템플릿 ({}는 문장 번호, {ext}는 AUDIO_EXTENSIONS 중 실제로 있는 확장자)
+AUDIO_KO = "sound_ko/ko{}.{ext}"
+AUDIO_EN = "sound_en/en{}.{ext}"
+AUDIO_CH = "sound_ch/ch{}.{ext}"
+AUDIO_EXTENSIONS = ["wav", "opus", "ogg", "mp3"]  # 찾는 순서
+STREAMED_AUDIO_EXTENSIONS = {".opus", ".ogg", ".oga", ".mp3"}  # 통째로 디코딩하지 않고 스트리밍 재생하는 압축 형식
 SOUND_DRUM = Path("../drum.mp3")
+SOUND_FINAL = Path("../final.MP3")
 COUNTDOWN_AUDIO = Path("../countdown_audio.wav")
+COUNTDOWN_MESSAGE = "이 영상은 몸에 좋은 WAV 파일로 녹화했습니다."
+DURATION_INDEX_NAME = ".duration_index.json"  # 음성 폴더마다 저장되는 길이 인덱스
+SPEECH_INDEX_NAME = ".speech_index.json"  # 음성 폴더마다 저장되는 말소리 시작/끝 인덱스 (analyze 명령으로 생성)
 CONFIG_FILE = Path(os.path.expanduser("~")) / ".conversation_app_config.json"
+CACHE_DIR = Path(os.path.expanduser("~")) / ".conversation_app_cache"
+
+# 캐시 설정
+CACHE_SETTINGS = {
+    'CORPUS_DIR': CACHE_DIR / "corpus",  # 엑셀을 변환한 바이너리 문장 파일
+    'AUDIO_CACHE_DIR': CACHE_DIR / "audio",
+    'AUDIO_CACHE_MAX_MB': 1024,  # 배속 변환 파일 캐시 최대 용량
+    'AUDIO_CACHE_FORMAT': "mp3",
+    'SOUND_POOL_MAX_MB': 256,  # 디코딩된 Sound를 메모리에 보관하는 최대 용량
+}
+
+# 배속 변환 설정
+TEMPO_SETTINGS = {
+    'BACKEND': "numpy",  # "numpy" (프로세스 내 WSOLA) 또는 "ffmpeg"
+    'FRAME_MS': 40,  # WSOLA 프레임 길이
+    'TOLERANCE_MS': 10,  # 프레임 정렬 탐색 범위
+    'SAMPLE_RATE': 44100,  # 일괄 변환(precompute) 시 디코딩 샘플레이트
+}
+
+# 영상 내보내기 설정
+EXPORT_SETTINGS = {
+    'FPS': 30,
+    'SAMPLE_RATE': 44100,
+    'CHUNK_SECONDS': 60,  # 병렬 인코딩 단위
+    'MIX_CHUNK_SECONDS': 10,  # 세션 음성을 섞어 WAV로 기록하는 단위 (섞는 버퍼 크기만 고정, 준비한 음성은 모두 메모리에 둠)
+    'PIXELS_PER_POINT': 1.0,  # macOS Tk 기준 (1pt = 1px)
+    'FONT_DIRS': ["/System/Library/Fonts", "/Library/Fonts", "~/Library/Fonts",
+                  "/usr/share/fonts", "~/.fonts", "C:/Windows/Fonts"],
+}
+
+# 문장 읽기 설정
+DATA_SETTINGS = {
+    # "corpus": 엑셀 전체를 변환한 문장 파일 사용 (없으면 먼저 변환)
+    # "window": 선택한 범위의 행만 엑셀에서 스트리밍
+    # "auto": 변환한 파일이 있으면 사용하고, 없으면 이번 실행은 window로 읽고 변환은 백그라운드에서 함
+    'READ_MODE': "auto",
+    'WINDOW_LOOKAHEAD': 20,  # window 모드에서 요청한 범위 뒤로 미리 읽어 둘 문장 수
+}
+
+# 앞뒤 무음 잘라내기 설정 (analyze 명령으로 말소리 구간을 찾아 둔 파일만 잘라서 재생)
+SILENCE_SETTINGS = {
+    'TRIM': True,
+    'FRAME_MS': 10,  # 에너지(RMS)를 계산하는 구간 길이
+    'THRESHOLD_DB': -50,  # 이보다 작은 구간은 항상 무음
+    'RELATIVE_DB': -35,  # 가장 큰 구간보다 이만큼 작은 구간도 무음
+    'PADDING_MS': 60,  # 자음이 잘리지 않도록 말소리 앞뒤로 남기는 여유
+}
+
+# 미리 준비 설정
+PREFETCH_SETTINGS = {
+    'LOOKAHEAD': 3,  # 현재 문장 이후 미리 준비할 문장 수
+    'WORKERS': 2,
+}
+
+# 문장별 타이밍 기록 설정 (JSONL, 용량을 넘으면 .1.gz, .2.gz ... 로 압축해 밀어내고 새 파일 사용)
+TELEMETRY_SETTINGS = {
+    'ENABLED': True,
+    'FILE': Path("../session_timing.jsonl"),
+    'MAX_BYTES': 5 * 1024 * 1024,
+    'BACKUP_COUNT': 3,
+}
+
+# 로깅 설정 (파일/콘솔 쓰기는 백그라운드 스레드에서 하고, 용량을 넘은 로그 파일은 gzip으로 압축해 보관)
+LOG_SETTINGS = {
+    'FILE': Path("../conversation_app.log"),
+    'FORMAT': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    'MAX_BYTES': 10 * 1024 * 1024,
+    'BACKUP_COUNT': 5,
+    'CONSOLE_LEVEL': logging.INFO,
+    'LEVELS': {
+        'basic': logging.INFO,
+        'basic.playback': logging.WARNING,  # 문장 재생 중에 매번 호출되는 경로
+    },
+    'BUDGETS': {
+        'basic.playback': 20,  # 1초에 남기는 최대 기록 수 (WARNING 미만만 버림)
+        'basic.ui': 20,
+    },
+}
+
+app_log = logging.getLogger("basic")
+audio_log = logging.getLogger("basic.audio")
+data_log = logging.getLogger("basic.data")
+playback_log = logging.getLogger("basic.playback")
+ui_log = logging.getLogger("basic.ui")
+export_log = logging.getLogger("basic.export")
+
+
+class GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    # 용량을 넘으면 .1.gz, .2.gz ... 로 압축해 밀어내고 새 파일에 기록
+
+    def __init__(self, filename, max_bytes: int, backup_count: int):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self.compress
+
+    @staticmethod
+    def compress(source: str, dest: str):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+class LogBudgetFilter(logging.Filter):
+    # 1초에 max_records개를 넘는 INFO 이하 기록은 버리고, 다음에 남기는 기록에 버린 개수를 덧붙임
+
+    def __init__(self, max_records: int, clock=time.monotonic):
+        super().__init__()
+        self.max_records = max_records
+        self.clock = clock
+        self.window_start = 0.0
+        self.count = 0
+        self.dropped = 0
+
+    def filter(self, record) -> bool:
+        now = self.clock()
+        if now - self.window_start >= 1.0:
+            self.window_start = now
+            self.count = 0
+        if self.count >= self.max_records and record.levelno < logging.WARNING:
+            self.dropped += 1
+            return False
+        self.count += 1
+        if self.dropped:
+            record.msg = f"{record.msg} ({self.dropped} log records dropped)"
+            self.dropped = 0
+        return True
+
+
+def start_log_queue(*handlers) -> logging.handlers.QueueHandler:
+    # 로그를 남기는 쪽은 큐에 넣기만 하고, 실제 쓰기는 리스너 스레드에서 함 (종료 시 남은 기록을 모두 씀)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def setup_logging(settings=LOG_SETTINGS):
+    formatter = logging.Formatter(settings['FORMAT'])
+    handlers = []
+    try:
+        file_handler = GzipRotatingFileHandler(settings['FILE'], settings['MAX_BYTES'], settings['BACKUP_COUNT'])
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"Error opening log file {settings['FILE']}: {e}")
+    console = logging.StreamHandler()
+    console.setLevel(settings['CONSOLE_LEVEL'])
+    console.setFormatter(formatter)
+    handlers.append(console)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(start_log_queue(*handlers))
+    for name, level in settings['LEVELS'].items():
+        logging.getLogger(name).setLevel(level)
+    for name, max_records in settings['BUDGETS'].items():
+        logging.getLogger(name).addFilter(LogBudgetFilter(max_records))
+
+
+def time_stretch(samples, speed: float, sample_rate: int,
+                 frame_ms: float = TEMPO_SETTINGS['FRAME_MS'], tolerance_ms: float = TEMPO_SETTINGS['TOLERANCE_MS']):
+    # WSOLA 방식으로 음높이는 그대로 두고 재생 속도만 바꿈
+    # samples: (프레임 수,) 또는 (프레임 수, 채널 수) 배열, 같은 dtype으로 반환
+    if speed == 1.0 or len(samples) == 0:
+        return samples
+
+    x = samples.astype(np.float32)
+    mono = x if x.ndim == 1 else x.mean(axis=1)
+    target_length = max(1, int(round(len(x) / speed)))
+
+    frame = max(2, int(sample_rate * frame_ms / 1000) // 2 * 2)
+    if len(x) < frame:
+        # 프레임 하나보다 짧으면 겹쳐 이을 수 없으므로 길이만 보간해 맞춤
+        positions = np.linspace(0, len(x) - 1, target_length)
+        output = np.interp(positions, np.arange(len(x)), mono) if x.ndim == 1 else np.stack(
+            [np.interp(positions, np.arange(len(x)), x[:, channel]) for channel in range(x.shape[1])], axis=1)
+        return _to_sample_dtype(output, samples.dtype)
+
+    synthesis_hop = frame // 2
+    analysis_hop = synthesis_hop * speed
+    tolerance = int(sample_rate * tolerance_ms / 1000)
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame) / frame)).astype(np.float32)
+
+    # 출력이 입력 길이 / 배속보다 짧아지지 않도록 프레임 수를 올림으로 정함 (끝부분 손실 방지)
+    frame_count = max(1, -(-(target_length - frame) // synthesis_hop) + 1)
+    # 마지막 프레임의 탐색 범위가 입력 끝을 넘어도 읽을 수 있도록 뒤쪽을 넉넉히 채움
+    tail = max(0, int(np.ceil((frame_count - 1) * analysis_hop)) - len(x)) + 2 * frame + tolerance + synthesis_hop
+    padding = [(tolerance, tail)] + [(0, 0)] * (x.ndim - 1)
+    padded = np.pad(x, padding)
+    padded_mono = np.pad(mono, padding[0])
+
+    output = np.zeros(((frame_count - 1) * synthesis_hop + frame,) + x.shape[1:], dtype=np.float32)
+    envelope = np.zeros(len(output), dtype=np.float32)
+    frame_window = window if x.ndim == 1 else window[:, None]
+
+    previous = tolerance
+    for k in range(frame_count):
+        nominal = int(round(k * analysis_hop))
+        if k == 0:
+            position = tolerance
+        else:
+            # 이전 프레임의 자연스러운 연장과 가장 잘 맞는 위치를 탐색 범위 안에서 선택
+            natural = padded_mono[previous + synthesis_hop:previous + synthesis_hop + frame]
+            region = padded_mono[nominal:nominal + 2 * tolerance + frame]
+            candidates = np.lib.stride_tricks.sliding_window_view(region, frame)
+            position = nominal + int(np.argmax(candidates @ natural))
+
+        start = k * synthesis_hop
+        output[start:start + frame] += padded[position:position + frame] * frame_window
+        envelope[start:start + frame] += window
+        previous = position
+
+    envelope = np.maximum(envelope, 1e-3)
+    output /= envelope if output.ndim == 1 else envelope[:, None]
+    # 마지막 프레임이 덧붙인 꼬리를 잘라 입력 길이 / 배속에 맞춤
+    return _to_sample_dtype(output[:target_length], samples.dtype)
+
+
+def _to_sample_dtype(output, dtype):
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        output = np.clip(np.round(output), info.min, info.max)
+    return output.astype(dtype)
+
+
+def find_speech_bounds(samples, sample_rate: int, settings=SILENCE_SETTINGS):
+    # 구간별 RMS가 임계값을 넘는 첫/마지막 구간으로 말소리의 [시작, 끝] (초)을 찾음, 전부 무음이면 None
+    # samples: (프레임 수,) 또는 (프레임 수, 채널 수) 16비트 PCM 배열
+    x = samples.astype(np.float32) / 32768
+    if x.ndim > 1:
+        x = x.mean(axis=1)
+    frame = max(1, int(sample_rate * settings['FRAME_MS'] / 1000))
+    count = len(x) // frame
+    if count == 0:
+        return None
+
+    rms = np.sqrt(np.mean(np.square(x[:count * frame].reshape(count, frame)), axis=1))
+    level = 20 * np.log10(np.maximum(rms, 1e-10))
+    voiced = np.flatnonzero(level > max(settings['THRESHOLD_DB'], level.max() + settings['RELATIVE_DB']))
+    if len(voiced) == 0:
+        return None
+    padding = settings['PADDING_MS'] / 1000
+    start = max(0.0, voiced[0] * frame / sample_rate - padding)
+    end = min(len(x) / sample_rate, (voiced[-1] + 1) * frame / sample_rate + padding)
+    return [round(start, 4), round(end, 4)]
+
+
+def measure_speech_bounds(file_path: str):
+    # 16비트 WAV는 직접 읽고, 그 밖의 형식은 ffmpeg로 디코딩해 말소리 구간을 찾음 (analyze 명령의 프로세스 풀 작업)
+    try:
+        with wave.open(file_path, 'rb') as f:
+            if f.getsampwidth() != 2:
+                raise wave.Error("not 16-bit PCM")
+            samples = np.frombuffer(f.readframes(f.getnframes()), dtype='<i2').reshape(-1, f.getnchannels())
+            return find_speech_bounds(samples, f.getframerate())
+    except (wave.Error, EOFError):
+        sample_rate = TEMPO_SETTINGS['SAMPLE_RATE']
+        return find_speech_bounds(decode_audio(file_path, sample_rate, 1), sample_rate)
+
+
+def read_wav_duration(file_path: str) -> float:
+    # RIFF/WAV 헤더의 fmt, data 청크만 읽어 디코딩 없이 길이(초)를 계산
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            raise ValueError(f"Not a RIFF/WAVE file: {file_path}")
+
+        byte_rate = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size)
+                byte_rate = struct.unpack('<I', fmt[8:12])[0]
+                f.seek(chunk_size % 2, os.SEEK_CUR)
+            elif chunk_id == b'data':
+                if not byte_rate:
+                    raise ValueError(f"Missing fmt chunk before data: {file_path}")
+                # 녹음 도중 잘린 파일은 헤더의 크기가 실제 데이터보다 클 수 있음
+                data_size = min(chunk_size, file_size - f.tell())
+                return data_size / byte_rate
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    raise ValueError(f"Missing data chunk: {file_path}")
+
 
-# 로깅 설정
-log_file = Path("../conversation_app.log")
-logging.basicConfig(
-    level=logging.INFO,  # DEBUG에서 INFO로 변경
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filename=str(log_file),
-    filemode='a'
-)
+OGG_PAGE_HEADER = struct.Struct('<4sBBqIIIB')
 
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-console.setFormatter(formatter)
-logging.getLogger('').addHandler(console)
+
+def read_ogg_duration(file_path: str) -> float:
+    # 첫 페이지의 코덱 헤더(Vorbis/Opus)에서 샘플레이트를, 마지막 페이지의 granule position에서 샘플 수를 읽어
+    # 디코딩 없이 길이(초)를 계산
+    with open(file_path, 'rb') as f:
+        header = f.read(OGG_PAGE_HEADER.size)
+        if len(header) < OGG_PAGE_HEADER.size:
+            raise ValueError(f"Not an Ogg file: {file_path}")
+        capture, _, _, _, serial, _, _, segments = OGG_PAGE_HEADER.unpack(header)
+        if capture != b'OggS':
+            raise ValueError(f"Not an Ogg file: {file_path}")
+        packet = f.read(sum(f.read(segments)))
+
+        if packet.startswith(b'\x01vorbis'):
+            sample_rate = struct.unpack_from('<I', packet, 12)[0]
+            pre_skip = 0
+        elif packet.startswith(b'OpusHead'):
+            # Opus의 granule position은 원본 샘플레이트와 관계없이 항상 48kHz 기준
+            pre_skip = struct.unpack_from('<H', packet, 10)[0]
+            sample_rate = 48000
+        else:
+            raise ValueError(f"Unsupported Ogg codec: {file_path}")
+
+        # 마지막 페이지는 최대 65307바이트이므로 파일 끝부분만 읽으면 됨
+        file_size = f.seek(0, os.SEEK_END)
+        tail_size = min(file_size, 65536 + OGG_PAGE_HEADER.size)
+        f.seek(file_size - tail_size)
+        tail = f.read(tail_size)
+
+    position = tail.rfind(b'OggS')
+    while position >= 0:
+        if position + OGG_PAGE_HEADER.size <= len(tail):
+            _, _, _, granule, page_serial, _, _, _ = OGG_PAGE_HEADER.unpack_from(tail, position)
+            if page_serial == serial and granule >= 0:
+                return max(0, granule - pre_skip) / sample_rate
+        position = tail.rfind(b'OggS', 0, position)
+    raise ValueError(f"Missing final Ogg page: {file_path}")
+
+
+# MPEG 오디오 프레임 헤더 표 (버전 1 / 2·2.5, 레이어 I·II·III 순서, kbps)
+MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 2.5: [11025, 12000, 8000]}
+
+
+def parse_mp3_frame_header(header: bytes):
+    # 4바이트 프레임 헤더 -> (버전, 레이어, 비트레이트 bps, 샘플레이트, 프레임 바이트 수, 프레임당 샘플 수, 모노 여부)
+    # 프레임 헤더가 아니면 None
+    value = int.from_bytes(header, 'big')
+    if value >> 21 != 0x7FF:
+        return None
+    version = {0: 2.5, 2: 2, 3: 1}.get((value >> 19) & 3)
+    layer = {1: 3, 2: 2, 3: 1}.get((value >> 17) & 3)
+    bitrate_index, rate_index = (value >> 12) & 15, (value >> 10) & 3
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    padding = (value >> 9) & 1
+    if layer == 1:
+        samples = 384
+        frame_size = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == 1 else 576
+        frame_size = samples // 8 * bitrate // sample_rate + padding
+    mono = (value >> 6) & 3 == 3
+    return version, layer, bitrate, sample_rate, frame_size, samples, mono
+
+
+def read_mp3_duration(file_path: str) -> float:
+    # ID3v2 태그를 건너뛰고 첫 프레임 헤더를 읽어, Xing/Info 또는 VBRI 헤더의 프레임 수로(VBR)
+    # 없으면 비트레이트와 파일 크기로(CBR) 디코딩 없이 길이(초)를 계산
+    with open(file_path, 'rb') as f:
+        file_size = f.seek(0, os.SEEK_END)
+        f.seek(0)
+        head = f.read(10)
+        audio_start = 0
+        if len(head) == 10 and head[:3] == b'ID3':
+            # 태그 크기는 7비트씩 나눠 저장된 정수 (바닥글이 있으면 10바이트 더)
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            audio_start = 10 + size + (10 if head[5] & 0x10 else 0)
+        f.seek(audio_start)
+        data = f.read(65536)
+        f.seek(max(0, file_size - 128))
+        has_id3v1 = f.read(3) == b'TAG'
+
+    position = data.find(b'\xff')
+    while 0 <= position <= len(data) - 4:
+        frame = parse_mp3_frame_header(data[position:position + 4])
+        # 우연히 동기 비트와 같은 값이 아닌지 다음 프레임 헤더까지 확인
+        if frame is not None and (position + frame[4] + 4 > len(data)
+                                  or parse_mp3_frame_header(data[position + frame[4]:position + frame[4] + 4])):
+            break
+        position = data.find(b'\xff', position + 1)
+    else:
+        raise ValueError(f"Missing MPEG audio frame: {file_path}")
+
+    version, _, bitrate, sample_rate, frame_size, samples, mono = frame
+    side_info = (17 if mono else 32) if version == 1 else (9 if mono else 17)
+    xing = position + 4 + side_info
+    if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+        flags = struct.unpack_from('>I', data, xing + 4)[0]
+        if flags & 1:
+            return struct.unpack_from('>I', data, xing + 8)[0] * samples / sample_rate
+    vbri = position + 36
+    if data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+        return struct.unpack_from('>I', data, vbri + 14)[0] * samples / sample_rate
+
+    audio_size = file_size - audio_start - position - (128 if has_id3v1 else 0)
+    return max(0, audio_size) * 8 / bitrate
+
+
+def find_audio_file(template: str, sentence_number: int) -> str:
+    # 템플릿의 {ext}를 AUDIO_EXTENSIONS 순서로 채워 처음 존재하는 파일을 반환 (없으면 첫 번째 확장자의 경로)
+    candidates = [template.format(sentence_number, ext=ext) for ext in AUDIO_EXTENSIONS]
+    return next((path for path in candidates if os.path.exists(path)), candidates[0])
+
+
+class AudioManifest:
+    # 언어별 음성 폴더를 os.scandir로 한 번 훑어 문장 번호 -> 파일 경로 표를 메모리에 두고, 재생 중에는 표만 조회
+    # 폴더의 mtime이 바뀐 경우(파일 추가/삭제/이름 변경)에만 그 폴더를 다시 훑음 (파일 내용 변경은 길이 인덱스가 확인)
+
+    def __init__(self, templates: Dict[str, str]):
+        self.templates = templates  # 언어 -> 경로 템플릿
+        self.patterns = {language: self.name_pattern(template) for language, template in templates.items()}
+        self.files = {}  # 언어 -> {문장 번호: 경로}
+        self.shadowed = {}  # 언어 -> {문장 번호: [확장자 순서에 밀려 쓰지 않는 경로]}
+        self.unknown = {}  # 언어 -> [이름 규칙에 맞지 않는 파일 이름]
+        self.mtimes = {}  # 언어 -> 폴더 mtime_ns (폴더가 없으면 None)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def name_pattern(template: str):
+        extensions = "|".join(re.escape(ext) for ext in AUDIO_EXTENSIONS)
+        pattern = re.escape(os.path.basename(template))
+        pattern = pattern.replace(re.escape("{}"), r"(\d+)").replace(re.escape("{ext}"), f"({extensions})")
+        return re.compile(pattern + "$")
+
+    def refresh(self):
+        with self._lock:
+            for language, template in self.templates.items():
+                directory = os.path.dirname(template) or "."
+                try:
+                    mtime = os.stat(directory).st_mtime_ns
+                except FileNotFoundError:
+                    mtime = None
+                if language in self.mtimes and self.mtimes[language] == mtime:
+                    continue
+                self._scan(language, directory, mtime)
+
+    def _scan(self, language: str, directory: str, mtime):
+        template, pattern = self.templates[language], self.patterns[language]
+        priority = {ext: i for i, ext in enumerate(AUDIO_EXTENSIONS)}
+        found, unknown = {}, []  # 문장 번호 -> [(우선순위, 경로)]
+        if mtime is not None:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    match = pattern.match(entry.name)
+                    if match is None:
+                        unknown.append(entry.name)
+                        continue
+                    number, ext = match.groups()
+                    found.setdefault(int(number), []).append((priority[ext], template.format(number, ext=ext)))
+
+        files, shadowed = {}, {}
+        for number, candidates in found.items():
+            candidates.sort()
+            files[number] = candidates[0][1]
+            if len(candidates) > 1:
+                shadowed[number] = [path for _, path in candidates[1:]]
+        self.files[language], self.shadowed[language], self.unknown[language] = files, shadowed, sorted(unknown)
+        self.mtimes[language] = mtime
+        audio_log.info(f"Scanned {directory}: {len(files)} sentences, {len(unknown)} other files")
+
+    def get(self, language: str, sentence_number: int):
+        # 파일이 없으면 None
+        if language not in self.mtimes:
+            self.refresh()
+        return self.files[language].get(sentence_number)
+
+    def check(self, start: int, end: int, languages) -> list:
+        # start..end 범위의 빠진 파일과 남는 파일(중복 확장자, 이름 규칙에 맞지 않는 파일)을 설명하는 줄 목록
+        self.refresh()
+        problems = []
+        for language in languages:
+            directory = os.path.dirname(self.templates[language]) or "."
+            if self.mtimes[language] is None:
+                problems.append(f"{language}: {directory} 폴더가 없습니다")
+                continue
+            missing = [n for n in range(start, end + 1) if n not in self.files[language]]
+            if missing:
+                problems.append(f"{language}: {len(missing)}개 없음 ({self.summarize(missing)})")
+            shadowed = [path for n in range(start, end + 1) for path in self.shadowed[language].get(n, [])]
+            if shadowed:
+                problems.append(f"{language}: 같은 문장의 다른 형식 파일 {len(shadowed)}개는 사용하지 않음 "
+                                f"({self.summarize(shadowed)})")
+            if self.unknown[language]:
+                problems.append(f"{language}: {directory} 폴더의 이름 규칙에 맞지 않는 파일 "
+                                f"{len(self.unknown[language])}개 ({self.summarize(self.unknown[language])})")
+        return problems
+
+    @staticmethod
+    def summarize(items, limit: int = 5) -> str:
+        shown = ", ".join(str(item) for item in items[:limit])
+        return f"{shown} 외 {len(items) - limit}개" if len(items) > limit else shown
+
+
+class StreamedPlayback:
+    # 압축 음성을 pygame.mixer.music으로 조금씩 디코딩하며 재생 (파일 전체를 메모리에 풀지 않음)
+    # Channel과 같은 get_sound()/stop()을 제공해 poll_playback()과 stop_playback()에서 그대로 다룸
+    current = None  # music 스트림은 하나뿐이므로 마지막으로 시작한 재생만 유효
+
+    def __init__(self, audio_file: str, start: float = 0.0, end: float = None):
+        # start..end (초) 구간만 재생 (end가 None이면 끝까지)
+        self.audio_file = audio_file
+        self.start = start
+        self.end = end
+
+    def play(self):
+        pygame.mixer.music.load(self.audio_file)
+        pygame.mixer.music.play(start=self.start)
+        StreamedPlayback.current = self
+        return self
+
+    def get_sound(self):
+        # 재생 중이면 자신을, 끝났거나 다른 스트림으로 바뀌었으면 None 반환
+        if StreamedPlayback.current is self and pygame.mixer.music.get_busy():
+            if self.end is None or pygame.mixer.music.get_pos() < (self.end - self.start) * 1000:
+                return self
+            self.stop()
+        return None
+
+    def stop(self):
+        if StreamedPlayback.current is self:
+            pygame.mixer.music.stop()
+            StreamedPlayback.current = None
+
+
+class AudioFileIndex:
+    # 음성 폴더마다 파일 이름 -> [mtime, 크기, 값]을 저장해 두고, 파일이 바뀐 경우에만 값을 다시 계산
+    MISSING = object()  # 저장된 값이 None일 수 있으므로 lookup의 "없음" 표시로 사용
+
+    def __init__(self, index_name: str, compute):
+        self.index_name = index_name
+        self.compute = compute
+        self.directories = {}  # 폴더 경로 -> 파일 이름 -> [mtime_ns, size, value]
+        self.dirty = set()
+        self._lock = threading.Lock()
+
+    def _entries(self, directory: str):
+        entries = self.directories.get(directory)
+        if entries is None:
+            entries = {}
+            index_file = os.path.join(directory, self.index_name)
+            try:
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                audio_log.error(f"Error loading index {index_file}: {e}")
+            self.directories[directory] = entries
+        return entries
+
+    def lookup(self, file_path: str, stat=None, default=None):
+        # 파일이 바뀌지 않았으면 저장된 값, 없거나 바뀌었으면 default (계산하지 않음)
+        if stat is None:
+            stat = os.stat(file_path)
+        directory, name = os.path.split(file_path)
+        with self._lock:
+            entry = self._entries(directory).get(name)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        return default
+
+    def put(self, file_path: str, value, stat=None):
+        if stat is None:
+            stat = os.stat(file_path)
+        directory, name = os.path.split(file_path)
+        with self._lock:
+            self._entries(directory)[name] = [stat.st_mtime_ns, stat.st_size, value]
+            self.dirty.add(directory)
+
+    def get(self, file_path: str, stat=None):
+        if stat is None:
+            stat = os.stat(file_path)
+        value = self.lookup(file_path, stat, self.MISSING)
+        if value is self.MISSING:
+            value = self.compute(file_path)
+            self.put(file_path, value, stat)
+        return value
+
+    def save(self):
+        with self._lock:
+            pending = {directory: dict(self.directories[directory]) for directory in self.dirty}
+            self.dirty.clear()
+        for directory, entries in pending.items():
+            index_file = os.path.join(directory, self.index_name)
+            temp_file = f"{index_file}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(temp_file, index_file)
+            except OSError as e:
+                audio_log.error(f"Error saving index {index_file}: {e}")
+
+
+class AudioCache:
+    # 배속 변환된 음성 파일을 (원본 내용 해시, 배속, 포맷) 키로 보관하는 디스크 캐시
+    # 인덱스는 재시작 후에도 유지되며, 용량을 넘으면 가장 오래 쓰지 않은 항목부터 삭제
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.index_file = self.cache_dir / self.INDEX_NAME
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.entries = {}  # key -> {'file', 'size', 'last_used'}
+        self.sources = {}  # 원본 경로 -> [mtime_ns, size, digest]
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self.index_file.exists():
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                self.entries = index.get('entries', {})
+                self.sources = index.get('sources', {})
+        except (OSError, json.JSONDecodeError) as e:
+            audio_log.error(f"Error loading audio cache index {self.index_file}: {e}")
+            self.entries = {}
+            self.sources = {}
+
+        # 인덱스에는 있지만 실제 파일이 없는 항목 정리
+        for key in [k for k, entry in self.entries.items() if not (self.cache_dir / entry['file']).exists()]:
+            del self.entries[key]
+            self._dirty = True
+
+    def source_digest(self, source_file: str) -> str:
+        # 원본 파일의 mtime/크기가 그대로면 이전에 계산한 해시를 재사용
+        stat = os.stat(source_file)
+        with self._lock:
+            known = self.sources.get(source_file)
+            if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+                return known[2]
+
+        digest = hashlib.sha1()
+        with open(source_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        with self._lock:
+            self.sources[source_file] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+            self._dirty = True
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(digest: str, speed: float, fmt: str) -> str:
+        return f"{digest}_{speed:.2f}.{fmt}"
+
+    def get(self, source_file: str, speed: float, fmt: str):
+        key = self.make_key(self.source_digest(source_file), speed, fmt)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            path = self.cache_dir / entry['file']
+            if not path.exists():
+                del self.entries[key]
+                self._dirty = True
+                return None
+            entry['last_used'] = time.time()
+            self._dirty = True
+            return str(path)
+
+    def get_or_create(self, source_file: str, speed: float, fmt: str, producer):
+        # producer(input_file, output_file) -> bool
+        cached = self.get(source_file, speed, fmt)
+        if cached:
+            return cached
+
+        key = self.make_key(self.source_digest(source_file), speed, fmt)
+        path = self.cache_dir / key
+        # 변환 도중 종료되어도 깨진 파일이 캐시에 남지 않도록 임시 이름으로 만든 뒤 교체
+        temp_path = self.cache_dir / f".{key}.{threading.get_ident()}.tmp.{fmt}"
+        try:
+            if not producer(source_file, str(temp_path)):
+                return None
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        self.add(key, path)
+        return str(path)
+
+    def add(self, key: str, path: Path, save: bool = True):
+        # 일괄 추가할 때는 save=False로 두고 마지막에 save() 호출
+        with self._lock:
+            self.entries[key] = {'file': Path(path).name, 'size': Path(path).stat().st_size, 'last_used': time.time()}
+            self._evict(keep=key)
+            self._dirty = True
+        if save:
+            self.save()
+
+    def _evict(self, keep: str = None):
+        # keep: 방금 추가해 호출한 쪽이 바로 쓸 항목 (혼자 용량을 넘거나 시각이 같아도 삭제하지 않음)
+        total = sum(entry['size'] for entry in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                (self.cache_dir / entry['file']).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                audio_log.error(f"Error evicting audio cache entry {key}: {e}")
+                continue
+            total -= entry['size']
+            del self.entries[key]
+            audio_log.info(f"Evicted audio cache entry {key}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            index = {'entries': self.entries, 'sources': self.sources}
+            self._dirty = False
+        temp_file = self.index_file.with_name(f".{self.INDEX_NAME}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            audio_log.error(f"Error saving audio cache index {self.index_file}: {e}")
+
+
+class PreparedAudio:
+    __slots__ = ('length', 'sound', 'timings')
+
+    def __init__(self, length: float, sound, timings=None):
+        self.length = length
+        self.sound = sound
+        self.timings = timings or {}  # 준비 단계 이름 -> 소요 시간(초)
+
+
+class SoundPool:
+    # 디코딩된 pygame Sound를 (경로, 배속, 수정 시각) 키로 보관하고, 메모리 한도를 넘으면 가장 오래 쓰지 않은 것부터 버림
+    # (재생 중인 Sound는 채널이 참조를 갖고 있으므로 풀에서 빠져도 끝까지 재생됨)
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.sounds = OrderedDict()  # key -> (sound, 바이트 수)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(audio_file: str, speed: float):
+        return os.path.abspath(audio_file), round(speed, 2), os.stat(audio_file).st_mtime_ns
+
+    @staticmethod
+    def sound_size(sound) -> int:
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
+    def get_or_load(self, audio_file: str, speed: float, load):
+        # load(audio_file, speed) -> Sound, 풀에 없을 때만 호출
+        key = self.make_key(audio_file, speed)
+        with self._lock:
+            entry = self.sounds.get(key)
+            if entry is not None:
+                self.sounds.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        sound = load(audio_file, speed)
+        size = self.sound_size(sound)
+        with self._lock:
+            previous = self.sounds.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            self.sounds[key] = (sound, size)
+            self.total_bytes += size
+            self._evict()
+        return sound
+
+    def _evict(self):
+        # 방금 넣은 항목은 한도보다 커도 남겨 둠
+        while self.total_bytes > self.max_bytes and len(self.sounds) > 1:
+            _, (_, size) = self.sounds.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> str:
+        with self._lock:
+            return (f"{len(self.sounds)} sounds, {self.total_bytes / (1024 * 1024):.1f} MB, "
+                    f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions")
+
+
+class AudioPrefetcher:
+    # 현재 문장이 재생되는 동안 다음 문장들의 음성 길이 계산, 배속 변환, 디코딩을 백그라운드에서 준비
+
+    def __init__(self, audio_manager, max_workers: int):
+        self.audio_manager = audio_manager
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="audio-prefetch")
+        self.futures = {}  # (sentence_number, language, speed) -> Future[PreparedAudio]
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @staticmethod
+    def make_key(sentence_number: int, language: str, speed: float):
+        return sentence_number, language, round(speed, 2)
+
+    def prefetch(self, sentence_numbers, speeds: Dict[str, float], current_sentence: int):
+        with self._lock:
+            # 이미 지나간 문장의 준비 결과는 버림
+            for key in [k for k in self.futures if k[0] < current_sentence]:
+                self.futures.pop(key).cancel()
+
+            generation = self._generation
+            for sentence_number in sentence_numbers:
+                for language, speed in speeds.items():
+                    key = self.make_key(sentence_number, language, speed)
+                    if key not in self.futures:
+                        self.futures[key] = self.executor.submit(self._prepare, key, generation)
+
+    def _prepare(self, key, generation):
+        sentence_number, language, speed = key
+        if generation != self._generation:
+            return None
+        with self.audio_manager.collect_stage_timings() as timings:
+            length = self.audio_manager.get_audio_length(sentence_number, language)
+            if generation != self._generation:
+                return None
+            if self.audio_manager.get_stream_file(sentence_number, language, speed) is not None:
+                # 스트리밍 재생할 음성은 길이만 준비
+                return PreparedAudio(length, None, timings)
+            sound = self.audio_manager.load_sentence_sound(sentence_number, language, speed)
+        return PreparedAudio(length, sound, timings)
+
+    def peek(self, sentence_number: int, language: str, speed: float):
+        # 이미 준비가 끝난 경우에만 결과를 반환 (대기하지 않음)
+        with self._lock:
+            future = self.futures.get(self.make_key(sentence_number, language, speed))
+        if future is None or not future.done() or future.cancelled() or future.exception():
+            return None
+        return future.result()
+
+    def take(self, sentence_number: int, language: str, speed: float):
+        with self._lock:
+            future = self.futures.pop(self.make_key(sentence_number, language, speed), None)
+        if future is None or future.cancel():
+            # 아직 시작하지 않은 작업은 취소하고 호출한 쪽에서 직접 준비
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            audio_log.error(f"Error preparing audio for sentence {sentence_number} in {language}: {e}")
+            return None
+
+    def cancel(self, keep_completed: bool = False):
+        # keep_completed=True이면 이미 준비가 끝난 결과는 남기고 대기/진행 중인 작업만 취소
+        with self._lock:
+            self._generation += 1
+            for key, future in list(self.futures.items()):
+                if keep_completed and future.done() and not future.cancelled() and not future.exception():
+                    continue
+                future.cancel()
+                del self.futures[key]
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
 
 
 class AudioManager:
@@ -98,63 +1030,310 @@ class AudioManager:
     }
 
     def __init__(self):
-        pygame.mixer.init()
-        self.sounds = {
-            "drum": pygame.mixer.Sound(str(SOUND_DRUM)),
-            "final": pygame.mixer.Sound("../final.MP3")
-        }
-        self.temp_dir = tempfile.mkdtemp()
+        # 믹서 초기화, 효과음 디코딩, 캐시 인덱스 읽기는 initialize()에서 함 (시작 화면 뒤에서 백그라운드로 호출)
+        self.sounds = {}
+        self.audio_cache = None
+        self.ready = threading.Event()
+        self._pending_sounds = []  # 초기화 전에 요청된 효과음
+        self._lock = threading.Lock()
+        self.prefetcher = AudioPrefetcher(self, PREFETCH_SETTINGS['WORKERS'])
+        self.sound_pool = SoundPool(CACHE_SETTINGS['SOUND_POOL_MAX_MB'] * 1024 * 1024)
+        self.active_playbacks = []  # (channel, sound, on_complete)
+        self.duration_index = AudioFileIndex(DURATION_INDEX_NAME, self.measure_audio_length)
+        self.speech_index = AudioFileIndex(SPEECH_INDEX_NAME, measure_speech_bounds)  # 재생 중에는 조회만 함
+        self.manifest = AudioManifest({language: globals()[f"AUDIO_{code}"]
+                                       for language, code in self.LANGUAGE_CODES.items()})
+        self.telemetry = None  # 설정되면 문장 음성을 재생할 때 준비 시간을 기록
+        self._stage_timings = threading.local()
+
+    def initialize(self):
+        # 캐시 폴더를 쓸 수 없어도 믹서와 효과음은 준비 (캐시 없이 원본 속도로 재생)
+        try:
+            self.audio_cache = AudioCache(CACHE_SETTINGS['AUDIO_CACHE_DIR'],
+                                          CACHE_SETTINGS['AUDIO_CACHE_MAX_MB'] * 1024 * 1024)
+        except OSError as e:
+            audio_log.error(f"Error opening audio cache, continuing without it: {e}")
+        try:
+            self.manifest.refresh()
+            pygame.mixer.init()
+            self.sounds = {
+                "drum": pygame.mixer.Sound(str(SOUND_DRUM)),
+                "final": pygame.mixer.Sound(str(SOUND_FINAL))
+            }
+        except (pygame.error, OSError) as e:
+            audio_log.error(f"Error initializing audio: {e}")
+        finally:
+            with self._lock:
+                self.ready.set()
+                pending, self._pending_sounds = self._pending_sounds, []
+        for sound_name in pending:
+            self.play_sound(sound_name)
+
+    def wait_ready(self):
+        self.ready.wait()
 
     def play_sound(self, sound_name: str):
+        with self._lock:
+            if not self.ready.is_set():
+                self._pending_sounds.append(sound_name)
+                return
         try:
             self.sounds[sound_name].play()
-        except pygame.error as e:
-            logging.error(f"Error playing sound {sound_name}: {e}")
+        except (KeyError, pygame.error) as e:
+            audio_log.error(f"Error playing sound {sound_name}: {e}")
 
-    @staticmethod
-    def play_audio_file(file_path: str):
+    def play_audio_file(self, file_path: str):
         try:
-            sound = pygame.mixer.Sound(file_path)
+            sound = self.load_sound(file_path)
             sound.play()
-        except pygame.error as e:
-            logging.error(f"Error playing audio file {file_path}: {e}")
+        except (pygame.error, FileNotFoundError) as e:
+            audio_log.error(f"Error playing audio file {file_path}: {e}")
+
+    @contextlib.contextmanager
+    def collect_stage_timings(self):
+        # 이 블록 안에서 같은 스레드가 거친 준비 단계(길이 조회, 디코딩, ffmpeg 등)의 소요 시간을 모음
+        previous = getattr(self._stage_timings, 'current', None)
+        self._stage_timings.current = timings = {}
+        try:
+            yield timings
+        finally:
+            self._stage_timings.current = previous
+
+    @contextlib.contextmanager
+    def timed_stage(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings = getattr(self._stage_timings, 'current', None)
+            if timings is not None:
+                timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+    def get_audio_file(self, sentence_number: int, language: str) -> str:
+        # 목록에 없으면 첫 번째 확장자의 경로 (열 때 FileNotFoundError)
+        audio_file = self.manifest.get(language, sentence_number)
+        if audio_file is None:
+            audio_file = self.manifest.templates[language].format(sentence_number, ext=AUDIO_EXTENSIONS[0])
+        return audio_file
 
     def get_audio_length(self, sentence_number: int, language: str) -> float:
-        lang_code = self.get_language_code(language)
-        audio_file = globals()[f"AUDIO_{lang_code}"].format(sentence_number)
+        audio_file = self.get_audio_file(sentence_number, language)
         try:
-            if not os.path.exists(audio_file):
-                logging.warning(f"Audio file not found: {audio_file}")
-                return 2.0  # 파일이 없을 경우 기본값 반환
-            return pygame.mixer.Sound(audio_file).get_length()
+            with self.timed_stage("length"):
+                # 앞뒤 무음을 잘라 재생하는 파일은 말소리 구간의 길이
+                stat = os.stat(audio_file)
+                bounds = self.speech_bounds(audio_file, stat)
+                if bounds is not None:
+                    return bounds[1] - bounds[0]
+                return self.duration_index.get(audio_file, stat)
+        except FileNotFoundError:
+            audio_log.warning(f"Audio file not found: {audio_file}")
+            return 2.0  # 파일이 없을 경우 기본값 반환
         except pygame.error:
-            logging.error(f"Error getting length of audio for sentence {sentence_number} in {language}")
+            audio_log.error(f"Error getting length of audio for sentence {sentence_number} in {language}")
             return 2.0  # 오류 발생 시 기본값 반환
 
-    def play_sentence_audio(self, sentence_number: int, language: str, speed: float = 1.0):
+    @staticmethod
+    def measure_audio_length(audio_file: str) -> float:
+        # WAV, Ogg(Vorbis/Opus), MP3는 헤더만 읽고, 그 밖의 형식이나 헤더가 깨진 경우에만 디코딩
         try:
-            lang_code = self.get_language_code(language)
-            audio_file = globals()[f"AUDIO_{lang_code}"].format(sentence_number)
+            suffix = Path(audio_file).suffix.lower()
+            if suffix in (".ogg", ".opus", ".oga"):
+                return read_ogg_duration(audio_file)
+            if suffix == ".mp3":
+                return read_mp3_duration(audio_file)
+            return read_wav_duration(audio_file)
+        except (ValueError, struct.error) as e:
+            audio_log.warning(f"Decoding to get length of {audio_file}: {e}")
+            return pygame.mixer.Sound(audio_file).get_length()
 
-            if not Path(audio_file).exists():
-                raise FileNotFoundError(f"{audio_file} not found")
+    def get_sentence_length(self, sentence_number: int, language: str, speed: float = 1.0) -> float:
+        # 미리 준비된 결과가 있으면 디코딩 없이 길이를 반환
+        prepared = self.prefetcher.peek(sentence_number, language, speed)
+        if prepared is not None:
+            return prepared.length
+        return self.get_audio_length(sentence_number, language)
+
+    def load_sentence_sound(self, sentence_number: int, language: str, speed: float = 1.0):
+        # "load"는 배속 변환(ffmpeg/stretch)을 포함한 전체 준비 시간
+        with self.timed_stage("load"):
+            return self.load_sound(self.get_audio_file(sentence_number, language), speed)
+
+    def load_sound(self, audio_file: str, speed: float = 1.0):
+        # 같은 파일/배속은 메모리에 남아 있는 Sound를 재사용
+        # 없는 파일은 풀의 키를 만들 때(os.stat) FileNotFoundError
+        self.wait_ready()
+        return self.sound_pool.get_or_load(audio_file, speed, self.decode_sound)
+
+    def decode_sound(self, audio_file: str, speed: float = 1.0):
+        # analyze로 말소리 구간을 찾아 둔 파일은 앞뒤 무음을 잘라냄
+        if speed == 1.0:
+            return self.trim_sound(pygame.mixer.Sound(audio_file), self.speech_bounds(audio_file))
+
+        # precompute로 미리 변환해 둔 결과가 있으면 배속 변환 없이 디코딩만 함
+        cached = self.get_cached_audio_file(audio_file, speed)
+        if cached:
+            return self.trim_sound(pygame.mixer.Sound(cached), self.speech_bounds(audio_file, speed=speed))
+
+        if TEMPO_SETTINGS['BACKEND'] == "numpy" and np is not None:
+            try:
+                # 원본 디코딩 결과(이미 잘라낸 Sound)도 풀에 남겨 다른 배속에서 재사용
+                return self.stretch_sound(self.load_sound(audio_file), speed)
+            except Exception as e:
+                audio_log.error(f"Error stretching {audio_file} in process, falling back to ffmpeg: {e}")
+
+        speed_file = self.get_speed_audio_file(audio_file, speed)
+        if speed_file == audio_file:
+            speed = 1.0  # 변환에 실패해 원본을 그대로 재생
+        return self.trim_sound(pygame.mixer.Sound(speed_file), self.speech_bounds(audio_file, speed=speed))
+
+    def get_cached_audio_file(self, audio_file: str, speed: float):
+        # precompute/ffmpeg로 변환해 둔 배속 파일 (캐시를 열지 못했으면 None)
+        if self.audio_cache is None:
+            return None
+        return self.audio_cache.get(audio_file, speed, CACHE_SETTINGS['AUDIO_CACHE_FORMAT'])
+
+    def speech_bounds(self, audio_file: str, stat=None, speed: float = 1.0):
+        # analyze로 찾아 둔 말소리 구간을 speed배속 기준 (시작, 끝) 초로 반환, 없으면 None
+        if not SILENCE_SETTINGS['TRIM']:
+            return None
+        bounds = self.speech_index.lookup(audio_file, stat)
+        if bounds is None:
+            return None
+        return bounds[0] / speed, bounds[1] / speed
 
-            if speed != 1.0:
-                temp_output = os.path.join(self.temp_dir, f"temp_output_{sentence_number}_{language}.mp3")
-                self.change_audio_speed(audio_file, temp_output, speed)
-                audio_file = temp_output
+    @staticmethod
+    def trim_sound(sound, bounds):
+        # bounds(초) 밖의 앞뒤 무음을 잘라낸 새 Sound
+        if bounds is None or np is None:
+            return sound
+        frequency = pygame.mixer.get_init()[0]
+        samples = pygame.sndarray.array(sound)
+        trimmed = samples[int(bounds[0] * frequency):int(bounds[1] * frequency)]
+        if len(trimmed) in (0, len(samples)):
+            return sound
+        return pygame.mixer.Sound(buffer=np.ascontiguousarray(trimmed).tobytes())
+
+    def load_clip_samples(self, audio_file: str, speed: float = 1.0):
+        # 통합 트랙용: 믹서 형식(샘플레이트, 채널 수) 그대로의 PCM 배열 (프레임 수, 채널 수)
+        samples = pygame.sndarray.array(self.load_sound(audio_file, speed))
+        return samples.reshape(len(samples), -1)
+
+    def stretch_sound(self, sound, speed: float):
+        # 디코딩된 PCM을 그대로 배속 변환해 디스크를 거치지 않고 새 Sound로 만듦
+        frequency = pygame.mixer.get_init()[0]
+        with self.timed_stage("stretch"):
+            samples = pygame.sndarray.array(sound)
+            stretched = np.ascontiguousarray(time_stretch(samples, speed, frequency))
+            return pygame.mixer.Sound(buffer=stretched.tobytes())
+
+    def get_stream_file(self, sentence_number: int, language: str, speed: float = 1.0):
+        # 압축 음성을 배속 변환 없이 그대로 재생할 수 있으면(1배속이거나 precompute 결과가 있으면) 스트리밍할 파일 반환
+        self.wait_ready()
+        audio_file = self.manifest.get(language, sentence_number)
+        if audio_file is None or Path(audio_file).suffix.lower() not in STREAMED_AUDIO_EXTENSIONS:
+            return None
+        if speed == 1.0:
+            return audio_file
+        cached = self.get_cached_audio_file(audio_file, speed)
+        if cached and Path(cached).suffix.lower() in STREAMED_AUDIO_EXTENSIONS:
+            return cached
+        return None
+
+    def play_sentence_audio(self, sentence_number: int, language: str, speed: float = 1.0, on_complete=None):
+        # 재생을 시작하고 바로 반환, 재생이 끝나면 poll_playback()에서 on_complete 호출
+        try:
+            prepared = self.prefetcher.take(sentence_number, language, speed)
+            with self.collect_stage_timings() as timings:
+                if prepared is not None and prepared.sound is not None:
+                    sound = prepared.sound
+                else:
+                    stream_file = self.get_stream_file(sentence_number, language, speed)
+                    sound = None if stream_file is not None else self.load_sentence_sound(sentence_number, language,
+                                                                                          speed)
+            if self.telemetry is not None:
+                if prepared is not None:
+                    timings = {**prepared.timings, **timings}
+                self.telemetry.add_preparation(sentence_number, language, timings, prefetched=prepared is not None)
+            if sound is None:
+                bounds = self.speech_bounds(self.get_audio_file(sentence_number, language), speed=speed)
+                playback = StreamedPlayback(stream_file, *(bounds or (0.0, None))).play()
+                self.active_playbacks.append((playback, playback, on_complete))
+                return playback
+            channel = sound.play()
+            if channel is None:
+                raise pygame.error("No free mixer channel")
+            self.active_playbacks.append((channel, sound, on_complete))
+            return channel
 
-            sound = pygame.mixer.Sound(audio_file)
-            sound.play()
+        except Exception as e:
+            audio_log.error(f"Error playing audio for sentence {sentence_number} in {language}: {e}")
+            print(f"Error playing audio: {e}")
+            # 재생에 실패해도 다음 단계가 멈추지 않도록 다음 확인 때 완료로 처리
+            self.active_playbacks.append((None, None, on_complete))
+            return None
+
+    def poll_playback(self) -> bool:
+        # 채널의 재생 종료를 확인해 완료 콜백을 호출하고, 아직 재생 중인 음성이 있으면 True 반환
+        # (pygame 이벤트 큐는 SDL 비디오 초기화가 필요하므로 Tk 루프에서 채널 상태를 확인)
+        finished = [playback for playback in self.active_playbacks
+                    if playback[0] is None or playback[0].get_sound() is not playback[1]]
+        for playback in finished:
+            self.active_playbacks.remove(playback)
+        for _, _, on_complete in finished:
+            if on_complete is not None:
+                on_complete()
+        return bool(self.active_playbacks)
 
-            # 재생이 끝날 때까지 대기
-            pygame.time.wait(int(sound.get_length() * 1000 / speed))
+    @staticmethod
+    def pause_playback():
+        # 모든 채널과 통합 트랙을 현재 샘플 위치에서 멈춤
+        pygame.mixer.pause()
+        pygame.mixer.music.pause()
 
-            # logging.info(f"Finished audio No.{sentence_number} in {language}")
+    @staticmethod
+    def resume_playback():
+        pygame.mixer.unpause()
+        pygame.mixer.music.unpause()
 
-        except Exception as e:
-            logging.error(f"Error playing audio for sentence {sentence_number} in {language}: {e}")
-            print(f"Error playing audio: {e}")
+    @staticmethod
+    def play_track(track):
+        # 세션 전체를 합친 트랙을 스트리밍 재생 (track은 WAV 파일 경로 또는 파일 객체)
+        StreamedPlayback.current = None
+        pygame.mixer.music.load(track, "wav")
+        pygame.mixer.music.play()
+
+    @staticmethod
+    def track_position():
+        # 통합 트랙의 재생 위치 (밀리초, 일시 정지 중에는 멈춤), 재생이 끝났으면 None
+        position = pygame.mixer.music.get_pos()
+        return position if position >= 0 and pygame.mixer.music.get_busy() else None
+
+    def stop_playback(self):
+        # 완료 콜백 없이 재생 중인 문장 음성을 모두 정지
+        for channel, sound, _ in self.active_playbacks:
+            if channel is not None and channel.get_sound() is sound:
+                channel.stop()
+        self.active_playbacks.clear()
+
+    def get_speed_audio_file(self, audio_file: str, speed: float) -> str:
+        # 배속 변환 결과는 캐시에서 찾고, 없을 때만 ffmpeg를 실행
+        if speed == 1.0:
+            return audio_file
+        def convert(src, dst):
+            with self.timed_stage("ffmpeg"):
+                return self.change_audio_speed(src, dst, speed)
+
+        if self.audio_cache is None:
+            # 변환 결과를 둘 곳이 없음
+            cached = None
+        else:
+            cached = self.audio_cache.get_or_create(audio_file, speed, CACHE_SETTINGS['AUDIO_CACHE_FORMAT'],
+                                                    convert)
+        if cached is None:
+            audio_log.warning(f"Falling back to original speed for {audio_file}")
+            return audio_file
+        return cached
 
     @staticmethod
     def change_audio_speed(input_file, output_file, speed):
@@ -167,50 +1346,820 @@ class AudioManager:
                 output_file
             ]
             result = subprocess.run(command, check=True, capture_output=True, text=True)
-            logging.info(f"Audio speed changed successfully. FFmpeg output: {result.stdout}")
+            audio_log.info(f"Audio speed changed successfully. FFmpeg output: {result.stdout}")
             return True
         except subprocess.CalledProcessError as e:
-            logging.error(f"Error changing audio speed: {e}")
-            logging.error(f"FFmpeg error output: {e.stderr}")
+            audio_log.error(f"Error changing audio speed: {e}")
+            audio_log.error(f"FFmpeg error output: {e.stderr}")
             return False
 
     @staticmethod
     def check_ffmpeg():
         try:
             result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-            logging.info(f"ffmpeg version: {result.stdout.split('\\n')[0]}")
+            audio_log.info(f"ffmpeg version: {result.stdout.splitlines()[0]}")
         except FileNotFoundError:
-            logging.error("ffmpeg not found. Please install ffmpeg and add it to your PATH.")
+            audio_log.error("ffmpeg not found. Please install ffmpeg and add it to your PATH.")
             print("Error: ffmpeg not found. Please install ffmpeg and add it to your PATH.")
 
     def get_language_code(self, language: str) -> str:
         return self.LANGUAGE_CODES.get(language, language)
 
-    def __del__(self):
-        # 임시 디렉토리 삭제
-        for file in os.listdir(self.temp_dir):
-            os.remove(os.path.join(self.temp_dir, file))
-        os.rmdir(self.temp_dir)
+    def close(self):
+        self.wait_ready()
+        self.prefetcher.shutdown()
+        audio_log.info(f"Sound pool: {self.sound_pool.stats()}")
+        # 캐시 인덱스(최근 사용 시각 포함)와 길이 인덱스를 디스크에 기록
+        if self.audio_cache is not None:
+            self.audio_cache.save()
+        self.duration_index.save()
+
+
+class ColumnStore:
+    # 문자열 열들을 UTF-8 blob + 오프셋 배열로 저장한 파일을 메모리 맵으로 읽음
+    # 파일 구조: 헤더(MAGIC, 키 길이, 행 수, 열 수) | 키(JSON) | 열마다 (오프셋 위치, blob 위치) | 오프셋 배열들 | blob들
+    MAGIC = b"CNVCOL01"
+    HEADER = struct.Struct('<8sIII')
+    COLUMN_ENTRY = struct.Struct('<QQ')
+    OFFSET = struct.Struct('<I')
+
+    def __init__(self, buffer, key: str):
+        self.buffer = buffer
+        magic, key_length, self.row_count, column_count = self.HEADER.unpack_from(buffer, 0)
+        if magic != self.MAGIC:
+            raise ValueError("Invalid column store file")
+        position = self.HEADER.size
+        self.key = bytes(buffer[position:position + key_length]).decode('utf-8')
+        if self.key != key:
+            raise KeyError(self.key)
+        position += key_length
+        self.columns = [self.COLUMN_ENTRY.unpack_from(buffer, position + i * self.COLUMN_ENTRY.size)
+                        for i in range(column_count)]
+
+    def __len__(self):
+        return self.row_count
+
+    def get(self, column: int, row: int) -> str:
+        offsets_position, blob_position = self.columns[column]
+        start, end = struct.unpack_from('<II', self.buffer, offsets_position + row * self.OFFSET.size)
+        return bytes(self.buffer[blob_position + start:blob_position + end]).decode('utf-8')
+
+    def get_range(self, column: int, start: int, end: int):
+        # start..end-1 행을 오프셋 한 번, blob 복사 한 번으로 읽음
+        if end <= start:
+            return []
+        offsets_position, blob_position = self.columns[column]
+        offsets = struct.unpack_from(f'<{end - start + 1}I', self.buffer, offsets_position + start * self.OFFSET.size)
+        base = offsets[0]
+        blob = bytes(self.buffer[blob_position + base:blob_position + offsets[-1]])
+        return [blob[offsets[i] - base:offsets[i + 1] - base].decode('utf-8') for i in range(end - start)]
+
+    @classmethod
+    def encode(cls, key: str, columns) -> bytes:
+        key_bytes = key.encode('utf-8')
+        row_count = len(columns[0]) if columns else 0
+        position = cls.HEADER.size + len(key_bytes) + cls.COLUMN_ENTRY.size * len(columns)
+
+        table, parts = [], []
+        for values in columns:
+            encoded = [value.encode('utf-8') for value in values]
+            offsets = [0]
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            offsets_bytes = struct.pack(f'<{row_count + 1}I', *offsets)
+            table.append(cls.COLUMN_ENTRY.pack(position, position + len(offsets_bytes)))
+            parts.append(offsets_bytes)
+            parts.append(b''.join(encoded))
+            position += len(offsets_bytes) + offsets[-1]
+
+        header = cls.HEADER.pack(cls.MAGIC, len(key_bytes), row_count, len(columns))
+        return b''.join([header, key_bytes] + table + parts)
+
+    @classmethod
+    def build(cls, path: Path, key: str, columns):
+        # 파일로 저장하고 메모리 맵으로 다시 열며, 저장에 실패하면 메모리에 만든 내용을 그대로 사용
+        data = cls.encode(key, columns)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, path)
+            return cls.open(path, key)
+        except OSError as e:
+            data_log.error(f"Error writing {path}: {e}")
+            return cls(data, key)
+
+    @classmethod
+    def open(cls, path: Path, key: str):
+        # 파일이 없거나 키(원본 버전)가 다르면 None
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            return cls(buffer, key)
+        except (KeyError, ValueError, struct.error):
+            buffer.close()
+            return None
+
+
+Sentence = namedtuple("Sentence", ["한국어", "영어", "중국어"])
+EMPTY_SENTENCE = Sentence("", "", "")
+
+
+def display_width(text: str) -> int:
+    # 한글, 한자 등 전각 문자는 2칸으로 계산
+    return sum(2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1 for char in text)
+
+
+def wrap_subtitle_text(text: str, max_width: int) -> str:
+    # 표시 폭이 max_width를 넘지 않도록 공백 기준으로 줄을 나눔 (공백이 없으면 폭에 맞춰 자름)
+    if display_width(text) <= max_width:
+        return text
+
+    lines = []
+    while text:
+        width = 0
+        limit = len(text)
+        for i, char in enumerate(text):
+            width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+            if width > max_width:
+                limit = i
+                break
+        if limit == len(text):
+            lines.append(text)
+            break
+        split_index = text.rfind(' ', 0, limit)
+        if split_index <= 0:
+            split_index = max(limit, 1)
+        lines.append(text[:split_index].strip())
+        text = text[split_index:].strip()
+
+    return '\n'.join(lines)
+
+
+def cell_text(value) -> str:
+    # pandas read_excel(dtype=str)와 같은 규칙: 빈 칸은 "", 정수인 실수는 정수로
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def iter_workbook_rows(sheet, column_count: int, first_row: int = 0):
+    # 읽기 전용 시트에서 first_row(0부터)행부터 한 행씩 문자열 튜플로 읽음
+    for row in sheet.iter_rows(min_row=first_row + 1, max_col=column_count, values_only=True):
+        yield tuple(cell_text(value) for value in row)
+
+
+class WorkbookWindow:
+    # 엑셀을 읽기 전용으로 열어 요청한 범위와 그 뒤 lookahead개 행만 메모리에 둠 (ColumnStore와 같은 조회 방식)
+    # 뒤쪽 범위를 요청하면 열어 둔 행 스트림을 이어서 읽고 지나간 행은 버리며, 앞쪽으로 돌아갈 때만 처음부터 다시 읽음
+
+    def __init__(self, path: Path, column_count: int, key: str, lookahead: int):
+        from openpyxl import load_workbook
+
+        self.key = key
+        self.column_count = column_count
+        self.lookahead = lookahead
+        self.workbook = load_workbook(path, read_only=True, data_only=True)
+        self.sheet = self.workbook.worksheets[0]
+        if self.sheet.max_row is None:
+            # 크기 정보가 없는 파일은 한 번 훑어서 계산
+            self.sheet.calculate_dimension(force=True)
+        self.row_count = self.sheet.max_row or 0
+        self.first = 0  # rows[0]의 행 번호
+        self.rows = []
+        self._stream = None
+        self._position = 0  # 스트림에서 다음에 읽을 행 번호
+
+    def __len__(self):
+        return self.row_count
+
+    def _load(self, start: int, end: int):
+        end = min(end, self.row_count)
+        start = min(start, end)
+        if self.first <= start and end <= self.first + len(self.rows):
+            return
+        if self._stream is None or start < self.first:
+            self._stream = iter_workbook_rows(self.sheet, self.column_count, start)
+            self._position = self.first = start
+            self.rows = []
+        elif start > self._position:
+            # 창보다 뒤의 범위: 사이의 행은 읽고 버림
+            next(itertools.islice(self._stream, start - self._position - 1, None), None)
+            self._position = self.first = start
+            self.rows = []
+        else:
+            del self.rows[:start - self.first]
+            self.first = start
+
+        target = min(end + self.lookahead, self.row_count)
+        rows = list(itertools.islice(self._stream, target - self._position))
+        self.rows.extend(rows)
+        self._position += len(rows)
+        exhausted = self._position < target  # 시트 크기 정보보다 행이 적은 경우
+        # 빈 행에서 멈췄으면 뒤에 문장이 더 있는지, 서식만 남은 끝부분인지 알 수 있을 때까지 더 읽음
+        while not exhausted and self.rows and not any(self.rows[-1]) and self._position < self.row_count:
+            row = next(self._stream, None)
+            if row is None:
+                exhausted = True
+            else:
+                self.rows.append(row)
+                self._position += 1
+        if exhausted or self._position >= self.row_count:
+            # 시트 끝까지 읽었으면 끝부분의 빈 행을 버림 (compile_corpus와 같은 행 수)
+            while self.rows and not any(self.rows[-1]):
+                self.rows.pop()
+            self.row_count = self.first + len(self.rows)
+
+    def get(self, column: int, row: int) -> str:
+        self._load(row, row + 1)
+        if row >= self.row_count:
+            return ""
+        return self.rows[row - self.first][column]
+
+    def get_range(self, column: int, start: int, end: int):
+        if end <= start:
+            return []
+        self._load(start, end)
+        return [row[column] for row in self.rows[start - self.first:end - self.first]]
+
+    def close(self):
+        self.workbook.close()
 
 
 class DataManager:
-    def __init__(self):
+    COLUMNS = ["한국어", "영어", "중국어"]
+
+    def __init__(self, read_mode: str = DATA_SETTINGS['READ_MODE']):
+        self.corpus = None
+        self.wrap_table = None
         try:
-            self.data = pd.read_excel(EXCEL_FILE, header=None, names=["한국어", "영어", "중국어"])
-            logging.info(f"Loaded {len(self.data)} sentences")
+            self.corpus = self.open_corpus(read_mode)
+            data_log.info(f"Loaded {len(self.corpus)} sentences ({type(self.corpus).__name__})")
         except FileNotFoundError:
-            logging.error(f"Error: Excel file not found at {EXCEL_FILE}")
-            self.data = pd.DataFrame(columns=["한국어", "영어", "중국어"])
+            data_log.error(f"Error: Excel file not found at {EXCEL_FILE}")
+
+    @staticmethod
+    def corpus_file() -> Path:
+        # 같은 이름의 엑셀 파일이 여러 폴더에 있어도 겹치지 않도록 절대 경로 해시를 붙임
+        digest = hashlib.sha1(str(EXCEL_FILE.resolve()).encode('utf-8')).hexdigest()[:10]
+        return CACHE_SETTINGS['CORPUS_DIR'] / f"{EXCEL_FILE.stem}-{digest}.corpus"
+
+    @classmethod
+    def corpus_key(cls) -> str:
+        # 엑셀 파일의 mtime/크기가 바뀌면 키가 달라져 다시 변환
+        stat = EXCEL_FILE.stat()
+        return json.dumps({'version': 2, 'columns': cls.COLUMNS, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size},
+                          ensure_ascii=False)
+
+    @classmethod
+    def open_corpus(cls, read_mode: str):
+        key = cls.corpus_key()
+        if read_mode != "window":
+            corpus = ColumnStore.open(cls.corpus_file(), key)
+            if corpus is not None:
+                return corpus
+            if read_mode == "corpus":
+                return cls.compile_corpus(key)
+            # 다음 실행부터 변환한 파일을 쓰도록 백그라운드에서 변환
+            threading.Thread(target=cls.compile_corpus_quietly, args=(key,), name="corpus-compile",
+                             daemon=True).start()
+        return WorkbookWindow(EXCEL_FILE, len(cls.COLUMNS), key, DATA_SETTINGS['WINDOW_LOOKAHEAD'])
+
+    @classmethod
+    def compile_corpus(cls, key: str):
+        # 엑셀이 바뀌었을 때만 행을 스트리밍으로 읽어 바이너리 파일로 변환
+        from openpyxl import load_workbook
+
+        start = time.perf_counter()
+        workbook = load_workbook(EXCEL_FILE, read_only=True, data_only=True)
+        try:
+            rows = list(iter_workbook_rows(workbook.worksheets[0], len(cls.COLUMNS)))
+        finally:
+            workbook.close()
+        while rows and not any(rows[-1]):
+            rows.pop()  # 서식만 남은 끝부분의 빈 행
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in cls.COLUMNS]
+        corpus = ColumnStore.build(cls.corpus_file(), key, columns)
+        data_log.info(f"Compiled {EXCEL_FILE} to {cls.corpus_file()} in {time.perf_counter() - start:.2f} seconds")
+        return corpus
+
+    @classmethod
+    def compile_corpus_quietly(cls, key: str):
+        try:
+            cls.compile_corpus(key)
+        except Exception as e:
+            data_log.error(f"Error compiling {EXCEL_FILE}: {e}")
+
+    def __len__(self):
+        return len(self.corpus) if self.corpus is not None else 0
 
     def get_sentence(self, index: int) -> Dict[str, str]:
-        if 0 <= index < len(self.data):
-            sentence = self.data.iloc[index].to_dict()
-            logging.debug(f"Retrieved sentence {index}: {sentence}")
+        if 0 <= index < len(self):
+            sentence = {column: self.corpus.get(i, index) for i, column in enumerate(self.COLUMNS)}
+            data_log.debug(f"Retrieved sentence {index}: {sentence}")
             return sentence
         else:
-            logging.warning(f"Index {index} is out of range")
+            data_log.warning(f"Index {index} is out of range")
             return {"한국어": "", "영어": "", "중국어": ""}
 
+    def wrap_table_key(self) -> str:
+        # 문장 파일 버전과 줄바꿈 폭이 같을 때만 저장된 줄바꿈 결과를 사용
+        return json.dumps({'version': 1, 'corpus': self.corpus.key, 'widths': SUBTITLE_WRAP_WIDTHS},
+                          ensure_ascii=False)
+
+    def get_wrap_table(self):
+        # 전체 문장의 한국어/영어 자막 줄바꿈을 한 번에 계산해 저장해 두고, 세션 중에는 조회만 함
+        if self.wrap_table is None:
+            key = self.wrap_table_key()
+            path = self.corpus_file().with_suffix(".wrap")
+            self.wrap_table = ColumnStore.open(path, key)
+            if self.wrap_table is None:
+                start = time.perf_counter()
+                columns = [[wrap_subtitle_text(text, SUBTITLE_WRAP_WIDTHS[column])
+                            for text in self.corpus.get_range(i, 0, len(self))]
+                           for i, column in enumerate(self.COLUMNS[:2])]
+                self.wrap_table = ColumnStore.build(path, key, columns)
+                data_log.info(f"Built subtitle wrap table for {len(self)} sentences "
+                              f"in {time.perf_counter() - start:.2f} seconds")
+        return self.wrap_table
+
+    def get_range(self, start: int, end: int):
+        # start..end-1 (0부터 시작) 문장을 한 번에 Sentence 튜플 목록으로 반환, 범위 밖은 빈 문장
+        return self._read_rows(start, end, lambda first, last: [
+            self.corpus.get_range(i, first, last) for i in range(len(self.COLUMNS))])
+
+    def get_wrapped_range(self, start: int, end: int):
+        # get_range와 같지만 한국어/영어는 줄바꿈된 자막을 반환
+        if start >= end or not len(self):
+            return self.get_range(start, end)
+        if isinstance(self.corpus, WorkbookWindow):
+            # 범위만 읽는 모드에서는 전체 줄바꿈 표를 만들지 않고 요청한 문장만 줄바꿈
+            return [row._replace(한국어=wrap_subtitle_text(row.한국어, SUBTITLE_WRAP_WIDTHS['한국어']),
+                                 영어=wrap_subtitle_text(row.영어, SUBTITLE_WRAP_WIDTHS['영어']))
+                    for row in self.get_range(start, end)]
+        wrap_table = self.get_wrap_table()
+        return self._read_rows(start, end, lambda first, last: [
+            wrap_table.get_range(0, first, last),
+            wrap_table.get_range(1, first, last),
+            self.corpus.get_range(2, first, last)])
+
+    def _read_rows(self, start: int, end: int, read_columns):
+        first, last = max(start, 0), min(end, len(self))
+        if first < last:
+            rows = [Sentence._make(row) for row in zip(*read_columns(first, last))]
+        else:
+            rows = []
+        # 범위만 읽는 모드에서는 읽는 중에 시트 끝의 빈 행이 잘려 요청보다 적게 돌아올 수 있음
+        if first != start or first + len(rows) != end:
+            data_log.warning(f"Range {start}..{end} is partly out of range (0..{len(self)})")
+            rows = [EMPTY_SENTENCE] * (first - start if first > start else 0) + rows
+            rows += [EMPTY_SENTENCE] * (end - start - len(rows))
+        return rows
+
+
+class TimelineEvent:
+    __slots__ = ('due', 'seq', 'callback', 'args', 'cancelled')
+
+    def __init__(self, due: float, seq: int, callback, args):
+        self.due = due
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Timeline:
+    # 세션의 모든 예약 작업을 monotonic 시계 기준의 이벤트 큐 하나로 관리
+    # Tk 타이머는 가장 이른 이벤트에 대해 하나만 걸어 두고, 일시 정지 중에는 시계와 이벤트를 함께 멈춤
+
+    def __init__(self, widget, clock=time.monotonic):
+        self.widget = widget
+        self.clock = clock
+        self.events = []
+        self._seq = itertools.count()
+        self._timer_id = None
+        self._timer_due = None
+        self.paused_at = None
+        self.paused_total = 0.0
+        self.current_due = None  # 실행 중인 이벤트의 예정 시각
+
+    def now(self) -> float:
+        # 일시 정지한 시간을 뺀 세션 시각 (밀리초)
+        current = self.paused_at if self.paused_at is not None else self.clock()
+        return (current - self.paused_total) * 1000
+
+    def anchor(self) -> float:
+        # 이벤트 안에서 예약하면 실제 실행 시각이 아니라 예정 시각을 기준으로 삼아 지연이 누적되지 않음
+        return self.current_due if self.current_due is not None else self.now()
+
+    def schedule(self, delay_ms: float, callback, *args) -> TimelineEvent:
+        return self.schedule_at(self.anchor() + max(0, delay_ms), callback, *args)
+
+    def schedule_at(self, due_ms: float, callback, *args) -> TimelineEvent:
+        event = TimelineEvent(due_ms, next(self._seq), callback, args)
+        heapq.heappush(self.events, event)
+        self._arm()
+        return event
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = self.clock()
+            self._cancel_timer()
+
+    def resume(self):
+        if self.paused_at is not None:
+            self.paused_total += self.clock() - self.paused_at
+            self.paused_at = None
+            self._arm()
+
+    @property
+    def is_paused(self) -> bool:
+        return self.paused_at is not None
+
+    def clear(self):
+        self.events.clear()
+        self._cancel_timer()
+
+    def _cancel_timer(self):
+        if self._timer_id is not None:
+            self.widget.after_cancel(self._timer_id)
+            self._timer_id = None
+            self._timer_due = None
+
+    def _arm(self):
+        while self.events and self.events[0].cancelled:
+            heapq.heappop(self.events)
+        if self.paused_at is not None or not self.events:
+            self._cancel_timer()
+            return
+        due = self.events[0].due
+        if self._timer_id is not None and self._timer_due == due:
+            return
+        self._cancel_timer()
+        self._timer_due = due
+        self._timer_id = self.widget.after(max(0, int(due - self.now() + 0.999)), self._fire)
+
+    def _fire(self):
+        self._timer_id = None
+        self._timer_due = None
+        while self.events and self.paused_at is None:
+            event = self.events[0]
+            if event.cancelled:
+                heapq.heappop(self.events)
+                continue
+            if event.due > self.now() + 1:
+                break
+            heapq.heappop(self.events)
+            self.current_due = event.due
+            try:
+                event.callback(*event.args)
+            except Exception as e:
+                playback_log.exception(f"Error in timeline event {event.callback}: {e}")
+            finally:
+                self.current_due = None
+        self._arm()
+
+
+class FontFitSolver:
+    # 위젯을 다시 그리지 않고 tkinter.font로 텍스트 높이를 계산해, 라벨 영역에 맞는 가장 큰 글꼴 크기를 이진 탐색
+
+    def __init__(self, root):
+        self.root = root
+        self.fonts = {}  # (family, size, style) -> tkfont.Font
+        self.linespaces = {}  # (family, size, style) -> 줄 높이
+        self.sizes = {}  # (text, family, style, max_size, min_size, max_height, wraplength) -> 선택된 크기
+
+    def get_font(self, family: str, size: int, style: str):
+        key = (family, size, style)
+        font = self.fonts.get(key)
+        if font is None:
+            font = tkfont.Font(self.root, family=family, size=size,
+                               weight="bold" if "bold" in style else "normal",
+                               slant="italic" if "italic" in style else "roman")
+            self.fonts[key] = font
+            self.linespaces[key] = font.metrics("linespace")
+        return font
+
+    @staticmethod
+    def wrap_lines(text: str, font, wraplength: int):
+        # Tk 라벨처럼 wraplength(픽셀)를 넘는 줄은 단어 단위로 나누고,
+        # 한 단어가 wraplength보다 넓으면(띄어쓰기 없는 중국어 등) 글자 단위로 나눔
+        lines = []
+        for paragraph in text.split('\n'):
+            if wraplength <= 0 or font.measure(paragraph) <= wraplength:
+                lines.append(paragraph)
+                continue
+            current = ""
+            for word in paragraph.split(' '):
+                candidate = f"{current} {word}" if current else word
+                if font.measure(candidate) <= wraplength:
+                    current = candidate
+                    continue
+                if current:
+                    lines.append(current)
+                while len(word) > 1 and font.measure(word) > wraplength:
+                    split = FontFitSolver._fitting_prefix(word, font, wraplength)
+                    lines.append(word[:split])
+                    word = word[split:]
+                current = word
+            lines.append(current)
+        return lines
+
+    @staticmethod
+    def _fitting_prefix(word: str, font, wraplength: int) -> int:
+        # wraplength 안에 들어가는 가장 긴 앞부분의 길이(최소 1글자)를 이진 탐색
+        low, high = 1, len(word) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.measure(word[:middle]) <= wraplength:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def count_lines(self, text: str, font, wraplength: int) -> int:
+        return len(self.wrap_lines(text, font, wraplength))
+
+    @staticmethod
+    def label_padding(label) -> int:
+        return 2 * sum(int(float(label.cget(option))) for option in ("borderwidth", "highlightthickness", "pady"))
+
+    def text_height(self, text: str, family: str, size: int, style: str, wraplength: int) -> int:
+        font = self.get_font(family, size, style)
+        return self.count_lines(text, font, wraplength) * self.linespaces[(family, size, style)]
+
+    def label_height(self, label, text: str, font_spec) -> int:
+        family, size, style = font_spec
+        wraplength = int(float(label.cget("wraplength")))
+        return self.text_height(text, family, size, style, wraplength) + self.label_padding(label)
+
+    def fit_label(self, label, text: str, font_spec, max_height: int, min_size: int = 10) -> int:
+        wraplength = int(float(label.cget("wraplength")))
+        return self.fit(text, font_spec, max_height - self.label_padding(label), wraplength, min_size)
+
+    def fit(self, text: str, font_spec, available: int, wraplength: int, min_size: int = 10) -> int:
+        family, max_size, style = font_spec
+        key = (text, family, style, max_size, min_size, available, wraplength)
+        size = self.sizes.get(key)
+        if size is not None:
+            return size
+
+        if not text or self.text_height(text, family, max_size, style, wraplength) <= available:
+            size = max_size
+        else:
+            low, high = min_size, max_size - 1
+            size = min_size
+            while low <= high:
+                middle = (low + high) // 2
+                if self.text_height(text, family, middle, style, wraplength) <= available:
+                    size = middle
+                    low = middle + 1
+                else:
+                    high = middle - 1
+
+        self.sizes[key] = size
+        return size
+
+
+class SettingsStore:
+    # 설정 변경을 메모리에 모았다가 조용한 구간이 지나면 기록 스레드 하나에서 한 번만 기록
+    # (슬라이더를 끄는 동안 Tk 스레드에서 파일을 쓰지 않음), 임시 파일에 쓴 뒤 교체해 깨진 설정 파일이 남지 않음
+
+    def __init__(self, path: Path, delay_ms: int):
+        self.path = Path(path)
+        self.delay = delay_ms / 1000
+        self._pending = None
+        self._due = 0.0  # 마지막 변경 후 기록할 monotonic 시각
+        self._writer = None
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # 기록 순서를 정하는 잠금: 이 잠금을 잡은 뒤에 최신 설정을 꺼내므로 나중에 기록한 쪽이 항상 최신
+        self._write_lock = threading.Lock()
+
+    def save(self, settings: dict):
+        with self._changed:
+            self._pending = dict(settings)
+            self._due = time.monotonic() + self.delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+                self._writer.start()
+            self._changed.notify()
+
+    def _run(self):
+        while True:
+            with self._changed:
+                while self._pending is None or time.monotonic() < self._due:
+                    self._changed.wait(None if self._pending is None else self._due - time.monotonic())
+            self.flush()
+
+    def flush(self):
+        # 아직 기록하지 않은 변경을 바로 기록 (종료 시 호출)
+        with self._write_lock:
+            with self._lock:
+                settings, self._pending = self._pending, None
+            if settings is None:
+                return
+            try:
+                self._write_file(settings)
+            except OSError as e:
+                ui_log.error(f"Error saving settings to {self.path}: {e}")
+
+    def write(self, settings: dict):
+        # 동기 기록 (실패하면 OSError)
+        with self._write_lock:
+            self._write_file(settings)
+
+    def _write_file(self, settings: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_name(f".{self.path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.path)
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+    def replace(self, settings: dict):
+        # 기다리던 변경을 버리고 주어진 설정을 바로 기록
+        with self._write_lock:
+            with self._lock:
+                self._pending = None
+            self._write_file(settings)
+
+
+class StartupTimer:
+    # 시작 단계별 소요 시간 기록 (백그라운드 단계는 작업 스레드에서 기록)
+
+    def __init__(self, origin: float):
+        self.origin = origin
+        self.phases = {}  # 단계 이름 -> (시작, 끝) perf_counter 값
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float = None):
+        with self._lock:
+            self.phases[name] = (start, time.perf_counter() if end is None else end)
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def measure_call(self, name: str, func, *args):
+        with self.measure(name):
+            return func(*args)
+
+    def report(self) -> str:
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: item[1][0])
+        return " | ".join(f"{name} {(end - start) * 1000:.0f}ms (+{(start - self.origin) * 1000:.0f}ms)"
+                          for name, (start, end) in phases)
+
+
+def percentile(values, fraction: float) -> float:
+    # 정렬된 값 사이를 선형 보간한 백분위수
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class SessionTelemetry:
+    # 문장/언어별 자막 표시, 음성 시작, 음성 끝의 예정 시각과 실제 시각, 음성 준비 시간을 문장마다 JSONL 한 줄로 기록
+    # 시각은 문장 시작 기준 밀리초 (Timeline 시계라 일시 정지한 시간은 빠짐)
+    # 음성 끝은 재생 종료 확인 주기(AUDIO_POLL_INTERVAL)만큼 늦게 잡힐 수 있음
+
+    def __init__(self, clock, settings=TELEMETRY_SETTINGS):
+        self.clock = clock
+        self.settings = settings
+        self.session = time.strftime("%Y%m%d-%H%M%S")
+        self.current = None  # 진행 중인 문장
+        self.drifts = []  # 모든 이벤트의 (실제 - 예정) 시각
+        self.gaps = []  # 앞 문장의 마지막 음성 끝 ~ 다음 문장의 첫 음성 시작
+        self.planned_total = 0.0
+        self.actual_total = 0.0
+        self.sentence_count = 0
+        self.last_audio_end = None
+        self.logger = None
+
+    def start_sentence(self, sentence_number: int, start_ms: float, plan: dict, planned_ms: float):
+        # plan: (언어, 이벤트) -> 문장 시작 기준 예정 시각, planned_ms: 다음 문장까지의 예정 시간
+        self.finish_sentence()
+        self.current = {'sentence': sentence_number, 'start': start_ms, 'plan': plan, 'planned_ms': planned_ms,
+                        'actual': {}, 'prepare': {}}
+
+    def mark(self, sentence_number: int, language: str, event: str):
+        # 같은 이벤트가 여러 번 일어나면 처음 시각만 기록 (시작하지 않은 문장의 이벤트는 무시)
+        if self.current is None or self.current['sentence'] != sentence_number:
+            return
+        self.current['actual'].setdefault((language, event), self.clock() - self.current['start'])
+
+    def add_preparation(self, sentence_number: int, language: str, timings: dict, prefetched: bool = None):
+        if self.current is None or self.current['sentence'] != sentence_number:
+            return
+        prepare = self.current['prepare'].setdefault(language, {})
+        for stage, seconds in timings.items():
+            prepare[stage] = prepare.get(stage, 0.0) + seconds * 1000
+        if prefetched is not None:
+            prepare['prefetched'] = prefetched
+
+    def session_break(self):
+        # 휴식 시간을 문장 사이 간격에 넣지 않음
+        self.finish_sentence()
+        self.last_audio_end = None
+
+    def finish_sentence(self):
+        current, self.current = self.current, None
+        if current is None:
+            return
+        start, plan, actual = current['start'], current['plan'], current['actual']
+        actual_ms = self.clock() - start
+
+        events = {}
+        for language, event in sorted(plan.keys() | actual.keys()):
+            scheduled, happened = plan.get((language, event)), actual.get((language, event))
+            entry = {'scheduled': scheduled, 'actual': happened}
+            if scheduled is not None and happened is not None:
+                entry['drift'] = happened - scheduled
+                self.drifts.append(entry['drift'])
+            events.setdefault(AudioManager.LANGUAGE_CODES[language], {})[event] = entry
+
+        audio_starts = [t for (_, event), t in actual.items() if event == "audio_start"]
+        audio_ends = [t for (_, event), t in actual.items() if event == "audio_end"]
+        gap = None
+        if audio_starts and self.last_audio_end is not None:
+            gap = start + min(audio_starts) - self.last_audio_end
+            self.gaps.append(gap)
+        if audio_ends:
+            self.last_audio_end = start + max(audio_ends)
+
+        self.sentence_count += 1
+        self.planned_total += current['planned_ms']
+        self.actual_total += actual_ms
+        self.write({
+            'session': self.session,
+            'sentence': current['sentence'],
+            'start_ms': start,
+            'planned_ms': current['planned_ms'],
+            'actual_ms': actual_ms,
+            'gap_ms': gap,
+            'events': events,
+            'prepare_ms': {AudioManager.LANGUAGE_CODES[language]: prepare
+                           for language, prepare in current['prepare'].items()},
+        })
+
+    def write(self, record: dict):
+        if not self.settings['ENABLED']:
+            return
+        if self.logger is None:
+            self.logger = logging.getLogger("basic.telemetry")
+            self.logger.propagate = False  # 앱 로그 파일과 콘솔에는 남기지 않음
+            if not self.logger.handlers:
+                try:
+                    handler = GzipRotatingFileHandler(self.settings['FILE'], self.settings['MAX_BYTES'],
+                                                      self.settings['BACKUP_COUNT'])
+                except OSError as e:
+                    playback_log.error(f"Error opening telemetry file {self.settings['FILE']}: {e}")
+                    self.settings = {**self.settings, 'ENABLED': False}
+                    return
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                self.logger.addHandler(start_log_queue(handler))
+            self.logger.setLevel(logging.INFO)
+        self.logger.info(json.dumps(record, ensure_ascii=False))
+
+    def summary(self) -> str:
+        self.finish_sentence()
+        if not self.sentence_count:
+            return None
+        lines = [f"Session timing: {self.sentence_count} sentences"]
+        if self.drifts:
+            lines.append(f"  drift  p50 {percentile(self.drifts, 0.5):.0f} ms, "
+                         f"p95 {percentile(self.drifts, 0.95):.0f} ms, max {max(self.drifts):.0f} ms")
+        if self.gaps:
+            lines.append(f"  gap    p50 {percentile(self.gaps, 0.5):.0f} ms, p95 {percentile(self.gaps, 0.95):.0f} ms")
+        overrun = self.actual_total - self.planned_total
+        lines.append(f"  total  planned {self.planned_total / 1000:.1f} s, actual {self.actual_total / 1000:.1f} s, "
+                     f"overrun {overrun / 1000:+.2f} s")
+        return "\n".join(lines)
+
 
 class ConversationApp(tk.Tk):
     LANG_SETTINGS = {
@@ -228,6 +2177,16 @@ class ConversationApp(tk.Tk):
         'next_sentence_delay': 1
     }
 
+    # Define constants
+    BG_COLOR = "gray3"
+    FONT_BREAK = ("NanumBarunGothic", 120, "bold")
+    FONT_COUNTDOWN = ("NanumBarunGothic", 30, "bold")
+    GENERAL_SETTINGS = {
+        'BREAK_TIME': 8000,
+        'FINAL_MESSAGE_DISPLAY_TIME': 20000,
+        'FINAL_MESSAGE_EXTRA_DELAY': 1000,  # 1 -second delay after countdown
+    }
+
     DEFAULT_SETTINGS = {
         'start_sentence': 1,
         'end_sentence': 100,
@@ -241,17 +2200,23 @@ class ConversationApp(tk.Tk):
         'play_중국어': False
     }
 
-    def __init__(self):
+    def __init__(self, startup_timer: StartupTimer = None):
         super().__init__()
-        logging.info("ConversationApp 초기화 중")
+        ui_log.info("ConversationApp 초기화 중")
 
         self.title(app_title)
         self.geometry(WINDOW_SIZE)
         self.configure(bg=BG_COLOR)
 
         # 여기에 모든 인스턴스 속성을 초기화합니다
+        # 믹서/효과음과 문장 데이터는 시작 화면을 띄우는 동안 백그라운드에서 준비
+        self.startup_timer = startup_timer or StartupTimer(time.perf_counter())
+        startup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
         self.audio_manager = AudioManager()
-        self.data_manager = DataManager()
+        self.audio_future = startup_executor.submit(self.startup_timer.measure_call, "audio",
+                                                    self.audio_manager.initialize)
+        self.data_manager_future = startup_executor.submit(self.startup_timer.measure_call, "data", DataManager)
+        startup_executor.shutdown(wait=False)
         self.message_label = None  # message_label을 여기서 초기화
         self.countdown_label = None
 
@@ -283,8 +2248,16 @@ class ConversationApp(tk.Tk):
 
         self.prepared_subtitles = {}
 
+        self.settings_store = SettingsStore(CONFIG_FILE, GENERAL_SETTINGS['SETTINGS_SAVE_DELAY'])
+
         # 한영 동시 자막 옵션 추가
         self.show_english_chinese_simultaneously = tk.BooleanVar(value=True)
+        # 세션 전체 음성을 하나의 트랙으로 합쳐 재생하는 옵션
+        self.premixed_session = tk.BooleanVar(value=False)
+        self.session_frames = []  # 통합 트랙 재생 시 (시작 ms, 화면 상태)
+        self.session_frame_index = 0
+        self.session_total = 0
+        self.session_track_file = None  # 통합 트랙 임시 WAV 파일 (종료 시 삭제)
         self.audio_languages = []
         self.start_time = 0
 
@@ -294,7 +2267,6 @@ class ConversationApp(tk.Tk):
         self.chinese_subtitle_delay = tk.DoubleVar(self, value=self.default_delays['chinese_subtitle_delay'])
         self.next_sentence_delay = tk.DoubleVar(self, value=self.default_delays['next_sentence_delay'])
 
-        self.data_manager = DataManager()
         # 한국어와 영어 음성 속도를 위한 별도의 변수
         self.korean_audio_speed = tk.DoubleVar(self, value=2.0)
         self.english_audio_speed = tk.DoubleVar(self, value=2.0)
@@ -323,19 +2295,11 @@ class ConversationApp(tk.Tk):
         self.next_sentence_entry = None
         self.texts = {"Korean": "", "English": "", "Chinese": ""}
 
-        # Define constants
-        self.BG_COLOR = "gray3"
-        self.FONT_BREAK = ("NanumBarunGothic", 120, "bold")
-        self.FONT_COUNTDOWN = ("NanumBarunGothic", 30, "bold")
-        self.GENERAL_SETTINGS = {
-            'BREAK_TIME': 8000,
-            'FINAL_MESSAGE_DISPLAY_TIME': 20000,
-            'FINAL_MESSAGE_EXTRA_DELAY': 1000,  # 1 -second delay after countdown
-        }
-
         self.is_paused = False
         self.pause_time = 0
         self.pause_button = None
+        self.audio_sequence_token = 0
+        self.audio_poll_event = None
 
         # 음성 재생 상태를 추적하기 위한 변수 추가
         self.playing_korean = False
@@ -356,12 +2320,38 @@ class ConversationApp(tk.Tk):
         self.qr_image = None
         self._initialize_qr_code()
 
+        # 카운트다운/대화/휴식/종료 화면은 한 번만 만들고 전환하며 재사용
+        self.screens = {}
+        self.current_screen = None
+        self.break_countdown_label = None
+        self.final_countdown_label = None
+
+        self.font_solver = FontFitSolver(self)
+        self.timeline = Timeline(self)
+        self.telemetry = SessionTelemetry(self.timeline.now)
+        self.audio_manager.telemetry = self.telemetry
+
         self.create_initial_widgets()
-        logging.info("초기 위젯 생성됨")
+        ui_log.info("초기 위젯 생성됨")
         self.update_speed_display()  # 초기 디스플레이 업데이트
         self.audio_manager.play_sound("drum")
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
-        logging.info("ConversationApp 초기화 완료")
+        self.after_idle(self.report_startup)
+        ui_log.info("ConversationApp 초기화 완료")
+
+    @property
+    def data_manager(self):
+        # 백그라운드에서 읽는 중이면 끝날 때까지 기다림
+        return self.data_manager_future.result()
+
+    def report_startup(self):
+        # 첫 화면이 그려진 시점을 기록하고, 백그라운드 단계까지 끝나면 단계별 시간 출력
+        if "first_paint" not in self.startup_timer.phases:
+            self.startup_timer.record("first_paint", self.startup_timer.origin)
+        if not (self.audio_future.done() and self.data_manager_future.done()):
+            self.after(50, self.report_startup)
+            return
+        ui_log.info(f"Startup timing: {self.startup_timer.report()}")
 
     def create_initial_widgets(self):
         # 초기 화면의 위젯들을 생성하는 메서드
@@ -376,27 +2366,29 @@ class ConversationApp(tk.Tk):
     def _initialize_qr_code(self):
         qr_image_path = os.path.join("..", "qrcode.jpg")
         if os.path.exists(qr_image_path):
-            logging.info(f"QR 코드 이미지 파일 확인됨: {qr_image_path}")
+            ui_log.info(f"QR 코드 이미지 파일 확인됨: {qr_image_path}")
             self.qr_image_path = qr_image_path
         else:
-            logging.warning(f"QR 코드 이미지 파일을 찾을 수 없습니다: {qr_image_path}")
+            ui_log.warning(f"QR 코드 이미지 파일을 찾을 수 없습니다: {qr_image_path}")
             self.qr_image_path = None
 
     def add_qr_code(self, parent_frame):
         if self.qr_image_path:
             try:
-                img = Image.open(self.qr_image_path)
-                img = img.resize((100, 100))  # Basic resize without specifying method
-                photo = ImageTk.PhotoImage(img)
+                if self.qr_image is None:
+                    img = Image.open(self.qr_image_path)
+                    img = img.resize((100, 100))  # Basic resize without specifying method
+                    self.qr_image = ImageTk.PhotoImage(img)
+                photo = self.qr_image
                 qr_label = tk.Label(parent_frame, bg=self.BG_COLOR)
                 qr_label.image = photo  # Keep a reference!
                 qr_label.configure(image=photo)
                 qr_label.pack(side=tk.LEFT)
-                logging.info("QR 코드 이미지가 성공적으로 표시되었습니다.")
+                ui_log.info("QR 코드 이미지가 성공적으로 표시되었습니다.")
             except Exception as e:
-                logging.error(f"QR 코드 이미지 표시 중 오류 발생: {e}")
+                ui_log.error(f"QR 코드 이미지 표시 중 오류 발생: {e}")
         else:
-            logging.warning("QR 코드 이미지를 표시할 수 없습니다.")
+            ui_log.warning("QR 코드 이미지를 표시할 수 없습니다.")
 
     def add_message_and_qr(self, parent_frame):
         message_frame = tk.Frame(parent_frame, bg=self.BG_COLOR)
@@ -408,13 +2400,50 @@ class ConversationApp(tk.Tk):
 
         self.add_qr_code(message_frame)
 
-    def show_final_message(self):
-        for widget in self.winfo_children():
-            widget.destroy()
+    def show_screen(self, name):
+        # 처음 요청될 때만 화면을 만들고, 이후에는 pack 전환만 함
+        screen = self.screens.get(name)
+        is_new = screen is None
+        if is_new:
+            screen = tk.Frame(self, bg=BG_COLOR)
+            self.screens[name] = screen
+
+        if self.current_screen is not screen:
+            if self.current_screen is not None:
+                self.current_screen.pack_forget()
+            screen.pack(expand=True, fill="both")
+            self.current_screen = screen
+
+        if is_new:
+            getattr(self, f"_build_{name}_screen")(screen)
+            ui_log.info(f"{name} 화면 생성됨")
+        return screen
+
+    def show_final_message(self, play_sound=True):
+        self.audio_manager.prefetcher.cancel()
+        summary = self.telemetry.summary()
+        if summary:
+            print(summary)
+            # basic.playback은 WARNING부터 기록하므로 세션 요약은 앱 로거로 남김
+            app_log.info(summary)
+        self.show_screen("final")
+        self.final_countdown_label.config(text="")
+        self.update()
 
-        final_frame = tk.Frame(self, bg=self.BG_COLOR)
-        final_frame.pack(expand=True, fill="both")
+        if play_sound:
+            self.play_final_sound()
 
+        def update_countdown(remaining):
+            if remaining > 0:
+                self.final_countdown_label.config(text=f"{remaining}")
+                self.timeline.schedule(1000, update_countdown, remaining - 1)
+            else:
+                self.final_countdown_label.config(text="0")  # 카운트다운 종료 시 0 표시
+                self.timeline.schedule(self.GENERAL_SETTINGS['FINAL_MESSAGE_EXTRA_DELAY'], self.finish_application)
+
+        update_countdown(self.GENERAL_SETTINGS['FINAL_MESSAGE_DISPLAY_TIME'] // 1000)
+
+    def _build_final_screen(self, final_frame):
         # 전체 내용을 담을 중앙 프레임
         center_frame = tk.Frame(final_frame, bg=self.BG_COLOR)
         center_frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -429,9 +2458,9 @@ class ConversationApp(tk.Tk):
         good_job_label.pack(side=tk.LEFT, padx=(0, 20))
 
         # 카운트다운 라벨
-        countdown_label = tk.Label(good_job_countdown_frame, text="", font=self.FONT_COUNTDOWN, fg="yellow",
-                                   bg=self.BG_COLOR)
-        countdown_label.pack(side=tk.LEFT)
+        self.final_countdown_label = tk.Label(good_job_countdown_frame, text="", font=self.FONT_COUNTDOWN,
+                                              fg="yellow", bg=self.BG_COLOR)
+        self.final_countdown_label.pack(side=tk.LEFT)
 
         # 메시지와 QR 코드를 위한 프레임
         message_qr_frame = tk.Frame(center_frame, bg=self.BG_COLOR)
@@ -445,27 +2474,19 @@ class ConversationApp(tk.Tk):
         # QR 코드 추가
         self.add_qr_code(message_qr_frame)
 
-        self.update()
-
-        self.play_final_sound()
-
-        def update_countdown(remaining):
-            if remaining > 0:
-                countdown_label.config(text=f"{remaining}")
-                self.after(1000, update_countdown, remaining - 1)
-            else:
-                countdown_label.config(text="0")  # 카운트다운 종료 시 0 표시
-                self.after(self.GENERAL_SETTINGS['FINAL_MESSAGE_EXTRA_DELAY'], self.finish_application)
+    def show_countdown(self):
+        self.show_screen("countdown")
+        self.countdown_label.config(text="")
+        self.message_label.config(text="")
 
-        update_countdown(self.GENERAL_SETTINGS['FINAL_MESSAGE_DISPLAY_TIME'] // 1000)
+        self.countdown_value = GENERAL_SETTINGS['COUNTDOWN_START']
 
-    def show_countdown(self):
-        for widget in self.winfo_children():
-            widget.destroy()
+        self.play_countdown_message()
+        self.type_message(COUNTDOWN_MESSAGE)
 
-        countdown_frame = tk.Frame(self, bg=BG_COLOR)
-        countdown_frame.pack(expand=True, fill="both")
+        self.update_countdown()
 
+    def _build_countdown_screen(self, countdown_frame):
         # 숫자를 위한 프레임 (화면의 중앙에 위치)
         number_frame = tk.Frame(countdown_frame, bg=BG_COLOR)
         number_frame.place(relx=0.5, rely=0.42, anchor="center", relwidth=1, relheight=0.5)
@@ -486,23 +2507,16 @@ class ConversationApp(tk.Tk):
                                       justify="center")
         self.message_label.place(relx=0.5, rely=0.5, anchor="center")
 
-        self.countdown_value = GENERAL_SETTINGS['COUNTDOWN_START']
-
-        self.play_countdown_message()
-        self.type_message("이 영상은 몸에 좋은 WAV 파일로 녹화했습니다.")
-
-        self.update_countdown()
-
     def type_message(self, message, index=0):
         if index < len(message):
             self.message_label.config(text=message[:index + 1])
-            self.after(95, self.type_message, message, index + 1)
+            self.timeline.schedule(95, self.type_message, message, index + 1)
 
     def update_countdown(self):
         if self.countdown_value > 0:
             self.countdown_label.config(text=str(self.countdown_value))
             self.countdown_value -= 1
-            self.after(GENERAL_SETTINGS['COUNTDOWN_INTERVAL'], self.update_countdown)
+            self.timeline.schedule(GENERAL_SETTINGS['COUNTDOWN_INTERVAL'], self.update_countdown)
         else:
             self.finish_countdown()
 
@@ -514,14 +2528,19 @@ class ConversationApp(tk.Tk):
 
     def setup_conversation_screen(self):
         # logging.info("대화 화면 설정 중")
+        self.show_screen("conversation")
 
-        # 기존의 모든 위젯 제거
-        for widget in self.winfo_children():
-            widget.destroy()
+        # 이전 문장의 내용만 비움
+        self.sentence_label.config(text="")
+        for label in self.lang_labels.values():
+            label.config(text="")
+            label.adjust_font_size()
+
+        self.update_idletasks()
+        playback_log.info("대화 화면 설정 완료")
 
-        # 메인 프레임 생성
-        self.main_frame = tk.Frame(self, bg=BG_COLOR)
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
+    def _build_conversation_screen(self, main_frame):
+        self.main_frame = main_frame
 
         # 상단 프레임 (타이틀 및 문장 번호)
         self._create_top_frame()
@@ -532,10 +2551,6 @@ class ConversationApp(tk.Tk):
         # 하단 프레임 (버튼 등)
         self._create_bottom_frame()
 
-        self.update_idletasks()
-        self.update()
-        logging.info("대화 화면 설정 완료")
-
     def toggle_pause_resume(self):
         if self.is_paused:
             self.resume_conversation()
@@ -546,8 +2561,13 @@ class ConversationApp(tk.Tk):
         if not self.is_paused:
             self.is_paused = True
             self.pause_time = time.time()
+            # 재생 중인 음성과 예약된 자막/음성 이벤트를 그 자리에서 멈춤 (재개 시 멈춘 시간만큼 뒤로 밀림)
+            self.audio_manager.pause_playback()
+            self.timeline.pause()
+            # 준비가 끝난 음성은 재개 후 다시 쓰도록 남겨 둠
+            self.audio_manager.prefetcher.cancel(keep_completed=True)
             self.pause_button.config(text="Resume")
-            logging.info("대화 일시 정지")
+            playback_log.info("대화 일시 정지")
 
     def resume_conversation(self):
         if self.is_paused:
@@ -555,10 +2575,14 @@ class ConversationApp(tk.Tk):
             pause_duration = time.time() - self.pause_time
             self.start_time += pause_duration
             self.pause_button.config(text="Pause")
-            logging.info(f"대화 재개 (정지 시간: {pause_duration:.2f}초)")
+            playback_log.info(f"대화 재개 (정지 시간: {pause_duration:.2f}초)")
 
-            # 현재 진행 중이던 작업 재개
-            self.play_audio_and_show_subtitles(self.audio_languages)
+            # 멈춘 샘플 위치와 세션 시각에서 그대로 이어서 진행 (문장을 처음부터 다시 예약하지 않음)
+            # 재생 중인 문장은 이미 준비되어 있으므로 다음 문장부터, 정지 때 취소된 것만 다시 준비
+            # (준비가 끝나 남겨 둔 음성은 prefetch가 키로 건너뜀)
+            self.prefetch_upcoming_audio(self.current_sentence + 1)
+            self.timeline.resume()
+            self.audio_manager.resume_playback()
 
     def _create_speed_sliders(self):
         speed_frame = tk.Frame(self, bg=BG_COLOR)
@@ -578,43 +2602,57 @@ class ConversationApp(tk.Tk):
                  fg="white", bg="gray20", troughcolor="gray40", highlightthickness=0,
                  command=self.on_speed_change).pack(side=tk.LEFT)
 
-    def update_speed_display(self):
-        display_parts = [f"{app_title} {self.end_sentence.get()}"]  # 수정된 부분
+    @staticmethod
+    def speed_display_text(end_sentence, korean_speed=None, english_speed=None):
+        # 음성을 재생하지 않는 언어는 None
+        display_parts = [f"{app_title} {end_sentence}"]  # 수정된 부분
 
-        if self.audio_vars["한국어"].get():
-            korean_speed = self.initial_korean_speed.get()
+        if korean_speed is not None:
             display_parts.append(f"한글{korean_speed:.1f}배")
 
-        if self.audio_vars["영어"].get():
-            english_speed = self.initial_english_speed.get()
+        if english_speed is not None:
             display_parts.append(f"영어{english_speed:.1f}배")
 
-        display_text = " | ".join(display_parts)
+        return " | ".join(display_parts)
+
+    def update_speed_display(self):
+        display_text = self.speed_display_text(
+            self.end_sentence.get(),
+            self.initial_korean_speed.get() if self.audio_vars["한국어"].get() else None,
+            self.initial_english_speed.get() if self.audio_vars["영어"].get() else None)
 
         if hasattr(self, 'title_speed_label') and self.title_speed_label.winfo_exists():
             self.title_speed_label.config(text=display_text)
         else:
-            logging.info(f"Speed display updated: {display_text}")
+            ui_log.info(f"Speed display updated: {display_text}")
 
     def on_speed_change(self, _):
         self.save_settings()
         self.update_speed_display()
 
     def start_conversation(self):
-        logging.info("Starting conversation")
+        ui_log.info("Starting conversation")
         try:
             start = int(self.start_sentence.get())
             end = int(self.end_sentence.get())
 
             self.save_settings()
+            # 시작 화면 뒤에서 진행 중인 믹서 초기화가 끝나야 재생 가능
+            self.audio_manager.wait_ready()
+
+            audio_languages = [lang for lang in ["한국어", "영어", "중국어"] if self.audio_vars[lang].get()]
+            if not self.confirm_audio_files(start, end, audio_languages):
+                return
 
             # 현재 설정된 속도를 오디오 재생 속도로 설정
             self.korean_audio_speed.set(self.initial_korean_speed.get())
             self.english_audio_speed.set(self.initial_english_speed.get())
 
+            # 시작 화면 위젯 제거 (이후 화면들은 show_screen으로 재사용)
             for widget in self.winfo_children():
-                widget.destroy()
-            logging.info("All widgets destroyed")
+                if widget not in self.screens.values():
+                    widget.destroy()
+            ui_log.info("Initial widgets destroyed")
 
             self.current_sentence = start
             self.end = end
@@ -622,27 +2660,146 @@ class ConversationApp(tk.Tk):
             # 자막 미리 준비
             self.prepare_subtitles(start, end)
 
+            self.audio_languages = audio_languages
+            if self.premixed_session.get() and self.start_session_track(start, end):
+                return
+
+            # 카운트다운 동안 첫 문장들의 음성 미리 준비
+            self.prefetch_upcoming_audio(start)
+
             self.setup_conversation_screen()
             self.update_speed_display()  # 대화 시작 시 배속 정보 업데이트
-            logging.info("Conversation screen setup completed")
+            ui_log.info("Conversation screen setup completed")
 
             self.show_countdown()
-            logging.info("Countdown started")
+            ui_log.info("Countdown started")
 
         except ValueError:
-            logging.error("Invalid input for start or end sentence")
+            ui_log.error("Invalid input for start or end sentence")
             messagebox.showerror("입력 오류", "시작과 끝 문장 번호는 숫자여야 합니다.")
 
-        logging.info("Start conversation method completed")
+        ui_log.info("Start conversation method completed")
+
+    def confirm_audio_files(self, start, end, languages) -> bool:
+        # 카운트다운 전에 선택한 범위의 빠진/남는 음성 파일을 알리고, 그대로 시작할지 물음
+        problems = self.audio_manager.manifest.check(start, end, languages)
+        if not problems:
+            return True
+        for problem in problems:
+            ui_log.warning(f"Audio files: {problem}")
+        return messagebox.askokcancel("음성 파일 확인", "\n".join(problems) + "\n\n그대로 시작할까요?")
+
+    def start_session_track(self, start, end):
+        # 세션 전체 음성(효과음, 문장 음성, 북소리)을 하나의 트랙으로 합쳐 재생하고,
+        # 화면은 트랙의 재생 위치를 따라 바꿈 (문장마다 음성을 불러오거나 타이머로 이어 붙이지 않음)
+        # 믹서 초기화에 실패했으면 False를 반환해 문장별 재생으로 진행
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            playback_log.error("Audio mixer is not initialized, playing sentence by sentence")
+            return False
+        frequency, _, channels = mixer
+
+        self.setup_conversation_screen()
+        self.show_screen("countdown")
+        self.countdown_label.config(text="")
+        self.message_label.config(text="음성 준비 중...")
+
+        settings = SessionSettings(self.current_settings())
+        renderer = SessionAudioRenderer(start, end, settings, frequency, channels)
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.render_session_track, renderer, dict(self.prepared_subtitles))
+        executor.shutdown(wait=False)
+        self.timeline.schedule(100, self._wait_for_session_track, future, start)
+        return True
+
+    def render_session_track(self, renderer, subtitles):
+        # 작업 스레드에서 실행 (Tk 호출 없음)
+        render_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=PREFETCH_SETTINGS['WORKERS']) as executor:
+            clips = renderer.prepare_clips(executor, self.audio_manager.load_clip_samples)
+        # 트랙을 메모리에 두지 않고 임시 파일로 기록해 스트리밍 재생
+        fd, track = tempfile.mkstemp(prefix="session_", suffix=".wav")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                frames, total = renderer.render(subtitles, clips, f)
+        except BaseException:
+            os.remove(track)
+            raise
+        playback_log.info(f"Session track rendered: {total / 1000:.1f} s in {time.perf_counter() - render_start:.1f} s")
+        return frames, total, track
+
+    def _wait_for_session_track(self, future, start):
+        if not future.done():
+            self.timeline.schedule(100, self._wait_for_session_track, future, start)
+            return
+        try:
+            self.session_frames, self.session_total, track = future.result()
+        except Exception as e:
+            # 트랙을 만들 수 없으면 문장별 재생으로 진행
+            playback_log.error(f"Error rendering session track, playing sentence by sentence: {e}")
+            self.session_frames = []
+            self.prefetch_upcoming_audio(start)
+            self.setup_conversation_screen()
+            self.show_countdown()
+            return
+
+        self.session_frame_index = 0
+        self.session_track_file = track
+        self.audio_manager.play_track(track)
+        self.timeline.schedule(0, self._sync_session_track)
+
+    def _sync_session_track(self):
+        # 트랙의 재생 위치까지의 화면 상태를 적용 (자막이 음성 시계를 따라감)
+        position = self.audio_manager.track_position()
+        if position is None:
+            position = self.session_total
+        state = None
+        while (self.session_frame_index < len(self.session_frames)
+               and self.session_frames[self.session_frame_index][0] <= position):
+            state = self.session_frames[self.session_frame_index][1]
+            self.session_frame_index += 1
+            if state[0] == "final":
+                break
+
+        # 종료 화면부터는 문장별 재생과 같은 경로로 마무리 (종료 효과음은 이미 트랙에 들어 있음)
+        if (state is not None and state[0] == "final") or position >= self.session_total:
+            self.show_final_message(play_sound=False)
+            return
+        if state is not None:
+            self.apply_session_state(state)
+        self.timeline.schedule(GENERAL_SETTINGS['AUDIO_POLL_INTERVAL'], self._sync_session_track)
+
+    def apply_session_state(self, state):
+        # build_session_plan의 화면 상태를 위젯에 반영 (바뀐 라벨만 다시 그림)
+        screen = state[0]
+        self.show_screen(screen)
+        if screen == "countdown":
+            self.countdown_label.config(text=state[1])
+            self.message_label.config(text=state[2])
+        elif screen == "conversation":
+            title, number = state[1], state[2]
+            self.title_speed_label.config(text=title)
+            self.sentence_label.config(text=number)
+            if number:
+                self.current_sentence = int(number[3:])
+            for language, text in zip(["한국어", "영어", "중국어"], state[3:]):
+                label = self.lang_labels[language]
+                if label.cget("text") != text:
+                    label.config(text=text)
+                    label.adjust_font_size()
+        elif screen == "break":
+            self.break_countdown_label.config(text=state[1])
+        elif screen == "final":
+            self.final_countdown_label.config(text=state[1])
 
     def update_audio_settings(self):
-        logging.info("Updating audio settings")
+        ui_log.info("Updating audio settings")
         selected_languages = [lang for lang in ["한국어", "영어", "중국어"] if self.audio_vars[lang].get()]
 
         if len(selected_languages) > 1:
-            logging.info("Multiple languages selected for audio")
+            ui_log.info("Multiple languages selected for audio")
         else:
-            logging.info(f"Single language selected for audio: {selected_languages[0] if selected_languages else 'None'}")
+            ui_log.info(f"Single language selected for audio: {selected_languages[0] if selected_languages else 'None'}")
 
         self.update_speed_display()  # 오디오 설정이 변경될 때마다 속도 디스플레이 업데이트
         self.save_settings()
@@ -707,7 +2864,7 @@ class ConversationApp(tk.Tk):
         self.save_settings()
 
     def on_duration_change(self, value):
-        logging.info(f"Display duration changed to {value}")
+        ui_log.info(f"Display duration changed to {value}")
         self.save_settings()
 
     def _create_title_label(self):
@@ -766,6 +2923,14 @@ class ConversationApp(tk.Tk):
                                          command=self.on_simultaneous_change)
         simultaneous_cb.pack(side=tk.LEFT)
 
+        # 통합 음성 (세션 전체를 하나의 트랙으로 재생)
+        tk.Label(options_frame, text="통합 음성", font=FONT_LANGUAGE, fg="white", bg=BG_COLOR).grid(row=0, column=6,
+                                                                                                padx=(10, 0))
+        premixed_cb = tk.Checkbutton(options_frame, text="", variable=self.premixed_session,
+                                     font=FONT_LANGUAGE, fg="white", bg=BG_COLOR, selectcolor=BG_COLOR,
+                                     command=self.on_simultaneous_change)
+        premixed_cb.grid(row=1, column=6, padx=(10, 0))
+
     def on_simultaneous_change(self):
         self.save_settings()
 
@@ -803,66 +2968,55 @@ class ConversationApp(tk.Tk):
         return "break"
 
     def prepare_subtitles(self, start_sentence, end_sentence):
-        self.prepared_subtitles = {}
-        for i in range(start_sentence, end_sentence + 1):
-            sentence = self.data_manager.get_sentence(i - 1)
-            self.prepared_subtitles[i] = {
-                "한국어": self.split_korean_text(sentence["한국어"]),
-                "영어": self.split_english_text(sentence["영어"]),
-                "중국어": sentence["중국어"]
-            }
-        logging.info(f"Prepared subtitles for sentences {start_sentence} to {end_sentence}")
+        # 줄바꿈은 문장 전체에 대해 미리 계산되어 있으므로 범위만 조회
+        rows = self.data_manager.get_wrapped_range(start_sentence - 1, end_sentence)
+        self.prepared_subtitles = dict(enumerate(rows, start_sentence))
+        data_log.info(f"Prepared subtitles for sentences {start_sentence} to {end_sentence}")
 
     def finish_countdown(self):
         # 카운트다운 종료 후 대화 화면으로 전환
         self.setup_conversation_screen()
-        self.after(1000, self.next_sentence)
+        self.timeline.schedule(1000, self.next_sentence)
 
     def adjust_frame_size(self):
         # logging.info(f"No.{self.current_sentence}, Adjusting frame size")
         if not hasattr(self, 'lang_frame') or not self.lang_labels:
-            logging.warning("Language frame or labels not initialized. Skipping frame size adjustment.")
+            playback_log.warning("Language frame or labels not initialized. Skipping frame size adjustment.")
             return
 
         available_height = self.lang_frame.winfo_height()
+        font_sizes = {}
         total_content_height = 0
-        current_font_sizes = {}
 
-        # 먼저 모든 라벨을 초기 폰트 크기로 재설정
+        # 초기 폰트 크기일 때의 전체 내용 높이를 위젯을 다시 그리지 않고 계산
         for lang, label in self.lang_labels.items():
-            initial_size = self.LANG_SETTINGS[lang]['initial_size']
-            initial_font = (self.LANG_SETTINGS[lang]['font'][0], initial_size, self.LANG_SETTINGS[lang]['font'][2])
-            label.config(font=initial_font)
-            current_font_sizes[lang] = initial_size
-
-            self.lang_frame.update_idletasks()
-
-        # 초기 크기로 설정된 후의 전체 내용 높이 계산
-        for label in self.lang_labels.values():
-            total_content_height += label.winfo_reqheight()
+            family, _, style = self.LANG_SETTINGS[lang]['font']
+            font_sizes[lang] = self.LANG_SETTINGS[lang]['initial_size']
+            total_content_height += self.font_solver.label_height(label, label.cget("text"),
+                                                                  (family, font_sizes[lang], style))
 
         all_single_line = all(len(label.cget("text").split('\n')) == 1 for label in self.lang_labels.values())
         padding = 7 if all_single_line else 3
 
-        for label in self.lang_labels.values():
-            label.pack_configure(pady=padding)
-
         # 높이 조정이 필요한 경우에만 폰트 크기 조정
         if total_content_height > available_height:
             scale_factor = available_height / total_content_height
             scale_factor = max(scale_factor, 0.85)  # 최대 15%까지만 축소
 
-            for lang, label in self.lang_labels.items():
-                current_size = current_font_sizes[lang]
+            for lang in self.lang_labels:
+                current_size = font_sizes[lang]
                 new_size = max(int(current_size * scale_factor), self.LANG_SETTINGS[lang]['min_size'])
 
                 if new_size < current_size:
-                    new_font = (self.LANG_SETTINGS[lang]['font'][0], new_size, self.LANG_SETTINGS[lang]['font'][2])
-                    label.config(font=new_font)
-                    logging.info(
+                    font_sizes[lang] = new_size
+                    playback_log.info(
                         f"No.{self.current_sentence} Adjusted {lang} font size from {current_size} to {new_size}")
 
-        self.lang_frame.update_idletasks()
+        # 최종 폰트만 위젯에 적용
+        for lang, label in self.lang_labels.items():
+            family, _, style = self.LANG_SETTINGS[lang]['font']
+            label.config(font=(family, font_sizes[lang], style))
+            label.pack_configure(pady=padding)
 
     def _create_language_frame(self, initialize_empty=False):
         self.lang_labels = {}
@@ -902,14 +3056,10 @@ class ConversationApp(tk.Tk):
 
             def create_adjust_font_size(label, initial_size, max_height, font):
                 def adjust_font_size():
-                    size = initial_size
+                    # 텍스트 크기를 계산해 맞는 폰트 크기를 찾고, 최종 폰트만 한 번 적용
+                    size = self.font_solver.fit_label(label, label.cget("text"), (font[0], initial_size, font[2]),
+                                                      max_height)
                     label.config(font=(font[0], size, font[2]))
-                    label.update()
-
-                    while label.winfo_reqheight() > max_height and size > 10:
-                        size -= 1
-                        label.config(font=(font[0], size, font[2]))
-                        label.update()
 
                 return adjust_font_size
 
@@ -923,10 +3073,11 @@ class ConversationApp(tk.Tk):
             label.adjust_font_size()
 
     def show_subtitle(self, language):
-        displayed_text = self.prepared_subtitles[self.current_sentence][language]
+        displayed_text = getattr(self.prepared_subtitles[self.current_sentence], language)
         self.lang_labels[language].config(text=displayed_text)
         self.lang_labels[language].adjust_font_size()
         self.update_idletasks()
+        self.telemetry.mark(self.current_sentence, language, "subtitle")
 
     def _create_top_frame(self):
         top_frame = tk.Frame(self.main_frame, bg=BG_COLOR)
@@ -974,50 +3125,21 @@ class ConversationApp(tk.Tk):
         self.pause_button.pack(side=tk.RIGHT, padx=10)
 
     def _update_sentence_data(self):
-        sentence = self.data_manager.get_sentence(self.current_sentence - 1)
+        # 자막은 prepare_subtitles에서 이미 나눠 두었으므로 조회만 함
+        sentence = self.prepared_subtitles.get(self.current_sentence, EMPTY_SENTENCE)
         self.sentence_label.config(text=f"No.{self.current_sentence}")
 
-        self.texts["Korean"] = self.split_korean_text(sentence["한국어"])
-        self.texts["English"] = self.split_english_text(sentence["영어"])
-        self.texts["Chinese"] = sentence["중국어"]
+        self.texts["Korean"] = sentence.한국어
+        self.texts["English"] = sentence.영어
+        self.texts["Chinese"] = sentence.중국어
 
     @staticmethod
     def split_korean_text(text):
-        max1 = 23
-        if len(text) <= max1:  # 20자 이하면 한 줄로 표시
-            return text
-
-        lines = []
-        while text:
-            if len(text) <= max1:
-                lines.append(text)
-                break
-            split_index = text.rfind(' ', 0, max1)
-            if split_index == -1:
-                split_index = max1
-            lines.append(text[:split_index].strip())
-            text = text[split_index:].strip()
-
-        return '\n'.join(lines)
+        return wrap_subtitle_text(text, SUBTITLE_WRAP_WIDTHS['한국어'])
 
     @staticmethod
     def split_english_text(text):
-        max2 = 110
-        if len(text) <= max2:  # 100자 이하면 한 줄로 표시
-            return text
-
-        lines = []
-        while text:
-            if len(text) <= max2:
-                lines.append(text)
-                break
-            split_index = text.rfind(' ', 0, max2)
-            if split_index == -1:
-                split_index = max2
-            lines.append(text[:split_index].strip())
-            text = text[split_index:].strip()
-
-        return '\n'.join(lines)
+        return wrap_subtitle_text(text, SUBTITLE_WRAP_WIDTHS['영어'])
 
     def next_sentence(self):
         if self.current_sentence > self.end:
@@ -1038,11 +3160,11 @@ class ConversationApp(tk.Tk):
             self.show_subtitle("영어")
         if "영어" in self.audio_languages:
             self.audio_manager.play_sentence_audio(self.current_sentence, "영어", speed=self.audio_speed.get())
-        logging.info("Playing English audio and showing English subtitle")
+        playback_log.info("Playing English audio and showing English subtitle")
 
     def prepare_first_subtitle(self):
-        first_sentence = self.data_manager.get_sentence(self.current_sentence - 1)
-        self.texts["Korean"] = self.split_korean_text(first_sentence["한국어"])
+        first_sentence = self.prepared_subtitles.get(self.current_sentence, EMPTY_SENTENCE)
+        self.texts["Korean"] = first_sentence.한국어
         # 다른 언어의 자막도 필요하다면 여기서 준비합니다.
 
     def play_audio_and_show_subtitles(self, audio_languages):
@@ -1050,18 +3172,27 @@ class ConversationApp(tk.Tk):
             return
         self.start_time = time.time()
         self.audio_languages = audio_languages
-        logging.info(f"No.{self.current_sentence} Playing audio in {audio_languages}")
+        # 이전 문장에서 남은 음성 단계가 이어지지 않도록 문장마다 새 토큰 사용
+        self.audio_sequence_token += 1
+        self.audio_manager.stop_playback()
+        playback_log.info(f"No.{self.current_sentence} Playing audio in {audio_languages}")
 
         # 기본 타이밍 계산
         audio_lengths = {}
+        length_timings = {}
         for lang in ["한국어", "영어", "중국어"]:
             if lang in audio_languages:
                 speed = self.initial_korean_speed.get() if lang == "한국어" else self.initial_english_speed.get()
-                audio_lengths[lang] = int(
-                    self.audio_manager.get_audio_length(self.current_sentence, lang) / speed * 1000)
+                with self.audio_manager.collect_stage_timings() as length_timings[lang]:
+                    length = self.audio_manager.get_sentence_length(self.current_sentence, lang,
+                                                                    self.get_audio_speed(lang))
+                audio_lengths[lang] = int(length / speed * 1000)
             else:
                 audio_lengths[lang] = 0
 
+        # 현재 문장이 재생되는 동안 다음 문장들의 음성 준비
+        self.prefetch_upcoming_audio(self.current_sentence + 1)
+
         # 자막 및 음성 딜레이 설정 적용
         korean_subtitle_delay = int(self.korean_subtitle_delay.get() * 1000)
         english_subtitle_delay = int(self.english_subtitle_delay.get() * 1000)
@@ -1069,48 +3200,97 @@ class ConversationApp(tk.Tk):
         next_sentence_delay = int(self.next_sentence_delay.get() * 1000)
 
         # 자막과 음성 사이의 약간의 지연 (예: 200ms)
-        subtitle_audio_gap = 200
+        subtitle_audio_gap = GENERAL_SETTINGS['SUBTITLE_AUDIO_GAP']
 
-        # 1. 한국어 처리
+        # 1. 자막 표시 (문장 시작 기준)
+        sentence_start = self.timeline.anchor()
+        subtitle_delays = {}
         if self.language_vars["한국어"].get():
-            self.after(korean_subtitle_delay, lambda: self.show_subtitle("한국어"))
-        korean_audio_end = korean_subtitle_delay + subtitle_audio_gap + audio_lengths["한국어"]
-        if "한국어" in audio_languages:
-            self.after(korean_subtitle_delay + subtitle_audio_gap,
-                       lambda: self.audio_manager.play_sentence_audio(self.current_sentence, "한국어",
-                                                                      speed=self.korean_audio_speed.get()))
-
-        # 2. 영어 처리
-        english_audio_start = korean_audio_end + english_audio_delay
+            subtitle_delays["한국어"] = korean_subtitle_delay
         if self.language_vars["영어"].get():
-            self.after(english_subtitle_delay, lambda: self.show_subtitle("영어"))
-        if "영어" in audio_languages:
-            self.after(english_audio_start,
-                       lambda: self.audio_manager.play_sentence_audio(self.current_sentence, "영어",
-                                                                      speed=self.english_audio_speed.get()))
-
-        # 3. 중국어 처리
-        chinese_audio_start = english_audio_start + audio_lengths["영어"]
+            subtitle_delays["영어"] = english_subtitle_delay
         if self.language_vars["중국어"].get():
             if self.show_english_chinese_simultaneously.get():
                 # 영어와 동시에 표시
-                self.after(english_subtitle_delay, lambda: self.show_subtitle("중국어"))
+                subtitle_delays["중국어"] = english_subtitle_delay
             else:
                 # 영어 자막 1초 후 표시
-                self.after(english_subtitle_delay + 1000, lambda: self.show_subtitle("중국어"))
-        if "중국어" in audio_languages:
-            self.after(chinese_audio_start, self.play_audio("중국어"))
-
-        # 4. 다음 문장으로 넘어가는 시간 계산
-        next_sentence_time = chinese_audio_start + audio_lengths["중국어"] + next_sentence_delay
-
-        # 다음 문장으로 넘어가기 직전에 모든 자막 지우기 및 음성 재생 상태 초기화
-        self.after(max(0, next_sentence_time - 10), self.clear_all_subtitles_and_reset_audio_state)
-
-        # 다음 문장으로 넘어가기
-        self.after(max(0, next_sentence_time), self.proceed_to_next)
+                subtitle_delays["중국어"] = english_subtitle_delay + 1000
+        for lang, delay in subtitle_delays.items():
+            self.timeline.schedule(delay, self.show_subtitle, lang)
+
+        # 2. 음성 재생: 각 단계는 앞 음성의 실제 재생 종료 시점에 이어서 진행
+        audio_start = korean_subtitle_delay + subtitle_audio_gap
+        self.run_audio_sequence([
+            ("wait", audio_start),
+            ("play", "한국어"),
+            ("wait", english_audio_delay),
+            ("play", "영어"),
+            ("play", "중국어"),
+            # 다음 문장으로 넘어가기 직전에 모든 자막 지우기 및 음성 재생 상태 초기화
+            ("wait", max(0, next_sentence_delay - 10)),
+            ("call", self.clear_all_subtitles_and_reset_audio_state),
+            ("wait", min(10, next_sentence_delay)),
+            ("call", self.proceed_to_next),
+        ], self.audio_sequence_token)
+
+        # 예상 시간 (실제 진행은 음성 종료 시점 기준)
+        next_sentence_time = (korean_subtitle_delay + subtitle_audio_gap + english_audio_delay +
+                              sum(audio_lengths.values()) + next_sentence_delay)
+        playback_log.info(f"Next in {next_sentence_time / 1000:.2f} seconds")
+        self.telemetry.start_sentence(self.current_sentence, sentence_start,
+                                      self.plan_sentence_events(audio_lengths, subtitle_delays, audio_start,
+                                                                english_audio_delay),
+                                      next_sentence_time)
+        for lang, timings in length_timings.items():
+            self.telemetry.add_preparation(self.current_sentence, lang, timings)
+
+    def plan_sentence_events(self, audio_lengths, subtitle_delays, audio_start, english_audio_delay) -> dict:
+        # 문장 시작 기준 예정 시각: 각 음성이 예상 길이만큼 재생되고 바로 다음 단계가 이어진다고 가정
+        plan = {(lang, "subtitle"): delay for lang, delay in subtitle_delays.items()}
+        position = audio_start
+        for lang, delay in (("한국어", 0), ("영어", english_audio_delay), ("중국어", 0)):
+            position += delay
+            if lang in self.audio_languages:
+                plan[(lang, "audio_start")] = position
+                position += audio_lengths[lang]
+                plan[(lang, "audio_end")] = position
+        return plan
+
+    def run_audio_sequence(self, steps, token, index=0):
+        if token != self.audio_sequence_token:
+            return
+        while index < len(steps):
+            action, value = steps[index]
+            index += 1
+            if action == "wait" and value > 0:
+                self.timeline.schedule(value, self.run_audio_sequence, steps, token, index)
+                return
+            if action == "play" and value in self.audio_languages:
+                sentence_number, language = self.current_sentence, value
+
+                def on_complete():
+                    self.telemetry.mark(sentence_number, language, "audio_end")
+                    self.run_audio_sequence(steps, token, index)
+
+                self.audio_manager.play_sentence_audio(sentence_number, language,
+                                                       speed=self.get_audio_speed(language), on_complete=on_complete)
+                self.telemetry.mark(sentence_number, language, "audio_start")
+                self.poll_audio_playback()
+                return
+            if action == "call":
+                value()
+
+    def poll_audio_playback(self):
+        if self.audio_poll_event is not None:
+            return
+        self.audio_poll_event = self.timeline.schedule(GENERAL_SETTINGS['AUDIO_POLL_INTERVAL'],
+                                                       self._poll_audio_playback)
 
-        logging.info(f"Next in {next_sentence_time / 1000:.2f} seconds")
+    def _poll_audio_playback(self):
+        self.audio_poll_event = None
+        if self.audio_manager.poll_playback():
+            self.poll_audio_playback()
 
     def clear_all_subtitles_and_reset_audio_state(self):
         for language in ["한국어", "영어", "중국어"]:
@@ -1127,9 +3307,27 @@ class ConversationApp(tk.Tk):
         return lambda: self.audio_manager.play_sentence_audio(
             self.current_sentence,
             language,
-            speed=self.audio_speed.get()
+            speed=self.get_audio_speed(language)
         )
 
+    def get_audio_speed(self, language):
+        # 실제 재생에 사용하는 배속 (미리 준비한 음성과 같은 키를 쓰도록 한 곳에서 결정)
+        if language == "한국어":
+            return self.korean_audio_speed.get()
+        if language == "영어":
+            return self.english_audio_speed.get()
+        return self.audio_speed.get()
+
+    def prefetch_upcoming_audio(self, first_sentence):
+        if not self.audio_languages or self.session_frames:
+            return
+        # 휴식 시간이나 마지막 문장을 넘어서는 문장은 준비하지 않음 (휴식/종료 시 취소되므로)
+        next_break = -(-first_sentence // 20) * 20
+        last_sentence = min(self.end, next_break, first_sentence + PREFETCH_SETTINGS['LOOKAHEAD'] - 1)
+        speeds = {lang: self.get_audio_speed(lang) for lang in self.audio_languages}
+        self.audio_manager.prefetcher.prefetch(range(first_sentence, last_sentence + 1), speeds,
+                                               self.current_sentence)
+
     def clear_all_subtitles(self):
         for language in ["한국어", "영어", "중국어"]:
             self.lang_labels[language].config(text="")
@@ -1138,7 +3336,8 @@ class ConversationApp(tk.Tk):
         # logging.info("Cleared all subtitles")
 
     def proceed_to_next(self):
-        logging.info(f"No.{self.current_sentence} -> proceeding to next")
+        playback_log.info(f"No.{self.current_sentence} -> proceeding to next")
+        self.telemetry.finish_sentence()
         if self.current_sentence >= self.end:
             self.show_final_message()
         elif self.current_sentence % 20 == 0 and self.current_sentence != 0:
@@ -1154,13 +3353,30 @@ class ConversationApp(tk.Tk):
             self.play_audio_and_show_subtitles(self.audio_languages)
 
     def show_break_time(self):
-        logging.info(f"Break time after No.{self.current_sentence}")
-        for widget in self.winfo_children():
-            widget.destroy()
+        playback_log.info(f"Break time after No.{self.current_sentence}")
+        self.telemetry.session_break()
+        self.audio_manager.prefetcher.cancel()
+        # 휴식 중에 바뀐 음성 폴더만 다시 훑음
+        self.audio_manager.manifest.refresh()
+        self.show_screen("break")
+        self.break_countdown_label.config(text="")
+
+        self.audio_manager.play_sound("drum")
 
-        break_frame = tk.Frame(self, bg=self.BG_COLOR)
-        break_frame.pack(expand=True, fill="both")
+        drum_duration = self.audio_manager.sounds["drum"].get_length() * 1000
+        break_duration = self.GENERAL_SETTINGS['BREAK_TIME']
 
+        def update_countdown(remaining):
+            if remaining > 0:
+                self.break_countdown_label.config(text=f"{remaining}")
+                self.timeline.schedule(1000, update_countdown, remaining - 1)
+            elif remaining == 0:
+                self.break_countdown_label.config(text="0")
+                self.timeline.schedule(1000, self.resume_after_break)
+
+        self.timeline.schedule(int(drum_duration), update_countdown, break_duration // 1000)
+
+    def _build_break_screen(self, break_frame):
         # Create a center frame to hold all content
         center_frame = tk.Frame(break_frame, bg=self.BG_COLOR)
         center_frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -1173,9 +3389,9 @@ class ConversationApp(tk.Tk):
                                bg=self.BG_COLOR)
         break_label.pack(side=tk.LEFT, padx=(0, 20))
 
-        countdown_label = tk.Label(text_countdown_frame, text="", font=self.FONT_COUNTDOWN, fg="yellow",
-                                   bg=self.BG_COLOR)
-        countdown_label.pack(side=tk.LEFT)
+        self.break_countdown_label = tk.Label(text_countdown_frame, text="", font=self.FONT_COUNTDOWN, fg="yellow",
+                                              bg=self.BG_COLOR)
+        self.break_countdown_label.pack(side=tk.LEFT)
 
         # Message and QR Code
         message_qr_frame = tk.Frame(center_frame, bg=self.BG_COLOR)
@@ -1187,33 +3403,21 @@ class ConversationApp(tk.Tk):
 
         self.add_qr_code(message_qr_frame)
 
-        self.audio_manager.play_sound("drum")
-
-        drum_duration = self.audio_manager.sounds["drum"].get_length() * 1000
-        break_duration = self.GENERAL_SETTINGS['BREAK_TIME']
-
-        def update_countdown(remaining):
-            if remaining > 0:
-                countdown_label.config(text=f"{remaining}")
-                self.after(1000, update_countdown, remaining - 1)
-            elif remaining == 0:
-                countdown_label.config(text="0")
-                self.after(1000, self.resume_after_break)
-
-        self.after(int(drum_duration), update_countdown, break_duration // 1000)
-
     def resume_after_break(self):
         self.current_sentence += 1
-        logging.info(f"Resuming after break, next No.{self.current_sentence}")
-        for widget in self.winfo_children():
-            widget.destroy()
+        playback_log.info(f"Resuming after break, next No.{self.current_sentence}")
         self.setup_conversation_screen()
-        self.after(100, self.next_sentence)
+        self.timeline.schedule(100, self.next_sentence)
 
     def play_final_sound(self):
         self.audio_manager.play_sound("final")
 
     def finish_application(self):
+        self.settings_store.flush()
+        self.audio_manager.close()
+        if self.session_track_file is not None:
+            with contextlib.suppress(OSError):
+                os.remove(self.session_track_file)
         self.quit()
 
     def play_drum_sound_three_times(self):
@@ -1222,51 +3426,51 @@ class ConversationApp(tk.Tk):
             self.after(1500)
         self.after(GENERAL_SETTINGS['FINAL_MESSAGE_DISPLAY_TIME'], self.destroy)
 
+    def current_settings(self) -> dict:
+        # 입력 필드가 None이 아닌지 확인하고 값을 가져옴
+        korean_subtitle_delay = float(
+            self.korean_subtitle_entry.get()) if self.korean_subtitle_entry else self.korean_subtitle_delay.get()
+        english_subtitle_delay = float(
+            self.english_subtitle_entry.get()) if self.english_subtitle_entry else self.english_subtitle_delay.get()
+        english_audio_delay = float(
+            self.english_audio_entry.get()) if self.english_audio_entry else self.english_audio_delay.get()
+        next_sentence_delay = float(
+            self.next_sentence_entry.get()) if self.next_sentence_entry else self.next_sentence_delay.get()
+
+        settings = {
+            'start_sentence': int(self.start_sentence.get()),
+            'end_sentence': int(self.end_sentence.get()),
+            'korean_audio_speed': float(self.korean_audio_speed.get()),
+            'english_audio_speed': float(self.english_audio_speed.get()),
+            'audio_speed': float(self.audio_speed.get()),
+            'korean_subtitle_delay': korean_subtitle_delay,
+            'english_subtitle_delay': english_subtitle_delay,
+            'english_audio_delay': english_audio_delay,  # 영어 음성 딜레이 추가
+            'next_sentence_delay': next_sentence_delay,
+            'show_english_chinese_simultaneously': self.show_english_chinese_simultaneously.get(),
+            'initial_korean_speed': float(self.initial_korean_speed.get()),
+            'initial_english_speed': float(self.initial_english_speed.get()),
+            'premixed_session': self.premixed_session.get(),
+        }
+
+        for lang in ["한국어", "영어", "중국어"]:
+            settings[f'show_{lang}'] = self.language_vars[lang].get()
+            settings[f'play_{lang}'] = self.audio_vars[lang].get()
+        return settings
+
     def save_settings(self):
         try:
-            # 입력 필드가 None이 아닌지 확인하고 값을 가져옴
-            korean_subtitle_delay = float(
-                self.korean_subtitle_entry.get()) if self.korean_subtitle_entry else self.korean_subtitle_delay.get()
-            english_subtitle_delay = float(
-                self.english_subtitle_entry.get()) if self.english_subtitle_entry else self.english_subtitle_delay.get()
-            english_audio_delay = float(
-                self.english_audio_entry.get()) if self.english_audio_entry else self.english_audio_delay.get()
-            next_sentence_delay = float(
-                self.next_sentence_entry.get()) if self.next_sentence_entry else self.next_sentence_delay.get()
-
-            settings = {
-                'start_sentence': int(self.start_sentence.get()),
-                'end_sentence': int(self.end_sentence.get()),
-                'korean_audio_speed': float(self.korean_audio_speed.get()),
-                'english_audio_speed': float(self.english_audio_speed.get()),
-                # 'audio_speed': float(self.audio_speed.get()),
-                'korean_subtitle_delay': korean_subtitle_delay,
-                'english_subtitle_delay': english_subtitle_delay,
-                'english_audio_delay': english_audio_delay,  # 영어 음성 딜레이 추가
-                'next_sentence_delay': next_sentence_delay,
-                'show_english_chinese_simultaneously': self.show_english_chinese_simultaneously.get(),
-                'initial_korean_speed': float(self.initial_korean_speed.get()),
-                'initial_english_speed': float(self.initial_english_speed.get()),
-            }
-
-            for lang in ["한국어", "영어", "중국어"]:
-                settings[f'show_{lang}'] = self.language_vars[lang].get()
-                settings[f'play_{lang}'] = self.audio_vars[lang].get()
+            settings = self.current_settings()
 
             # logging.info(f"Saving settings: {settings}")
 
-            config_dir = CONFIG_FILE.parent
-            config_dir.mkdir(parents=True, exist_ok=True)
-
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=4)
-
-            # logging.info(f"Settings saved to {CONFIG_FILE}")
+            # 파일 기록은 변경이 잠잠해진 뒤 백그라운드에서 (기록 오류는 로그로만 남음)
+            self.settings_store.save(settings)
         except ValueError as e:
-            logging.error(f"Error saving settings: Invalid value - {e}")
+            ui_log.error(f"Error saving settings: Invalid value - {e}")
             messagebox.showerror("설정 저장 오류", f"잘못된 값이 입력되었습니다: {e}")
         except Exception as e:
-            logging.error(f"Error saving settings to {CONFIG_FILE}: {e}")
+            ui_log.error(f"Error saving settings to {CONFIG_FILE}: {e}")
             messagebox.showerror("설정 저장 오류", f"설정을 저장하는 중 오류가 발생했습니다: {e}")
 
     def load_settings(self):
@@ -1298,16 +3502,17 @@ class ConversationApp(tk.Tk):
 
                 self.audio_vars["영어"].set(settings.get('play_영어', True))
                 self.show_english_chinese_simultaneously.set(settings.get('show_english_chinese_simultaneously', False))
+                self.premixed_session.set(settings.get('premixed_session', False))
 
-                logging.info("Settings loaded successfully.")
+                ui_log.info("Settings loaded successfully.")
             else:
-                logging.info("No settings file found. Using default settings.")
+                ui_log.info("No settings file found. Using default settings.")
                 self._apply_default_settings()
         except json.JSONDecodeError:
-            logging.error(f"Error decoding settings file: {CONFIG_FILE}")
+            ui_log.error(f"Error decoding settings file: {CONFIG_FILE}")
             self._apply_default_settings()
         except Exception as e:
-            logging.error(f"Error loading settings from {CONFIG_FILE}: {e}")
+            ui_log.error(f"Error loading settings from {CONFIG_FILE}: {e}")
             self._apply_default_settings()
 
     def _apply_default_settings(self):
@@ -1335,8 +3540,9 @@ class ConversationApp(tk.Tk):
 
         # 영중 자막 동시 표시 설정 기본값 적용
         self.show_english_chinese_simultaneously.set(False)
+        self.premixed_session.set(False)
 
-        logging.info("Default settings applied.")
+        ui_log.info("Default settings applied.")
 
     def create_default_settings(self):
         default_settings = {
@@ -1357,16 +3563,12 @@ class ConversationApp(tk.Tk):
         }
 
         try:
-            config_dir = CONFIG_FILE.parent
-            config_dir.mkdir(parents=True, exist_ok=True)
-
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(default_settings, f, ensure_ascii=False, indent=4)
+            self.settings_store.replace(default_settings)
 
-            logging.info(f"Created default settings file at {CONFIG_FILE}")
+            ui_log.info(f"Created default settings file at {CONFIG_FILE}")
             self.load_settings()  # 새로 생성된 설정 파일을 로드
         except Exception as e:
-            logging.error(f"Error creating default settings file: {e}")
+            ui_log.error(f"Error creating default settings file: {e}")
             self._apply_default_settings()  # 파일 생성에 실패한 경우 메모리에 기본 설정 적용
 
     def use_default_settings(self):
@@ -1390,25 +3592,758 @@ class ConversationApp(tk.Tk):
             default_settings[f'play_{lang}'] = self.audio_vars[lang].get()
 
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(default_settings, f, ensure_ascii=False, indent=4)
-            logging.info(f"Default settings saved to {CONFIG_FILE}")
+            self.settings_store.replace(default_settings)
+            ui_log.info(f"Default settings saved to {CONFIG_FILE}")
         except Exception as e:
-            logging.error(f"Error saving default settings to {CONFIG_FILE}: {e}")
+            ui_log.error(f"Error saving default settings to {CONFIG_FILE}: {e}")
 
-        logging.info("Default settings applied and saved.")
+        ui_log.info("Default settings applied and saved.")
 
     def on_closing(self):
         self.save_settings()
+        self.settings_store.flush()
+        self.audio_manager.close()
         self.destroy()
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+def read_settings_file() -> dict:
+    # 화면 없이 실행하는 모드에서 앱과 같은 설정 파일을 읽음 (실패하면 빈 설정)
+    try:
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        ui_log.error(f"Error loading settings from {CONFIG_FILE}: {e}")
+        return {}
+
+
+class SessionSettings:
+    # 설정 파일 값을 play_audio_and_show_subtitles와 같은 규칙의 세션 설정으로 정리 (시간은 밀리초)
+
+    def __init__(self, settings: dict):
+        delays = ConversationApp.default_delays
+        self.korean_subtitle_delay = int(settings.get('korean_subtitle_delay', delays['korean_subtitle_delay']) * 1000)
+        self.english_subtitle_delay = int(settings.get('english_subtitle_delay', delays['english_subtitle_delay']) * 1000)
+        self.english_audio_delay = int(settings.get('english_audio_delay', delays['english_audio_delay']) * 1000)
+        self.next_sentence_delay = int(settings.get('next_sentence_delay', delays['next_sentence_delay']) * 1000)
+        self.simultaneous = settings.get('show_english_chinese_simultaneously', False)
+        self.show = {lang: settings.get(f'show_{lang}', True) for lang in DataManager.COLUMNS}
+        self.play = {lang: settings.get(f'play_{lang}', lang == "영어") for lang in DataManager.COLUMNS}
+        # start_conversation에서 initial_*_speed를 재생 속도로 사용하고, 중국어는 audio_speed 사용
+        self.speeds = {
+            "한국어": float(settings.get('initial_korean_speed', 2.0)),
+            "영어": float(settings.get('initial_english_speed', 2.0)),
+            "중국어": float(settings.get('audio_speed', 2.0)),
+        }
 
-if __name__ == "__main__":
-    logging.info("Application starting")
-    app = ConversationApp()
+    def title_text(self, end_sentence: int) -> str:
+        return ConversationApp.speed_display_text(
+            end_sentence,
+            self.speeds["한국어"] if self.play["한국어"] else None,
+            self.speeds["영어"] if self.play["영어"] else None)
+
+
+def build_session_plan(start_sentence: int, end_sentence: int, settings: SessionSettings, subtitles,
+                       clip_lengths: dict, drum_length: float):
+    # 카운트다운부터 종료 화면까지 화면 상태와 음성 시작 시각을 앱의 진행 규칙대로 계산
+    # 반환: (frames [(시작 ms, 화면 상태)], audio [(시작 ms, 음성 키)], 전체 길이 ms)
+    frames, audio = [], []
+    title = settings.title_text(end_sentence)
+    empty_conversation = ("conversation", title, "", "", "", "")
+    gap = GENERAL_SETTINGS['SUBTITLE_AUDIO_GAP']
+
+    # 카운트다운 후 1초 뒤 첫 문장
+    # 카운트다운 숫자와 한 글자씩 나타나는 메시지 (type_message는 95ms 간격)
+    audio.append((0, "countdown"))
+    interval = GENERAL_SETTINGS['COUNTDOWN_INTERVAL']
+    t = GENERAL_SETTINGS['COUNTDOWN_START'] * interval
+    for change in sorted(set(range(0, t, interval)) | {i * 95 for i in range(len(COUNTDOWN_MESSAGE)) if i * 95 < t}):
+        value = GENERAL_SETTINGS['COUNTDOWN_START'] - change // interval
+        frames.append((change, ("countdown", str(value), COUNTDOWN_MESSAGE[:change // 95 + 1])))
+    frames.append((t, empty_conversation))
+    t += 1000
+
+    sentence = start_sentence
+    korean_immediate = False
+    while True:
+        texts = subtitles.get(sentence, EMPTY_SENTENCE)
+        show_times = {}
+        if settings.show["한국어"]:
+            show_times["한국어"] = t if korean_immediate else t + settings.korean_subtitle_delay
+        if settings.show["영어"]:
+            show_times["영어"] = t + settings.english_subtitle_delay
+        if settings.show["중국어"]:
+            show_times["중국어"] = t + settings.english_subtitle_delay + (0 if settings.simultaneous else 1000)
+
+        audio_time = t + settings.korean_subtitle_delay + gap
+        for lang in DataManager.COLUMNS:
+            if lang == "영어":
+                audio_time += settings.english_audio_delay
+            if settings.play[lang] and (sentence, lang) in clip_lengths:
+                audio.append((audio_time, (sentence, lang)))
+                audio_time += clip_lengths[(sentence, lang)]
+        clear_time = audio_time + max(0, settings.next_sentence_delay - 10)
+        end_time = clear_time + min(10, settings.next_sentence_delay)
+
+        for change in sorted({t} | {time_ for time_ in show_times.values() if time_ < clear_time}):
+            visible = [getattr(texts, lang) if show_times.get(lang, clear_time) <= change else ""
+                       for lang in DataManager.COLUMNS]
+            frames.append((change, ("conversation", title, f"No.{sentence}", *visible)))
+        frames.append((clear_time, ("conversation", title, f"No.{sentence}", "", "", "")))
+        t = end_time
+
+        if sentence >= end_sentence:
+            break
+        if sentence % 20 == 0:
+            # 휴식 시간: 북소리가 끝나면 카운트다운, 0을 1초 보여준 뒤 대화 화면으로 돌아와 0.1초 후 다음 문장
+            audio.append((t, "drum"))
+            frames.append((t, ("break", "")))
+            t += int(drum_length)
+            seconds = ConversationApp.GENERAL_SETTINGS['BREAK_TIME'] // 1000
+            for remaining in range(seconds, -1, -1):
+                frames.append((t, ("break", str(remaining))))
+                t += 1000
+            frames.append((t, empty_conversation))
+            t += 100
+            korean_immediate = False
+        else:
+            korean_immediate = True
+        sentence += 1
+
+    # 종료 화면
+    audio.append((t, "final"))
+    seconds = ConversationApp.GENERAL_SETTINGS['FINAL_MESSAGE_DISPLAY_TIME'] // 1000
+    for remaining in range(seconds, -1, -1):
+        frames.append((t, ("final", str(remaining))))
+        t += 1000
+    t += ConversationApp.GENERAL_SETTINGS['FINAL_MESSAGE_EXTRA_DELAY'] - 1000
+    return frames, audio, t
+
+
+class SessionAudioRenderer:
+    # start..end 세션의 모든 음성을 play_audio_and_show_subtitles와 같은 간격/배속 규칙으로 배치해 WAV 파일 하나로 합침
+    # (카운트다운/종료 효과음과 20문장마다의 북소리 포함, 화면 상태 계획도 같은 시간축으로 함께 반환)
+
+    def __init__(self, start_sentence: int, end_sentence: int, settings: SessionSettings,
+                 sample_rate: int, channels: int = 2):
+        self.start_sentence = start_sentence
+        self.end_sentence = end_sentence
+        self.settings = settings
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    def clip_jobs(self) -> dict:
+        # 음성 키 -> (파일 경로, 배속)
+        jobs = {"countdown": (str(COUNTDOWN_AUDIO), 1.0), "drum": (str(SOUND_DRUM), 1.0),
+                "final": (str(SOUND_FINAL), 1.0)}
+        for sentence in range(self.start_sentence, self.end_sentence + 1):
+            for lang in DataManager.COLUMNS:
+                if self.settings.play[lang]:
+                    lang_code = AudioManager.LANGUAGE_CODES[lang]
+                    jobs[(sentence, lang)] = (find_audio_file(globals()[f"AUDIO_{lang_code}"], sentence),
+                                              self.settings.speeds[lang])
+        return jobs
+
+    def prepare_clips(self, executor, load_clip) -> dict:
+        # load_clip(파일 경로, 배속)은 (프레임 수, 채널 수) 16비트 PCM 배열을 반환 (스레드/프로세스 풀 모두 사용 가능)
+        jobs = self.clip_jobs()
+        futures = {}
+        for key, (file_path, speed) in jobs.items():
+            if os.path.exists(file_path):
+                futures[key] = executor.submit(load_clip, file_path, speed)
+            else:
+                export_log.warning(f"Audio file not found: {file_path}")
+
+        clips = {}
+        for key, future in futures.items():
+            try:
+                clips[key] = future.result()
+            except Exception as e:
+                export_log.error(f"Error preparing audio {jobs[key][0]}: {e}")
+        export_log.info(f"Prepared {len(clips)} audio clips")
+        return clips
+
+    def render(self, subtitles, clips: dict, output_file):
+        # 실제 음성 길이로 세션 계획을 세우고 모든 음성을 섞어 output_file(경로 또는 파일 객체)에 WAV로 기록
+        # 반환: (frames [(시작 ms, 화면 상태)], 전체 길이 ms)
+        clip_lengths = {key: len(samples) * 1000 / self.sample_rate
+                        for key, samples in clips.items() if isinstance(key, tuple)}
+        drum_length = len(clips.get("drum", ())) * 1000 / self.sample_rate
+        frames, audio, total = build_session_plan(self.start_sentence, self.end_sentence, self.settings,
+                                                  subtitles, clip_lengths, drum_length)
+        self.write_wav(self.mix(clips, audio, total), output_file)
+        return frames, total
+
+    def mix(self, clips: dict, audio, total: float):
+        # 세션 전체 버퍼를 만들지 않고 MIX_CHUNK_SECONDS 분량씩 섞어 int16 블록을 차례로 내보냄
+        # (clips는 호출한 쪽이 렌더링이 끝날 때까지 들고 있으므로 문장 수에 비례하는 메모리는 그대로 필요)
+        length = int(total * self.sample_rate / 1000) + 1
+        placed = sorted(((int(start * self.sample_rate / 1000), clips[key]) for start, key in audio
+                         if clips.get(key) is not None), key=lambda item: item[0])
+        chunk = max(1, int(EXPORT_SETTINGS['MIX_CHUNK_SECONDS'] * self.sample_rate))
+        active, index = [], 0
+        for chunk_start in range(0, length, chunk):
+            chunk_end = min(length, chunk_start + chunk)
+            while index < len(placed) and placed[index][0] < chunk_end:
+                active.append(placed[index])
+                index += 1
+            buffer = np.zeros((chunk_end - chunk_start, self.channels), dtype=np.float32)
+            for offset, samples in active:
+                low, high = max(offset, chunk_start), min(offset + len(samples), chunk_end)
+                if high > low:
+                    buffer[low - chunk_start:high - chunk_start] += samples[low - offset:high - offset]
+            # 이 블록에서 끝난 음성은 다음 블록부터 건너뜀
+            active = [(offset, samples) for offset, samples in active if offset + len(samples) > chunk_end]
+            yield np.clip(buffer, -32768, 32767).astype(np.int16)
+
+    def write_wav(self, blocks, output_file):
+        # blocks는 (프레임 수, 채널 수) int16 배열의 반복 가능 객체, output_file은 경로 또는 파일 객체
+        with wave.open(output_file, 'wb') as f:
+            f.setnchannels(self.channels)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            for block in blocks:
+                f.writeframes(block.tobytes())
+
+
+def decode_audio(file_path, sample_rate: int, channels: int = 2):
+    # ffmpeg로 어떤 형식이든 16비트 PCM 배열 (프레임 수, 채널 수)로 디코딩
+    command = ['ffmpeg', '-v', 'error', '-i', str(file_path),
+               '-f', 's16le', '-acodec', 'pcm_s16le', '-ac', str(channels), '-ar', str(sample_rate), '-']
+    result = subprocess.run(command, check=True, capture_output=True)
+    return np.frombuffer(result.stdout, dtype=np.int16).reshape(-1, channels)
+
+
+@functools.lru_cache(maxsize=None)
+def find_font_file(family: str, style: str):
+    # Tk 글꼴 이름에 해당하는 글꼴 파일을 찾음 (PIL은 파일 경로가 필요)
+    key = family.lower().replace(" ", "")
+    wanted = [word for word in ("bold", "italic") if word in style]
+    candidates = []
+    for directory in EXPORT_SETTINGS['FONT_DIRS']:
+        for root, _, files in os.walk(os.path.expanduser(directory)):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                stem = stem.lower().replace(" ", "").replace("-", "")
+                if ext.lower() in ('.ttf', '.otf', '.ttc') and (stem.startswith(key) or key.startswith(stem)):
+                    candidates.append(os.path.join(root, name))
+
+    if not candidates:
+        try:
+            pattern = f"{family}:style={'Bold ' if 'bold' in wanted else ''}{'Italic' if 'italic' in wanted else ''}"
+            result = subprocess.run(['fc-match', '-f', '%{file}', pattern.strip()],
+                                    capture_output=True, text=True, check=True)
+            return result.stdout or None
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def score(path):
+        name = os.path.basename(path).lower()
+        matched = sum(word in name for word in wanted)
+        unwanted = sum(word in name for word in ("bold", "italic", "light", "thin", "heavy", "black", "extra")
+                       if word not in wanted)
+        return -matched, unwanted, len(name)
+
+    return min(candidates, key=score)
+
+
+def pil_color(name: str):
+    # Tk 색 이름(gray3, hot pink 등)을 PIL 색으로 변환
+    name = name.replace(" ", "").lower()
+    if name.startswith("gray") and name[4:].isdigit():
+        level = round(int(name[4:]) * 255 / 100)
+        return level, level, level
+    return name
+
+
+class PilFontMetrics:
+    # FontFitSolver가 tkinter.font.Font처럼 쓸 수 있도록 PIL 글꼴을 감쌈
+    def __init__(self, font):
+        self.font = font
+
+    def measure(self, text: str) -> int:
+        return int(self.font.getlength(text))
+
+    def metrics(self, option: str) -> int:
+        ascent, descent = self.font.getmetrics()
+        return ascent + descent
+
+
+class PilFontFitSolver(FontFitSolver):
+    def __init__(self):
+        super().__init__(None)
+
+    @staticmethod
+    def default_font(pixel_size: int):
+        try:
+            return ImageFont.load_default(pixel_size)
+        except TypeError:  # Pillow < 10.1은 크기를 지정할 수 없음
+            return ImageFont.load_default()
+
+    def get_font(self, family: str, size: int, style: str):
+        key = (family, size, style)
+        font = self.fonts.get(key)
+        if font is None:
+            pixel_size = max(1, round(size * EXPORT_SETTINGS['PIXELS_PER_POINT']))
+            font_file = find_font_file(family, style)
+            try:
+                pil_font = ImageFont.truetype(font_file, pixel_size) if font_file else self.default_font(pixel_size)
+            except OSError:
+                export_log.warning(f"Could not load font {family} ({font_file}), using default font")
+                pil_font = self.default_font(pixel_size)
+            font = PilFontMetrics(pil_font)
+            self.fonts[key] = font
+            self.linespaces[key] = font.metrics("linespace")
+        return font
+
+
+class SessionFrameRenderer:
+    # 대화/카운트다운/휴식/종료 화면을 앱과 같은 글꼴, 색, 배치로 PIL 이미지에 그림
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.solver = PilFontFitSolver()
+        self.title_font_size = int(height * 0.1)
+        self.padding = int(height * 0.02)
+        self.qr_image = None
+        qr_image_path = os.path.join("..", "qrcode.jpg")
+        if os.path.exists(qr_image_path):
+            self.qr_image = Image.open(qr_image_path).convert("RGB").resize((100, 100))
+
+    def font(self, spec):
+        return self.solver.get_font(spec[0].strip('{}'), spec[1], spec[2])
+
+    def draw_text(self, draw, text, spec, color, center_x, top, wraplength=0):
+        font = self.font(spec)
+        linespace = self.solver.linespaces[(spec[0].strip('{}'), spec[1], spec[2])]
+        for i, line in enumerate(self.solver.wrap_lines(text, font, wraplength)):
+            draw.text((center_x, top + i * linespace), line, font=font.font, fill=pil_color(color), anchor="ma")
+
+    def text_size(self, text, spec, wraplength=0):
+        font = self.font(spec)
+        lines = self.solver.wrap_lines(text, font, wraplength)
+        linespace = self.solver.linespaces[(spec[0].strip('{}'), spec[1], spec[2])]
+        return max((font.measure(line) for line in lines), default=0), len(lines) * linespace
+
+    def render(self, state):
+        image = Image.new("RGB", (self.width, self.height), pil_color(BG_COLOR))
+        draw = ImageDraw.Draw(image)
+        getattr(self, f"_render_{state[0]}")(image, draw, *state[1:])
+        return image
+
+    def _render_countdown(self, image, draw, value, message):
+        # _build_countdown_screen과 같은 배치 (숫자는 42%, 메시지는 75% 높이의 중앙)
+        width, height = self.text_size(value, FONT_COUNTDOWN)
+        self.draw_text(draw, value, FONT_COUNTDOWN, "white", self.width / 2, self.height * 0.42 - height / 2)
+        message_font = ("NanumBarunGothic", 63, "normal")
+        width, height = self.text_size(message, message_font, 900)
+        self.draw_text(draw, message, message_font, "hot pink", self.width / 2, self.height * 0.75 - height / 2, 900)
+
+    def _render_conversation(self, image, draw, title, number, korean, english, chinese):
+        # _create_top_frame: 문장 번호는 가운데, 제목/배속은 왼쪽
+        number_font = (FONT_NO[0], int(self.title_font_size * 0.7), FONT_NO[2])
+        title_font = (FONT_TOP[0], int(self.title_font_size * 0.4), FONT_TOP[2])
+        _, top_height = self.text_size(" ", number_font)
+        top_height += 4
+        if number:
+            self.draw_text(draw, number, number_font, "yellow", self.width / 2,
+                           (top_height - self.text_size(number, number_font)[1]) / 2)
+        title_width, title_height = self.text_size(title, title_font)
+        self.draw_text(draw, title, title_font, "white", 20 + title_width / 2, (top_height - title_height) / 2)
+
+        # _create_language_frame: 높이 비율 2:4:1, 라벨 영역에 맞게 글꼴 크기 조정
+        total_height = int(self.height * 0.8)
+        height_ratios = {"한국어": 2, "영어": 4, "중국어": 1}
+        total_ratio = sum(height_ratios.values())
+        spacing = int(self.height * 0.01)
+        current_y = top_height + self.padding * 2
+        for lang, text in zip(DataManager.COLUMNS, (korean, english, chinese)):
+            label_height = int(total_height * height_ratios[lang] / total_ratio)
+            settings = ConversationApp.LANG_SETTINGS[lang]
+            if lang == "영어":
+                family, size, style = FONT_EN
+            else:
+                family, size, style = settings['font'][0].strip('{}'), settings['initial_size'], 'normal'
+            wraplength = int(self.width * 0.9) if lang in ["영어", "중국어"] else self.width - 40
+            if text:
+                size = self.solver.fit(text, (family, size, style), label_height - 4, wraplength)
+                _, text_height = self.text_size(text, (family, size, style), wraplength)
+                self.draw_text(draw, text, (family, size, style), settings['fg'], self.width / 2,
+                               current_y + (label_height - text_height) / 2, wraplength)
+            current_y += label_height + spacing
+
+        # _create_bottom_frame: 하단 중앙 문구
+        bottom_text = "한글속청 30일 영어 귀가 뚫린다!"
+        _, bottom_height = self.text_size(bottom_text, FONT_BOTTOM)
+        self.draw_text(draw, bottom_text, FONT_BOTTOM, "white", self.width / 2, self.height - bottom_height - 4)
+
+    def _render_message_screen(self, image, draw, headline, value, message_color, row_gap, message_gap):
+        # show_break_time / show_final_message: [제목 + 카운트다운] 아래에 [메시지 + QR 코드]
+        font_break = ConversationApp.FONT_BREAK
+        font_countdown = ConversationApp.FONT_COUNTDOWN
+        message = "몸에 좋은 소리 mbc 다큐 영상 -->>"
+        message_font = ("NanumBarunGothic", 40, "normal")
+
+        headline_width, headline_height = self.text_size(headline, font_break)
+        value_width, value_height = self.text_size(value, font_countdown) if value else (0, 0)
+        row1_width = headline_width + 20 + value_width
+        row1_height = max(headline_height, value_height)
+        message_width, message_height = self.text_size(message, message_font)
+        qr_size = 100 if self.qr_image is not None else 0
+        row2_width = message_width + (message_gap + qr_size if qr_size else 0)
+        row2_height = max(message_height, qr_size)
+
+        top = (self.height - (row1_height + row_gap + row2_height)) / 2
+        left = (self.width - row1_width) / 2
+        self.draw_text(draw, headline, font_break, "white", left + headline_width / 2,
+                       top + (row1_height - headline_height) / 2)
+        if value:
+            self.draw_text(draw, value, font_countdown, "yellow", left + headline_width + 20 + value_width / 2,
+                           top + (row1_height - value_height) / 2)
+
+        top += row1_height + row_gap
+        left = (self.width - row2_width) / 2
+        self.draw_text(draw, message, message_font, message_color, left + message_width / 2,
+                       top + (row2_height - message_height) / 2)
+        if qr_size:
+            image.paste(self.qr_image, (int(left + message_width + message_gap), int(top + (row2_height - qr_size) / 2)))
+
+    def _render_break(self, image, draw, value):
+        self._render_message_screen(image, draw, "Break Time", value, "white", 30, 10)
+
+    def _render_final(self, image, draw, value):
+        self._render_message_screen(image, draw, "Good Job!", value, "hot pink", 20, 20)
+
+
+_export_renderer = None
+_export_speech_index = None
+
+
+def _init_export_worker(width: int, height: int):
+    global _export_renderer, _export_speech_index
+    _export_renderer = SessionFrameRenderer(width, height)
+    _export_speech_index = AudioFileIndex(SPEECH_INDEX_NAME, measure_speech_bounds)
+
+
+def _render_export_frame(state, output_file: str):
+    _export_renderer.render(state).save(output_file)
+    return output_file
+
+
+def _prepare_export_clip(file_path: str, speed: float, sample_rate: int):
+    samples = decode_audio(file_path, sample_rate)
+    # 재생할 때와 같이 analyze로 찾아 둔 말소리 구간만 사용
+    bounds = _export_speech_index.lookup(file_path) if SILENCE_SETTINGS['TRIM'] else None
+    if bounds is not None:
+        samples = samples[int(bounds[0] * sample_rate):int(bounds[1] * sample_rate)]
+    if speed != 1.0:
+        samples = time_stretch(samples, speed, sample_rate)
+    return samples
+
+
+def _encode_export_chunk(list_file: str, output_file: str, fps: int):
+    command = ['ffmpeg', '-y', '-v', 'error', '-f', 'concat', '-safe', '0', '-i', list_file,
+               '-vf', f'fps={fps}', '-c:v', 'libx264', '-preset', 'veryfast', '-pix_fmt', 'yuv420p', output_file]
+    subprocess.run(command, check=True, capture_output=True, text=True)
+    return output_file
+
+
+class VideoExporter:
+    # 화면 없이 start..end 범위의 세션을 MP4로 내보냄
+    # 음성 준비, 화면 그리기, 구간별 인코딩을 프로세스 풀로 나눠 실제 재생 시간보다 빠르게 만듦
+
+    def __init__(self, start_sentence: int, end_sentence: int, settings: dict, workers: int = None):
+        self.start_sentence = start_sentence
+        self.end_sentence = end_sentence
+        self.settings = SessionSettings(settings)
+        self.workers = workers or os.cpu_count() or 1
+        self.width, self.height = (int(value) for value in WINDOW_SIZE.split("x"))
+        self.fps = EXPORT_SETTINGS['FPS']
+        self.audio_renderer = SessionAudioRenderer(start_sentence, end_sentence, self.settings,
+                                                   EXPORT_SETTINGS['SAMPLE_RATE'])
+
+    def export(self, output_file: Path):
+        if np is None:
+            raise RuntimeError("numpy is required for video export")
+        start = time.perf_counter()
+        data_manager = DataManager()
+        rows = data_manager.get_wrapped_range(self.start_sentence - 1, self.end_sentence)
+        subtitles = dict(enumerate(rows, self.start_sentence))
+
+        with tempfile.TemporaryDirectory() as work_dir, \
+                ProcessPoolExecutor(max_workers=self.workers, initializer=_init_export_worker,
+                                    initargs=(self.width, self.height)) as pool:
+            clip_loader = functools.partial(_prepare_export_clip, sample_rate=self.audio_renderer.sample_rate)
+            clips = self.audio_renderer.prepare_clips(pool, clip_loader)
+            audio_file = os.path.join(work_dir, "session.wav")
+            frames, total = self.audio_renderer.render(subtitles, clips, audio_file)
+            export_log.info(f"Export plan: {len(frames)} screen states, {total / 1000:.1f} s")
+
+            chunk_files = self.encode_video(pool, frames, total, work_dir)
+
+            list_file = os.path.join(work_dir, "chunks.txt")
+            with open(list_file, 'w', encoding='utf-8') as f:
+                f.writelines(f"file '{chunk}'\n" for chunk in chunk_files)
+            command = ['ffmpeg', '-y', '-v', 'error', '-f', 'concat', '-safe', '0', '-i', list_file, '-i', audio_file,
+                       '-c:v', 'copy', '-c:a', 'aac', '-b:a', '192k', '-shortest', str(output_file)]
+            subprocess.run(command, check=True, capture_output=True, text=True)
+
+        export_log.info(f"Exported {output_file} ({total / 1000:.1f} s of video) in {time.perf_counter() - start:.1f} s")
+
+    def encode_video(self, pool, frames, total, work_dir: str):
+        # 같은 화면 상태는 한 번만 그리고, 시각을 프레임 단위로 맞춘 뒤 구간별로 나눠 인코딩
+        boundaries = [round(start * self.fps / 1000) for start, _ in frames] + [round(total * self.fps / 1000)]
+        segments = [(state, boundaries[i + 1] - boundaries[i]) for i, (_, state) in enumerate(frames)
+                    if boundaries[i + 1] > boundaries[i]]
+
+        images = {}
+        for state, _ in segments:
+            if state not in images:
+                images[state] = pool.submit(_render_export_frame, state,
+                                            os.path.join(work_dir, f"state{len(images):05d}.png"))
+        images = {state: future.result() for state, future in images.items()}
+        export_log.info(f"Rendered {len(images)} screen states")
+
+        chunk_frames = EXPORT_SETTINGS['CHUNK_SECONDS'] * self.fps
+        chunks, current, current_frames = [], [], 0
+        for state, frame_count in segments:
+            current.append((images[state], frame_count))
+            current_frames += frame_count
+            if current_frames >= chunk_frames:
+                chunks.append(current)
+                current, current_frames = [], 0
+        if current:
+            chunks.append(current)
+
+        futures = []
+        for i, chunk in enumerate(chunks):
+            list_file = os.path.join(work_dir, f"chunk{i:04d}.txt")
+            with open(list_file, 'w', encoding='utf-8') as f:
+                for image_file, frame_count in chunk:
+                    f.write(f"file '{image_file}'\nduration {frame_count / self.fps:.6f}\n")
+                # concat demuxer는 마지막 항목의 duration을 쓰려면 파일을 한 번 더 적어야 함
+                f.write(f"file '{chunk[-1][0]}'\n")
+            futures.append(pool.submit(_encode_export_chunk, list_file,
+                                       os.path.join(work_dir, f"chunk{i:04d}.mp4"), self.fps))
+        chunk_files = [future.result() for future in futures]
+        export_log.info(f"Encoded {len(chunk_files)} video chunks")
+        return chunk_files
+
+
+def _precompute_tempo(source_file: str, output_file: str, speed: float, backend: str) -> bool:
+    # 프로세스 풀 작업: 원본을 배속 변환해 output_file로 저장 (재생 시와 같은 배속 변환 방식 사용)
+    if backend == "numpy" and np is not None:
+        sample_rate = TEMPO_SETTINGS['SAMPLE_RATE']
+        samples = np.ascontiguousarray(time_stretch(decode_audio(source_file, sample_rate), speed, sample_rate))
+        command = ['ffmpeg', '-y', '-v', 'error', '-f', 's16le', '-ar', str(sample_rate), '-ac', '2', '-i', '-',
+                   '-vn', output_file]
+        subprocess.run(command, input=samples.tobytes(), check=True, capture_output=True)
+        return True
+    return AudioManager.change_audio_speed(source_file, output_file, speed)
+
+
+class TempoPrecomputer:
+    # sound_ko/, sound_en/, sound_ch/의 모든 음성을 지정한 배속들로 미리 변환해 음성 캐시에 넣음
+    # 캐시 키가 원본 내용 해시를 포함하므로 이미 최신인 결과는 건너뛰고, 중단 후 다시 실행하면 남은 것만 변환
+    INDEX_SAVE_INTERVAL = 50  # 이 개수만큼 완료될 때마다 캐시 인덱스 저장
+
+    def __init__(self, speeds, languages, workers: int = None):
+        self.speeds = sorted({round(speed, 2) for speed in speeds if round(speed, 2) != 1.0})
+        self.languages = languages
+        self.workers = workers or os.cpu_count() or 1
+        self.fmt = CACHE_SETTINGS['AUDIO_CACHE_FORMAT']
+        self.cache = AudioCache(CACHE_SETTINGS['AUDIO_CACHE_DIR'], CACHE_SETTINGS['AUDIO_CACHE_MAX_MB'] * 1024 * 1024)
+
+    def source_files(self):
+        for lang in self.languages:
+            template = globals()[f"AUDIO_{AudioManager.LANGUAGE_CODES[lang]}"]
+            yield from sorted(str(path) for path in Path(".").glob(template.format("*", ext="*"))
+                              if path.suffix[1:].lower() in AUDIO_EXTENSIONS)
+
+    def pending_jobs(self):
+        # (원본, 배속, 캐시 키) 중 아직 캐시에 없는 것 (내용이 같은 원본은 한 번만 변환)
+        jobs = {}
+        for source_file in self.source_files():
+            for speed in self.speeds:
+                if self.cache.get(source_file, speed, self.fmt) is None:
+                    key = self.cache.make_key(self.cache.source_digest(source_file), speed, self.fmt)
+                    path = self.cache.cache_dir / key
+                    if path.exists():
+                        # 강제 종료로 인덱스에 기록되지 못한 완성 파일 (임시 이름에서 교체된 파일만 이 이름을 가짐)
+                        self.cache.add(key, path, save=False)
+                        continue
+                    jobs.setdefault(key, (source_file, speed, key))
+        return list(jobs.values())
+
+    def remove_stale_temp_files(self):
+        # 이전 실행이 중단되며 남긴 임시 파일 정리
+        for temp_file in self.cache.cache_dir.glob(f".*.precompute.tmp.{self.fmt}"):
+            try:
+                temp_file.unlink()
+            except OSError as e:
+                export_log.error(f"Error removing {temp_file}: {e}")
+
+    def run(self):
+        start = time.perf_counter()
+        self.remove_stale_temp_files()
+        jobs = self.pending_jobs()
+        total_files = sum(1 for _ in self.source_files()) * len(self.speeds)
+        export_log.info(f"Precompute: {total_files - len(jobs)} of {total_files} up to date, {len(jobs)} to convert "
+                        f"with {self.workers} processes")
+
+        done, failed = 0, 0
+        produced = []
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {}
+                for source_file, speed, key in jobs:
+                    temp_path = self.cache.cache_dir / f".{key}.precompute.tmp.{self.fmt}"
+                    future = pool.submit(_precompute_tempo, source_file, str(temp_path), speed,
+                                         TEMPO_SETTINGS['BACKEND'])
+                    futures[future] = (source_file, speed, key, temp_path)
+
+                for future in as_completed(futures):
+                    source_file, speed, key, temp_path = futures[future]
+                    try:
+                        if not future.result():
+                            raise RuntimeError("conversion failed")
+                        path = self.cache.cache_dir / key
+                        os.replace(temp_path, path)
+                        self.cache.add(key, path, save=False)
+                        produced.append(key)
+                    except Exception as e:
+                        failed += 1
+                        export_log.error(f"Error converting {source_file} at {speed:.2f}x: {e}")
+                    done += 1
+                    if done % self.INDEX_SAVE_INTERVAL == 0:
+                        self.cache.save()
+                    self.print_progress(done, len(jobs), start)
+        finally:
+            self.cache.save()
+            self.remove_stale_temp_files()
+            print()
+
+        evicted = sum(1 for key in produced if key not in self.cache.entries)
+        if evicted:
+            export_log.warning(f"{evicted} converted files were evicted; increase CACHE_SETTINGS['AUDIO_CACHE_MAX_MB']")
+        export_log.info(f"Precompute finished: {done - failed} converted, {failed} failed "
+                        f"in {time.perf_counter() - start:.1f} s")
+
+    @staticmethod
+    def print_progress(done: int, total: int, start: float):
+        elapsed = time.perf_counter() - start
+        remaining = elapsed / done * (total - done)
+        print(f"\r[{done}/{total}] {done * 100 // total}% 경과 {elapsed:.0f}s, 남은 시간 약 {remaining:.0f}s",
+              end="", flush=True)
+
+
+class SpeechAnalyzer:
+    # 모든 문장 음성에서 말소리의 시작/끝을 찾아 음성 폴더의 말소리 인덱스에 저장 (재생할 때 앞뒤 무음을 잘라냄)
+    # 파일의 mtime/크기가 그대로인 항목은 건너뛰므로 중단 후 다시 실행하면 남은 것만 분석
+    INDEX_SAVE_INTERVAL = 200  # 이 개수만큼 완료될 때마다 인덱스 저장
+
+    def __init__(self, languages, workers: int = None):
+        self.languages = languages
+        self.workers = workers or os.cpu_count() or 1
+        self.index = AudioFileIndex(SPEECH_INDEX_NAME, measure_speech_bounds)
+        self.manifest = AudioManifest({lang: globals()[f"AUDIO_{AudioManager.LANGUAGE_CODES[lang]}"]
+                                       for lang in languages})
+
+    def pending_files(self):
+        self.manifest.refresh()
+        files = [path for lang in self.languages for _, path in sorted(self.manifest.files[lang].items())]
+        return files, [path for path in files if self.index.lookup(path, default=AudioFileIndex.MISSING)
+                       is AudioFileIndex.MISSING]
+
+    def run(self):
+        start = time.perf_counter()
+        files, pending = self.pending_files()
+        export_log.info(f"Analyze: {len(files) - len(pending)} of {len(files)} up to date, {len(pending)} to analyze "
+                        f"with {self.workers} processes")
+
+        done, failed, silent, trimmed = 0, 0, 0, 0.0
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                # 작업을 보낼 때의 stat으로 기록해, 분석 중에 바뀐 파일은 다음 실행에서 다시 분석
+                futures = {pool.submit(measure_speech_bounds, path): (path, os.stat(path)) for path in pending}
+                for future in as_completed(futures):
+                    path, stat = futures[future]
+                    try:
+                        bounds = future.result()
+                        self.index.put(path, bounds, stat)
+                        if bounds is None:
+                            silent += 1
+                        else:
+                            trimmed += self.duration(path) - (bounds[1] - bounds[0])
+                    except Exception as e:
+                        failed += 1
+                        export_log.error(f"Error analyzing {path}: {e}")
+                    done += 1
+                    if done % self.INDEX_SAVE_INTERVAL == 0:
+                        self.index.save()
+                    TempoPrecomputer.print_progress(done, len(pending), start)
+        finally:
+            self.index.save()
+            print()
+
+        export_log.info(f"Analyze finished: {done - failed} analyzed ({silent} silent), {failed} failed, "
+                        f"{trimmed:.1f} s of silence trimmed in {time.perf_counter() - start:.1f} s")
+
+    @staticmethod
+    def duration(path: str) -> float:
+        try:
+            return AudioManager.measure_audio_length(path)
+        except Exception:
+            return 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=app_title)
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser("export", help="화면 없이 start..end 범위의 세션을 MP4로 내보내기")
+    export_parser.add_argument("start", type=int, help="시작 문장 번호")
+    export_parser.add_argument("end", type=int, help="끝 문장 번호")
+    export_parser.add_argument("output", type=Path, help="저장할 MP4 파일")
+    export_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수")
+
+    precompute_parser = subparsers.add_parser("precompute", help="모든 음성의 배속 변환 결과를 미리 만들어 캐시에 저장")
+    precompute_parser.add_argument("--speeds", type=float, nargs="+",
+                                   help="배속 목록 (기본값: 설정 파일의 한국어/영어/중국어 배속)")
+    precompute_parser.add_argument("--languages", nargs="+", choices=DataManager.COLUMNS, default=DataManager.COLUMNS,
+                                   help="변환할 언어")
+    precompute_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수")
+
+    analyze_parser = subparsers.add_parser("analyze", help="모든 음성의 말소리 시작/끝을 찾아 앞뒤 무음 잘라내기 인덱스 저장")
+    analyze_parser.add_argument("--languages", nargs="+", choices=DataManager.COLUMNS, default=DataManager.COLUMNS,
+                                help="분석할 언어")
+    analyze_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수")
+
+    args = parser.parse_args(argv)
+    setup_logging()
+    if args.command == "export":
+        VideoExporter(args.start, args.end, read_settings_file(), args.workers).export(args.output)
+        return
+    if args.command == "precompute":
+        speeds = args.speeds or SessionSettings(read_settings_file()).speeds.values()
+        TempoPrecomputer(speeds, args.languages, args.workers).run()
+        return
+    if args.command == "analyze":
+        SpeechAnalyzer(args.languages, args.workers).run()
+        return
+
+    startup_timer = StartupTimer(IMPORT_START)
+    startup_timer.record("import", IMPORT_START)
+    app_log.info("Application starting")
+    with startup_timer.measure("widgets"):
+        app = ConversationApp(startup_timer)
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
-    logging.info("Entering main loop")
+    app_log.info("Entering main loop")
     app.mainloop()
-    logging.info("Application closed")
+    app_log.info("Application closed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+import wave
+from pathlib import Path
+
+import basic
+
+# 합성 데이터 설정
+BENCHMARK_SETTINGS = {
+    'SIZES': [100, 1000, 10000],
+    'REPEAT': 5,
+    'SAMPLE_RATE': 8000,  # 길이 계산은 헤더만 읽으므로 작은 파일로 충분
+    'MIN_SECONDS': 0.5,
+    'MAX_SECONDS': 3.0,
+    'SESSION_LENGTH': 100,  # prepare_subtitles 한 번에 준비하는 문장 수
+    'SPEED_SAMPLES': 5,  # 배속 변환을 측정할 파일 수
+    'SPEED': 2.0,
+    'SEED': 1001,
+}
+
+KOREAN_WORDS = ["나는", "오늘", "학교에", "친구와", "함께", "갔다", "그는", "매일", "아침에", "커피를", "마신다", "우리는",
+                "도서관에서", "책을", "읽었다", "내일은", "비가", "올", "것", "같다", "정말", "중요한", "문제를", "해결했다"]
+ENGLISH_WORDS = ["I", "went", "to", "school", "with", "my", "friend", "today", "he", "drinks", "coffee", "every",
+                 "morning", "we", "read", "a", "book", "in", "the", "library", "it", "will", "rain", "tomorrow",
+                 "finally", "solved", "an", "important", "problem", "although", "nobody", "expected", "that"]
+CHINESE_CHARS = "我今天和朋友一起去学校他每天早上喝咖啡我们在图书馆看书明天会下雨终于解决了重要的问题"
+
+
+def make_sentence(rng, words, low, high, separator=" "):
+    return separator.join(rng.choice(words) for _ in range(rng.randint(low, high)))
+
+
+def generate_workbook(path: Path, size: int, rng):
+    # DataManager가 읽는 형식 그대로: 머리글 없이 한국어/영어/중국어 3열
+    import pandas as pd
+
+    rows = [(make_sentence(rng, KOREAN_WORDS, 3, 14),
+             make_sentence(rng, ENGLISH_WORDS, 4, 30).capitalize() + ".",
+             "".join(rng.choice(CHINESE_CHARS) for _ in range(rng.randint(5, 25))) + "。")
+            for _ in range(size)]
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+
+
+def generate_wav_library(root: Path, size: int, rng):
+    # 모든 언어의 문장 음성 (길이는 임의, 내용은 무음)
+    sample_rate = BENCHMARK_SETTINGS['SAMPLE_RATE']
+    for template in (basic.AUDIO_KO, basic.AUDIO_EN, basic.AUDIO_CH):
+        (root / Path(template).parent).mkdir(parents=True, exist_ok=True)
+        for sentence in range(1, size + 1):
+            seconds = rng.uniform(BENCHMARK_SETTINGS['MIN_SECONDS'], BENCHMARK_SETTINGS['MAX_SECONDS'])
+            with wave.open(str(root / template.format(sentence, ext="wav")), 'wb') as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(sample_rate)
+                f.writeframes(bytes(int(seconds * sample_rate) * 2))
+
+
+def generate_library(root: Path, size: int):
+    # 크기별로 한 번만 만들고 다시 실행할 때는 재사용
+    marker = root / ".generated"
+    if marker.exists():
+        return
+    rng = random.Random(BENCHMARK_SETTINGS['SEED'] + size)
+    root.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    generate_workbook(root / basic.EXCEL_FILE, size, rng)
+    generate_wav_library(root, size, rng)
+    marker.touch()
+    print(f"Generated {size} sentences in {root} ({time.perf_counter() - start:.1f} s)")
+
+
+def measure(func, repeat: int, setup=None):
+    # setup은 매 반복 전에 실행 (측정 시간에서 제외), 첫 실행은 모듈 import 등이 섞이므로 버림
+    times = []
+    for i in range(repeat + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        if i > 0:
+            times.append(time.perf_counter() - start)
+    return times
+
+
+class BenchmarkRunner:
+    def __init__(self, work_dir: Path, repeat: int, with_ffmpeg: bool):
+        self.work_dir = work_dir
+        self.repeat = repeat
+        self.with_ffmpeg = with_ffmpeg
+        self.results = []
+
+    def record(self, size: int, name: str, times, operations: int = 1):
+        median = statistics.median(times)
+        result = {
+            'size': size,
+            'name': name,
+            'operations': operations,
+            'repeat': len(times),
+            'min_s': min(times),
+            'median_s': median,
+            'mean_s': statistics.fmean(times),
+            'per_op_us': median / operations * 1e6,
+        }
+        self.results.append(result)
+        print(f"{size:>6} {name:<28} median {median * 1000:10.3f} ms  ({result['per_op_us']:10.2f} us/op)")
+
+    def run(self, sizes):
+        original_dir = os.getcwd()
+        for size in sizes:
+            root = self.work_dir / f"corpus_{size}"
+            generate_library(root, size)
+            os.chdir(root)
+            try:
+                self.run_size(size, root)
+            finally:
+                os.chdir(original_dir)
+        return self.results
+
+    def run_size(self, size: int, root: Path):
+        # 캐시는 작업 폴더 안에 두어 사용자의 캐시를 건드리지 않음
+        cache_dir = root / "cache"
+        basic.CACHE_SETTINGS['CORPUS_DIR'] = cache_dir / "corpus"
+        basic.CACHE_SETTINGS['AUDIO_CACHE_DIR'] = cache_dir / "audio"
+        rng = random.Random(BENCHMARK_SETTINGS['SEED'])
+
+        def clear_corpus_cache():
+            shutil.rmtree(basic.CACHE_SETTINGS['CORPUS_DIR'], ignore_errors=True)
+
+        # DataManager: 엑셀 변환(처음 실행) / 변환된 파일 열기(이후 실행) / 변환 없이 범위만 스트리밍
+        self.record(size, "data_load_cold", measure(lambda: basic.DataManager("corpus"), self.repeat,
+                                                    clear_corpus_cache))
+        self.record(size, "data_load_warm", measure(lambda: basic.DataManager("corpus"), self.repeat))
+        window_start = size // 2
+
+        def load_window():
+            basic.DataManager("window").get_range(window_start, window_start + 20)
+
+        self.record(size, "data_load_window", measure(load_window, self.repeat))
+        data_manager = basic.DataManager("corpus")
+
+        indices = [rng.randrange(size) for _ in range(1000)]
+        self.record(size, "get_sentence", measure(lambda: [data_manager.get_sentence(i) for i in indices],
+                                                  self.repeat), len(indices))
+
+        # prepare_subtitles: 줄바꿈 표를 처음 만드는 경우와 만들어진 표에서 조회하는 경우
+        app = types.SimpleNamespace(data_manager=data_manager, prepared_subtitles={})
+        session_start = max(1, size // 2)
+        session_end = min(size, session_start + BENCHMARK_SETTINGS['SESSION_LENGTH'] - 1)
+
+        def prepare_session():
+            basic.ConversationApp.prepare_subtitles(app, session_start, session_end)
+
+        def clear_wrap_table():
+            data_manager.wrap_table = None
+            data_manager.corpus_file().with_suffix(".wrap").unlink(missing_ok=True)
+
+        self.record(size, "prepare_subtitles_cold", measure(prepare_session, self.repeat, clear_wrap_table))
+        self.record(size, "prepare_subtitles_warm", measure(prepare_session, self.repeat),
+                    session_end - session_start + 1)
+        self.record(size, "prepare_subtitles_full_book",
+                    measure(lambda: basic.ConversationApp.prepare_subtitles(app, 1, size), self.repeat), size)
+
+        rows = data_manager.get_range(0, size)
+        self.record(size, "split_korean_text",
+                    measure(lambda: [basic.ConversationApp.split_korean_text(row.한국어) for row in rows],
+                            self.repeat), size)
+        self.record(size, "split_english_text",
+                    measure(lambda: [basic.ConversationApp.split_english_text(row.영어) for row in rows],
+                            self.repeat), size)
+
+        # get_audio_length: 헤더를 읽는 경우(길이 인덱스 없음)와 인덱스에서 찾는 경우
+        audio_manager = basic.AudioManager()
+
+        def lengths():
+            return [audio_manager.get_audio_length(n, "영어") for n in range(1, size + 1)]
+
+        def clear_duration_index():
+            audio_manager.duration_index = basic.AudioFileIndex(basic.DURATION_INDEX_NAME,
+                                                                audio_manager.measure_audio_length)
+            (Path(basic.AUDIO_EN).parent / basic.DURATION_INDEX_NAME).unlink(missing_ok=True)
+
+        self.record(size, "get_audio_length_cold", measure(lengths, self.repeat, clear_duration_index), size)
+        self.record(size, "get_audio_length_warm", measure(lengths, self.repeat), size)
+
+        self.run_speed_change(size)
+
+    def run_speed_change(self, size: int):
+        # 배속 변환: 재생 시 기본인 NumPy WSOLA와 ffmpeg(change_audio_speed)
+        speed = BENCHMARK_SETTINGS['SPEED']
+        files = [basic.find_audio_file(basic.AUDIO_EN, n)
+                 for n in range(1, min(size, BENCHMARK_SETTINGS['SPEED_SAMPLES']) + 1)]
+
+        if basic.np is not None:
+            clips = []
+            for file_path in files:
+                with wave.open(file_path, 'rb') as f:
+                    clips.append(basic.np.frombuffer(f.readframes(f.getnframes()), dtype=basic.np.int16)
+                                 .reshape(-1, 1))
+            sample_rate = BENCHMARK_SETTINGS['SAMPLE_RATE']
+            self.record(size, "time_stretch",
+                        measure(lambda: [basic.time_stretch(clip, speed, sample_rate) for clip in clips],
+                                self.repeat), len(clips))
+            self.record(size, "find_speech_bounds",
+                        measure(lambda: [basic.find_speech_bounds(clip, sample_rate) for clip in clips],
+                                self.repeat), len(clips))
+
+        if not self.with_ffmpeg:
+            return
+        with tempfile.TemporaryDirectory() as output_dir:
+            def change_speeds():
+                for i, file_path in enumerate(files):
+                    output_file = os.path.join(output_dir, f"{i}.mp3")
+                    if os.path.exists(output_file):
+                        os.remove(output_file)
+                    basic.AudioManager.change_audio_speed(file_path, output_file, speed)
+
+            self.record(size, "change_audio_speed", measure(change_speeds, self.repeat), len(files))
+
+
+def environment_info() -> dict:
+    info = {
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': getattr(basic.np, "__version__", None) if basic.np is not None else None,
+    }
+    try:
+        info['git_commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                            cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info['git_commit'] = None
+    return info
+
+
+def load_baseline(baseline_file: Path) -> dict:
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        return {(result['size'], result['name']): result for result in json.load(f)['results']}
+
+
+def compare(results, baseline: dict, baseline_file: Path):
+    # 이전 결과와 중앙값 비교 (1보다 크면 느려짐)
+    print(f"\nCompared with {baseline_file} (ratio > 1 means slower)")
+    for result in results:
+        previous = baseline.get((result['size'], result['name']))
+        if previous and previous['median_s'] > 0:
+            print(f"{result['size']:>6} {result['name']:<28} {result['median_s'] / previous['median_s']:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="basic.py 비GUI 경로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_SETTINGS['SIZES'], help="문장 수")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_SETTINGS['REPEAT'], help="측정 반복 횟수")
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "basic_benchmark",
+                        help="합성 엑셀/음성 파일을 만들 폴더 (다시 실행하면 재사용)")
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"), help="JSON 결과 파일")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 JSON 결과 파일")
+    parser.add_argument("--no-ffmpeg", action="store_true", help="ffmpeg 배속 변환 측정 생략")
+    args = parser.parse_args(argv)
+    # 측정 중 basic.py의 INFO 로그는 출력하지 않음
+    basic.logging.getLogger().setLevel(basic.logging.WARNING)
+    baseline = load_baseline(args.compare) if args.compare else None
+
+    with_ffmpeg = not args.no_ffmpeg and shutil.which("ffmpeg") is not None
+    if not args.no_ffmpeg and not with_ffmpeg:
+        print("ffmpeg not found, skipping change_audio_speed")
+
+    output_file = args.output.resolve()
+    runner = BenchmarkRunner(args.work_dir.resolve(), args.repeat, with_ffmpeg)
+    results = runner.run(args.sizes)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment_info(), 'settings': BENCHMARK_SETTINGS, 'results': results}, f,
+                  ensure_ascii=False, indent=2)
+    print(f"Results written to {output_file}")
+
+    if baseline is not None:
+        compare(results, baseline, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# basic.py는 패키지가 아닌 단일 모듈이므로 저장소 루트를 import 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
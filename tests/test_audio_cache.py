@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from basic import AudioCache
+
+
+def make_source(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(bytes([len(name)]) * size)
+    return str(path)
+
+
+def write_output(size):
+    def producer(source_file, output_file):
+        Path(output_file).write_bytes(b"\0" * size)
+        return True
+    return producer
+
+
+def test_entry_larger_than_cache_is_returned(tmp_path):
+    cache = AudioCache(tmp_path / "cache", max_bytes=100)
+    source = make_source(tmp_path, "a.wav", 10)
+    cached = cache.get_or_create(source, 2.0, "wav", write_output(500))
+    assert cached is not None and Path(cached).exists()
+
+
+def test_new_entry_survives_eviction_with_tied_timestamps(tmp_path, monkeypatch):
+    monkeypatch.setattr("basic.time.time", lambda: 1000.0)
+    cache = AudioCache(tmp_path / "cache", max_bytes=150)
+    first = cache.get_or_create(make_source(tmp_path, "a.wav", 10), 2.0, "wav", write_output(100))
+    second = cache.get_or_create(make_source(tmp_path, "bb.wav", 10), 2.0, "wav", write_output(100))
+    assert Path(second).exists()
+    assert not Path(first).exists()
+    assert len(cache.entries) == 1
@@ -0,0 +1,38 @@
+from basic import FontFitSolver
+
+
+class FixedWidthFont:
+    # 글자당 고정 폭을 돌려주는 tkinter.font 대용
+    def __init__(self, char_width):
+        self.char_width = char_width
+
+    def measure(self, text):
+        return self.char_width * len(text)
+
+
+def test_unspaced_cjk_text_breaks_by_character():
+    text = "我们今天下午去图书馆看书然后一起去吃晚饭好不好"
+    assert len(text) == 23
+    lines = FontFitSolver.wrap_lines(text, FixedWidthFont(55), 970)
+    assert lines == [text[:17], text[17:]]
+    assert all(len(line) * 55 <= 970 for line in lines)
+
+
+def test_spaced_text_breaks_at_words():
+    lines = FontFitSolver.wrap_lines("aaa bbb ccc", FixedWidthFont(10), 75)
+    assert lines == ["aaa bbb", "ccc"]
+
+
+def test_oversized_word_between_short_words():
+    lines = FontFitSolver.wrap_lines("hi abcdefghij ok", FixedWidthFont(10), 40)
+    assert lines == ["hi", "abcd", "efgh", "ij", "ok"]
+
+
+def test_narrower_than_one_character_keeps_one_per_line():
+    assert FontFitSolver.wrap_lines("你好", FixedWidthFont(55), 10) == ["你", "好"]
+
+
+def test_paragraphs_and_disabled_wrapping():
+    font = FixedWidthFont(10)
+    assert FontFitSolver.wrap_lines("ab\ncd", font, 100) == ["ab", "cd"]
+    assert FontFitSolver.wrap_lines("abcdef", font, 0) == ["abcdef"]
@@ -0,0 +1,21 @@
+import logging
+import types
+
+import basic
+from basic import ConversationApp
+
+
+def test_session_summary_reaches_the_log(monkeypatch, caplog):
+    # setup_logging과 같은 로거별 수준에서 세션 요약이 기록되어야 함 (basic.playback은 WARNING)
+    for name, level in basic.LOG_SETTINGS['LEVELS'].items():
+        monkeypatch.setattr(logging.getLogger(name), "level", level)
+    app = types.SimpleNamespace(
+        audio_manager=types.SimpleNamespace(prefetcher=types.SimpleNamespace(cancel=lambda: None)),
+        telemetry=types.SimpleNamespace(summary=lambda: "Session timing: 3 sentences"),
+        show_screen=lambda screen: None, update=lambda: None,
+        final_countdown_label=types.SimpleNamespace(config=lambda **options: None),
+        timeline=types.SimpleNamespace(schedule=lambda *args: None),
+        GENERAL_SETTINGS=ConversationApp.GENERAL_SETTINGS)
+    with caplog.at_level(logging.NOTSET):
+        ConversationApp.show_final_message(app, play_sound=False)
+    assert "Session timing: 3 sentences" in [record.getMessage() for record in caplog.records]
@@ -0,0 +1,45 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+import basic
+from basic import read_mp3_duration
+
+# MPEG1 레이어 III, 128kbps, 44.1kHz, 스테레오, 패딩 없음 -> 프레임당 417바이트, 1152샘플
+FRAME_HEADER = bytes.fromhex("fffb9000")
+FRAME_SIZE = 417
+ID3_TAG = b"ID3\x04\x00\x00\x00\x00\x01\x00" + b"\0" * 128  # 본문 128바이트
+
+
+def frames(count):
+    return (FRAME_HEADER + b"\0" * (FRAME_SIZE - 4)) * count
+
+
+def test_cbr_duration_from_bitrate(tmp_path):
+    path = tmp_path / "cbr.mp3"
+    path.write_bytes(ID3_TAG + frames(100) + b"TAG" + b"\0" * 125)
+    assert read_mp3_duration(str(path)) == pytest.approx(100 * FRAME_SIZE * 8 / 128000)
+
+
+def test_vbr_duration_from_xing_frame_count(tmp_path):
+    # 첫 프레임의 사이드 정보(32바이트) 뒤 Xing 헤더: 프레임 수 플래그 + 프레임 수
+    xing = FRAME_HEADER + b"\0" * 32 + b"Xing" + struct.pack('>II', 1, 2000)
+    path = tmp_path / "vbr.mp3"
+    path.write_bytes(xing + b"\0" * (FRAME_SIZE - len(xing)) + frames(10))
+    assert read_mp3_duration(str(path)) == pytest.approx(2000 * 1152 / 44100)
+
+
+def test_not_an_mp3(tmp_path):
+    path = tmp_path / "bad.mp3"
+    path.write_bytes(b"RIFF" + b"\0" * 100)
+    with pytest.raises(ValueError):
+        read_mp3_duration(str(path))
+
+
+def test_real_mp3_matches_decoded_length():
+    pygame = pytest.importorskip("pygame")
+    example = Path(pygame.__file__).parent / "examples" / "data" / "house_lo.mp3"
+    if not example.exists():
+        pytest.skip("pygame example data not installed")
+    assert basic.AudioManager.measure_audio_length(str(example)) == pytest.approx(7.262, abs=0.01)
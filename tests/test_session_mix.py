@@ -0,0 +1,52 @@
+import io
+import wave
+
+import numpy as np
+
+import basic
+from basic import SessionAudioRenderer
+
+SAMPLE_RATE = 1000  # 1 샘플 = 1ms
+
+
+def reference_mix(clips, audio, total):
+    # 세션 전체를 한 버퍼에 섞는 단순 구현
+    buffer = np.zeros((int(total) + 1, 2), dtype=np.float32)
+    for start, key in audio:
+        segment = clips[key][:max(0, len(buffer) - start)]
+        buffer[start:start + len(segment)] += segment
+    return np.clip(buffer, -32768, 32767).astype(np.int16)
+
+
+def make_renderer():
+    return SessionAudioRenderer(1, 1, None, SAMPLE_RATE)
+
+
+def test_chunked_mix_matches_whole_buffer(monkeypatch):
+    monkeypatch.setitem(basic.EXPORT_SETTINGS, 'MIX_CHUNK_SECONDS', 0.1)  # 100 샘플 단위
+    rng = np.random.default_rng(0)
+    clips = {key: rng.integers(-20000, 20000, size=(length, 2)).astype(np.int16)
+             for key, length in [("a", 250), ("b", 40), ("c", 400)]}
+    # 블록 경계를 걸치는 음성, 겹치는 음성(클리핑), 세션 끝을 넘는 음성
+    audio = [(0, "a"), (95, "b"), (120, "a"), (380, "c"), (90, "b")]
+    total = 600
+
+    blocks = list(make_renderer().mix(clips, audio, total))
+    assert max(len(block) for block in blocks) == 100
+    np.testing.assert_array_equal(np.concatenate(blocks), reference_mix(clips, audio, total))
+
+
+def test_missing_clips_are_skipped():
+    clips = {"a": np.full((10, 2), 100, dtype=np.int16)}
+    mixed = np.concatenate(list(make_renderer().mix(clips, [(0, "a"), (5, "missing")], 20)))
+    assert mixed.shape == (21, 2)
+    assert mixed[:10].tolist() == [[100, 100]] * 10 and not mixed[10:].any()
+
+
+def test_write_wav_streams_blocks():
+    renderer = make_renderer()
+    output = io.BytesIO()
+    renderer.write_wav([np.ones((3, 2), dtype=np.int16), np.ones((4, 2), dtype=np.int16)], output)
+    output.seek(0)
+    with wave.open(output, 'rb') as f:
+        assert (f.getnframes(), f.getnchannels(), f.getframerate()) == (7, 2, SAMPLE_RATE)
@@ -0,0 +1,33 @@
+import types
+
+from basic import ConversationApp, SessionSettings
+
+
+class Value:
+    # tk.Variable 대용
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def make_app(**values):
+    names = ["start_sentence", "end_sentence", "korean_audio_speed", "english_audio_speed", "audio_speed",
+             "korean_subtitle_delay", "english_subtitle_delay", "english_audio_delay", "next_sentence_delay",
+             "show_english_chinese_simultaneously", "initial_korean_speed", "initial_english_speed",
+             "premixed_session"]
+    app = types.SimpleNamespace(**{name: Value(values.get(name, 1)) for name in names})
+    app.korean_subtitle_entry = app.english_subtitle_entry = app.english_audio_entry = app.next_sentence_entry = None
+    app.language_vars = app.audio_vars = {lang: Value(True) for lang in ["한국어", "영어", "중국어"]}
+    return app
+
+
+def test_chosen_chinese_speed_reaches_exports():
+    settings = ConversationApp.current_settings(make_app(audio_speed=1.5))
+    assert settings['audio_speed'] == 1.5
+    assert SessionSettings(settings).speeds["중국어"] == 1.5
+
+
+def test_missing_audio_speed_defaults_to_2x():
+    assert SessionSettings({}).speeds["중국어"] == 2.0
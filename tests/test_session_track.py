@@ -0,0 +1,40 @@
+import types
+
+import pygame
+
+from basic import ConversationApp
+
+
+def test_session_track_falls_back_when_mixer_is_not_initialized(monkeypatch):
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+    # 믹서가 없으면 화면/렌더러를 건드리기 전에 False를 반환해야 함
+    app = types.SimpleNamespace()
+    assert ConversationApp.start_session_track(app, 1, 10) is False
+    assert vars(app) == {}
+
+
+def test_final_state_hands_off_to_show_final_message():
+    calls = []
+    app = types.SimpleNamespace(
+        audio_manager=types.SimpleNamespace(track_position=lambda: 5000),
+        session_total=9000, session_frame_index=0,
+        session_frames=[(0, ("countdown", "3", "")), (4000, ("final", "5")), (5000, ("final", "4"))],
+        apply_session_state=lambda state: calls.append(("apply", state)),
+        show_final_message=lambda play_sound=True: calls.append(("final", play_sound)),
+        timeline=types.SimpleNamespace(schedule=lambda *args: calls.append("schedule")))
+    ConversationApp._sync_session_track(app)
+    assert calls == [("final", False)]
+
+
+def test_track_in_progress_keeps_polling():
+    calls = []
+    app = types.SimpleNamespace(
+        audio_manager=types.SimpleNamespace(track_position=lambda: 1000),
+        session_total=9000, session_frame_index=0,
+        session_frames=[(0, ("countdown", "3", "")), (4000, ("final", "5"))],
+        apply_session_state=lambda state: calls.append(("apply", state[0])),
+        show_final_message=lambda play_sound=True: calls.append("final"),
+        timeline=types.SimpleNamespace(schedule=lambda delay, callback: calls.append("schedule")),
+        _sync_session_track=None)
+    ConversationApp._sync_session_track(app)
+    assert calls == [("apply", "countdown"), "schedule"]
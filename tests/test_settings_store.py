@@ -0,0 +1,44 @@
+import json
+import threading
+import time
+
+from basic import SettingsStore
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def writer_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "settings-writer"]
+
+
+def test_many_saves_use_one_writer_and_keep_the_last(tmp_path):
+    before = len(writer_threads())
+    store = SettingsStore(tmp_path / "settings.json", delay_ms=50)
+    for value in range(100):
+        store.save({'speed': value})
+    assert len(writer_threads()) == before + 1
+    deadline = time.monotonic() + 5
+    while not (tmp_path / "settings.json").exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read(tmp_path / "settings.json") == {'speed': 99}
+
+
+def test_flush_writes_the_newest_settings(tmp_path):
+    store = SettingsStore(tmp_path / "settings.json", delay_ms=60_000)
+    store.save({'speed': 1})
+    store.save({'speed': 2})
+    store.flush()
+    assert read(tmp_path / "settings.json") == {'speed': 2}
+    store.flush()  # 기록할 변경이 없으면 그대로
+    assert read(tmp_path / "settings.json") == {'speed': 2}
+
+
+def test_replace_drops_pending_changes(tmp_path):
+    store = SettingsStore(tmp_path / "settings.json", delay_ms=60_000)
+    store.save({'speed': 1})
+    store.replace({'speed': 3})
+    store.flush()
+    assert read(tmp_path / "settings.json") == {'speed': 3}
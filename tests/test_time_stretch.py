@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from basic import time_stretch
+
+SAMPLE_RATE = 44100
+
+
+@pytest.mark.parametrize("speed", [0.5, 1.5, 2.0, 3.0])
+def test_short_clip_is_not_padded_to_a_frame(speed):
+    samples = (np.sin(np.arange(100) / 5) * 10000).astype(np.int16)
+    stretched = time_stretch(samples, speed, SAMPLE_RATE)
+    assert len(stretched) == round(100 / speed)
+    assert stretched.dtype == np.int16
+
+
+def test_short_stereo_clip_keeps_channels():
+    samples = np.zeros((100, 2), dtype=np.int16)
+    stretched = time_stretch(samples, 2.0, SAMPLE_RATE)
+    assert stretched.shape == (50, 2)
+
+
+@pytest.mark.parametrize("length", [SAMPLE_RATE, 10000, 1500])
+@pytest.mark.parametrize("speed", [0.75, 1.1, 1.2, 1.3, 1.5, 1.7, 2.0, 2.5, 3.0])
+def test_output_length_matches_speed(length, speed):
+    samples = (np.sin(2 * np.pi * 220 * np.arange(length) / SAMPLE_RATE) * 10000).astype(np.int16)
+    stretched = time_stretch(np.stack([samples, samples], axis=1), speed, SAMPLE_RATE)
+    assert stretched.shape == (round(length / speed), 2)
+
+
+@pytest.mark.parametrize("speed", [0.75, 1.1, 1.3, 2.5])
+def test_end_of_clip_is_kept(speed):
+    # 일정한 크기의 음이 끝까지 이어져야 함 (마지막 프레임이 잘리면 끝부분이 조용해짐)
+    samples = (np.sin(2 * np.pi * 220 * np.arange(SAMPLE_RATE) / SAMPLE_RATE) * 10000).astype(np.int16)
+    stretched = time_stretch(samples, speed, SAMPLE_RATE).astype(np.float32)
+    tail = stretched[-len(stretched) // 20:]
+    middle = stretched[len(stretched) // 2:len(stretched) // 2 + len(tail)]
+    assert np.sqrt(np.mean(tail ** 2)) > 0.5 * np.sqrt(np.mean(middle ** 2))
+
+
+def test_single_sample():
+    assert len(time_stretch(np.array([1000], dtype=np.int16), 2.0, SAMPLE_RATE)) == 1
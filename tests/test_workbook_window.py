@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("openpyxl")
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+from basic import EMPTY_SENTENCE, DataManager, Sentence, WorkbookWindow
+
+SENTENCE_COUNT = 30
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    # 문장 30개 뒤에 서식만 남은 빈 행 10개 (시트 크기 정보에는 40행으로 기록됨)
+    workbook = Workbook()
+    sheet = workbook.active
+    for number in range(1, SENTENCE_COUNT + 1):
+        sheet.append([f"한국어 {number}", f"English {number}", f"中文 {number}"])
+    for row in range(SENTENCE_COUNT + 1, SENTENCE_COUNT + 11):
+        sheet.cell(row=row, column=1).font = Font(bold=True)
+    path = tmp_path / "sentences.xlsx"
+    workbook.save(path)
+    return path
+
+
+def open_window(path, lookahead=5):
+    return WorkbookWindow(path, len(DataManager.COLUMNS), "key", lookahead)
+
+
+def test_trailing_empty_rows_end_the_data(workbook_path):
+    window = open_window(workbook_path)
+    assert window.get_range(0, 25, 40) == [f"한국어 {number}" for number in range(26, 31)]
+    assert len(window) == SENTENCE_COUNT
+    assert window.get(1, 35) == ""
+
+
+def test_read_rows_pads_like_compiled_corpus(workbook_path):
+    data_manager = DataManager.__new__(DataManager)
+    data_manager.corpus = open_window(workbook_path)
+    rows = data_manager.get_range(28, 32)
+    assert rows == [Sentence("한국어 29", "English 29", "中文 29"), Sentence("한국어 30", "English 30", "中文 30"),
+                    EMPTY_SENTENCE, EMPTY_SENTENCE]
+    assert len(data_manager) == SENTENCE_COUNT
+
+
+def test_reading_before_the_tail_keeps_rows(workbook_path):
+    window = open_window(workbook_path)
+    assert window.get_range(2, 0, 3) == ["中文 1", "中文 2", "中文 3"]
+    assert window.get(0, 29) == "한국어 30"